@@ -0,0 +1,357 @@
+# asset_bake.py
+"""
+Offline-Vorbereitung der Bilder ("Backen"):
+PNGs aus assets/Rooms und assets/People/* werden für die gewünschten
+Fenstergrößen vorskaliert und als unkomprimierte Rohdaten abgelegt. Zur
+Laufzeit entfallen damit Dekodieren und smoothscale – das Laden ist nur
+noch ein read() plus frombuffer().
+
+    python asset_bake.py                        # Standard: 1280x720
+    python asset_bake.py --size 1280x720 --size 1920x1080
+    python asset_bake.py --force                # alles neu backen
+
+Ausgabe (assets/baked/):
+    manifest.json
+    raeume/<raum>_<B>x<H>.raw
+    portraits/<Ordner>/<Ausdruck>_<B>x<H>.raw
+    atlas/portraits_<B>x<H>_<n>.raw    (alle Portraits zusammengepackt, siehe portrait_atlas.py)
+
+Manifest: logische Namen -> Dateien (relativ zum Manifest):
+    {"version": 1,
+     "raeume":    {"technik": {"920x520": "raeume/technik_920x520.raw"}},
+     "portraits": {"Holger": {"Neutral": {"420x420": "portraits/Holger/Neutral_420x420.raw"}}},
+     "aliase":    {"Flo": "Florian"},
+     "atlas":     {"420x420": {"seiten": ["atlas/portraits_420x420_0.raw"],
+                               "bilder": {"Holger": {"Neutral": [seite, x, y, b, h]}}}},
+     "quellen":   {"Rooms/technik.png": [mtime_ns, bytes]}}
+
+Nicht lesbare Quellbilder werden übersprungen; die Laufzeit fällt dann wie
+bisher auf das Original bzw. den Fallback zurück.
+"""
+import argparse
+import json
+import os
+import re
+import struct
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import pygame
+
+ASSETS_ROOT = os.path.join(os.path.dirname(__file__), "../assets")
+BAKED_DIR = os.path.join(ASSETS_ROOT, "baked")
+MANIFEST = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Muss zu GameApp passen: Raumbild = Fenster minus Seitenleiste/Log
+ROOM_MARGIN = (360, 200)
+PORTRAIT_SIZE = (420, 420)
+DEFAULT_WINDOW_SIZES = [(1280, 720)]
+
+# Kopf jeder Rohdatei: Magic, Breite, Höhe, Pixelformat ("RGB\0" / "RGBA")
+RAW_MAGIC = b"TTXR"
+_HEADER = struct.Struct("<4sHH4s")
+RAW_EXT = ".raw"
+
+# holgerNeutral.png -> ("holger", "Neutral")
+_PORTRAIT_NAME = re.compile(r"^([a-zäöüß]+)([A-ZÄÖÜ]\w*)$")
+
+
+def room_size_for(window_size: Tuple[int, int]) -> Tuple[int, int]:
+    return (window_size[0] - ROOM_MARGIN[0], window_size[1] - ROOM_MARGIN[1])
+
+
+def size_key(size: Tuple[int, int]) -> str:
+    return f"{size[0]}x{size[1]}"
+
+
+def scale_to_fit(surface: pygame.Surface, target: Tuple[int, int]) -> pygame.Surface:
+    tw, th = target
+    sw, sh = surface.get_width(), surface.get_height()
+    if sw == 0 or sh == 0:
+        return pygame.transform.smoothscale(surface, target)
+    scale = min(tw / sw, th / sh)
+    nw, nh = max(1, int(sw * scale)), max(1, int(sh * scale))
+    return pygame.transform.smoothscale(surface, (nw, nh))
+
+
+# ---------------------------------------------------------------------- Rohdateien
+
+def raw_schreiben(pfad: str, surface: pygame.Surface, alpha: bool):
+    fmt = "RGBA" if alpha else "RGB"
+    w, h = surface.get_size()
+    os.makedirs(os.path.dirname(pfad), exist_ok=True)
+    with open(pfad, "wb") as f:
+        f.write(_HEADER.pack(RAW_MAGIC, w, h, fmt.encode("ascii").ljust(4, b"\0")))
+        f.write(pygame.image.tostring(surface, fmt))
+
+
+def raw_laden(pfad: str) -> Optional[pygame.Surface]:
+    """Rohdatei als (nicht konvertierte) Surface – darf auch im Worker-Thread laufen."""
+    try:
+        with open(pfad, "rb") as f:
+            data = f.read()
+        magic, w, h, fmt = _HEADER.unpack_from(data)
+        if magic != RAW_MAGIC:
+            return None
+        return pygame.image.frombuffer(data[_HEADER.size:], (w, h), fmt.rstrip(b"\0").decode("ascii"))
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+# ---------------------------------------------------------------------- Quellen & Packen
+
+def portrait_quellen(assets_root: str = ASSETS_ROOT) -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
+    """
+    Portraits unter People/<Ordner>/<praefix><Ausdruck>.png finden (ohne sie zu laden).
+    Gibt ({Ordner: {Ausdruck: Pfad}}, {Kurzname: Ordner}) zurück; der Kurzname
+    kommt aus dem Dateipräfix (Florian/floNeutral.png -> "Flo").
+    """
+    quellen: Dict[str, Dict[str, str]] = {}
+    aliase: Dict[str, str] = {}
+    people_dir = os.path.join(assets_root, "People")
+    for person in sorted(os.listdir(people_dir)) if os.path.isdir(people_dir) else []:
+        person_dir = os.path.join(people_dir, person)
+        if not os.path.isdir(person_dir):
+            continue
+        for datei in sorted(os.listdir(person_dir)):
+            stem, ext = os.path.splitext(datei)
+            m = _PORTRAIT_NAME.match(stem)
+            if ext.lower() not in (".png", ".jpg", ".jpeg", ".webp") or m is None:
+                continue
+            praefix, ausdruck = m.groups()
+            # Bei gleichem Ausdruck in mehreren Formaten gewinnt die erste Datei (sortiert: .jpeg < .jpg < .png)
+            quellen.setdefault(person, {}).setdefault(ausdruck, os.path.join(person_dir, datei))
+            alias = praefix[:1].upper() + praefix[1:]
+            if alias != person:
+                aliase[alias] = person
+    return quellen, aliase
+
+
+# Platz (seite, x, y, breite, höhe) eines Bildes im Atlas
+AtlasPlatz = Tuple[int, int, int, int, int]
+
+
+def packen(groessen: Dict[Hashable, Tuple[int, int]], max_seite: int = 2048) -> Tuple[List[Tuple[int, int]], Dict[Hashable, AtlasPlatz]]:
+    """
+    Einfaches Regal-Packing: Bilder nach Höhe sortiert zeilenweise auf Seiten
+    (max. max_seite x max_seite) verteilen. Gibt die benötigten Seitengrößen und
+    key -> (seite, x, y, b, h) zurück. Bilder größer als eine Seite bekommen eine eigene.
+    """
+    seiten: List[Tuple[int, int]] = []
+    plaetze: Dict[Hashable, AtlasPlatz] = {}
+    x = y = zeile = 0
+    for key, (w, h) in sorted(groessen.items(), key=lambda kv: (-kv[1][1], -kv[1][0])):
+        if not seiten:
+            seiten.append((0, 0))
+        if x + w > max_seite and x > 0:
+            # Nächste Zeile
+            x, y, zeile = 0, y + zeile, 0
+        if y + h > max_seite and y > 0:
+            # Nächste Seite
+            seiten.append((0, 0))
+            x = y = zeile = 0
+        seite = len(seiten) - 1
+        plaetze[key] = (seite, x, y, w, h)
+        sw, sh = seiten[seite]
+        seiten[seite] = (max(sw, x + w), max(sh, y + h))
+        x += w
+        zeile = max(zeile, h)
+    return seiten, plaetze
+
+
+def atlas_seiten(bilder: Dict[Hashable, pygame.Surface], max_seite: int = 2048) -> Tuple[List[pygame.Surface], Dict[Hashable, AtlasPlatz]]:
+    """Bilder auf (nicht konvertierte) RGBA-Seiten blitten."""
+    groessen, plaetze = packen({k: img.get_size() for k, img in bilder.items()}, max_seite)
+    seiten = [pygame.Surface(g, pygame.SRCALPHA, 32) for g in groessen]
+    for key, (seite, x, y, _, _) in plaetze.items():
+        seiten[seite].blit(bilder[key], (x, y))
+    return seiten, plaetze
+
+
+def _atlas_backen(manifest: dict, ordner: str, portrait_size: Tuple[int, int]) -> dict:
+    """Alle gebackenen Portraits einer Größe in Atlas-Seiten packen (liest die frischen Rohdateien)."""
+    groesse = size_key(portrait_size)
+    bilder = {}
+    for person, ausdruecke in manifest["portraits"].items():
+        for ausdruck, dateien in ausdruecke.items():
+            img = raw_laden(os.path.join(ordner, dateien[groesse])) if groesse in dateien else None
+            if img is not None:
+                bilder[(person, ausdruck)] = img
+    seiten, plaetze = atlas_seiten(bilder)
+    dateien = []
+    for i, seite in enumerate(seiten):
+        datei = f"atlas/portraits_{groesse}_{i}{RAW_EXT}"
+        raw_schreiben(os.path.join(ordner, datei), seite, alpha=True)
+        dateien.append(datei)
+    verzeichnis: Dict[str, Dict[str, list]] = {}
+    for (person, ausdruck), platz in plaetze.items():
+        verzeichnis.setdefault(person, {})[ausdruck] = list(platz)
+    return {"seiten": dateien, "bilder": verzeichnis}
+
+
+# ---------------------------------------------------------------------- Laufzeit
+
+class BakedAssets:
+    """
+    Nachschlagen im Manifest (wird beim ersten Zugriff einmal gelesen).
+    Liefert Pfade auf Rohdateien oder None, wenn nichts Passendes gebacken ist –
+    der Aufrufer nimmt dann den bisherigen Weg über die Originaldatei.
+    """
+    def __init__(self, ordner: str = BAKED_DIR):
+        self.ordner = ordner
+        self._manifest: Optional[dict] = None
+
+    @property
+    def manifest(self) -> dict:
+        if self._manifest is None:
+            self._manifest = manifest_lesen(self.ordner)
+        return self._manifest
+
+    def neu_laden(self):
+        self._manifest = None
+
+    def raum(self, name: str, size: Tuple[int, int]) -> Optional[str]:
+        datei = self.manifest["raeume"].get(name, {}).get(size_key(size))
+        return os.path.join(self.ordner, datei) if datei else None
+
+    def portrait(self, person: str, ausdruck: str, size: Tuple[int, int]) -> Optional[str]:
+        manifest = self.manifest
+        ordner = manifest["aliase"].get(person, person)
+        datei = manifest["portraits"].get(ordner, {}).get(ausdruck, {}).get(size_key(size))
+        return os.path.join(self.ordner, datei) if datei else None
+
+    def ausdruecke(self, person: str) -> List[str]:
+        manifest = self.manifest
+        ordner = manifest["aliase"].get(person, person)
+        return list(manifest["portraits"].get(ordner, {}))
+
+    def atlas(self, size: Tuple[int, int]) -> Optional[dict]:
+        """Gebackener Portrait-Atlas ({"seiten": [Pfade], "bilder": ...}) oder None."""
+        atlas = self.manifest.get("atlas", {}).get(size_key(size))
+        if not atlas or not atlas["seiten"]:
+            return None
+        return {"seiten": [os.path.join(self.ordner, d) for d in atlas["seiten"]], "bilder": atlas["bilder"]}
+
+
+def leeres_manifest() -> dict:
+    return {"version": MANIFEST_VERSION, "raeume": {}, "portraits": {}, "aliase": {}, "atlas": {}, "quellen": {}}
+
+
+def manifest_lesen(ordner: str) -> dict:
+    try:
+        with open(os.path.join(ordner, MANIFEST), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return leeres_manifest()
+    if manifest.get("version") != MANIFEST_VERSION:
+        return leeres_manifest()
+    return manifest
+
+
+BAKED = BakedAssets()
+
+
+# ---------------------------------------------------------------------- Backen
+
+def _quelle_signatur(pfad: str) -> List[int]:
+    st = os.stat(pfad)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _aktuell(alt: dict, rel: str, signatur: List[int], ausgaben: Dict[str, str], ordner: str) -> bool:
+    return alt["quellen"].get(rel) == signatur and all(
+        os.path.exists(os.path.join(ordner, datei)) for datei in ausgaben.values())
+
+
+def _backen(quelle: str, rel: str, ausgaben: Dict[str, str], groessen: List[Tuple[int, int]],
+            alt: dict, neu: dict, ordner: str, alpha: bool, fit: bool, stats: dict) -> bool:
+    """Eine Quelle in alle Zielgrößen backen; False, wenn sie nicht lesbar ist."""
+    signatur = _quelle_signatur(quelle)
+    if _aktuell(alt, rel, signatur, ausgaben, ordner):
+        neu["quellen"][rel] = signatur
+        stats["uebersprungen"] += 1
+        return True
+    try:
+        img = pygame.image.load(quelle)
+    except (pygame.error, OSError) as e:
+        stats["fehler"].append(f"{rel}: {e}")
+        return False
+    for size in groessen:
+        scaled = scale_to_fit(img, size) if fit else pygame.transform.smoothscale(img, size)
+        raw_schreiben(os.path.join(ordner, ausgaben[size_key(size)]), scaled, alpha)
+    neu["quellen"][rel] = signatur
+    stats["gebacken"] += 1
+    return True
+
+
+def bake(assets_root: str = ASSETS_ROOT, ordner: str = BAKED_DIR,
+         window_sizes: List[Tuple[int, int]] = DEFAULT_WINDOW_SIZES,
+         portrait_size: Tuple[int, int] = PORTRAIT_SIZE, force: bool = False) -> dict:
+    """
+    Backt alle Raum- und Portraitbilder. Unveränderte Quellen (gleiche mtime
+    und Größe, Ausgaben vorhanden) werden übersprungen, sofern nicht force.
+    Gibt eine kleine Statistik zurück.
+    """
+    alt = leeres_manifest() if force else manifest_lesen(ordner)
+    neu = leeres_manifest()
+    stats = {"gebacken": 0, "uebersprungen": 0, "fehler": []}
+    raum_groessen = [room_size_for(s) for s in window_sizes]
+
+    # Räume: Rooms/<name>.png
+    rooms_dir = os.path.join(assets_root, "Rooms")
+    for datei in sorted(os.listdir(rooms_dir)) if os.path.isdir(rooms_dir) else []:
+        name, ext = os.path.splitext(datei)
+        if ext.lower() not in (".png", ".jpg", ".jpeg", ".webp"):
+            continue
+        quelle = os.path.join(rooms_dir, datei)
+        rel = f"Rooms/{datei}"
+        ausgaben = {size_key(s): f"raeume/{name}_{size_key(s)}{RAW_EXT}" for s in raum_groessen}
+        if _backen(quelle, rel, ausgaben, raum_groessen, alt, neu, ordner, alpha=False, fit=False, stats=stats):
+            neu["raeume"][name] = ausgaben
+
+    # Portraits: People/<Ordner>/<praefix><Ausdruck>.png
+    quellen, aliase = portrait_quellen(assets_root)
+    for person, ausdruecke in quellen.items():
+        for ausdruck, quelle in ausdruecke.items():
+            rel = f"People/{person}/{os.path.basename(quelle)}"
+            ausgaben = {size_key(portrait_size): f"portraits/{person}/{ausdruck}_{size_key(portrait_size)}{RAW_EXT}"}
+            if _backen(quelle, rel, ausgaben, [portrait_size], alt, neu, ordner, alpha=True, fit=True, stats=stats):
+                neu["portraits"].setdefault(person, {})[ausdruck] = ausgaben
+    neu["aliase"] = {alias: person for alias, person in aliase.items() if person in neu["portraits"]}
+
+    # Atlas: alle gebackenen Portraits auf wenige Seiten gepackt
+    neu["atlas"] = {size_key(portrait_size): _atlas_backen(neu, ordner, portrait_size)}
+
+    os.makedirs(ordner, exist_ok=True)
+    tmp = os.path.join(ordner, MANIFEST + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(neu, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, os.path.join(ordner, MANIFEST))
+    return stats
+
+
+def _groesse(text: str) -> Tuple[int, int]:
+    w, _, h = text.lower().partition("x")
+    return (int(w), int(h))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bilder vorskalieren und als Rohdaten ablegen")
+    parser.add_argument("--size", type=_groesse, action="append",
+                        help="Fenstergröße BxH (mehrfach möglich), Standard 1280x720")
+    parser.add_argument("--assets", default=ASSETS_ROOT)
+    parser.add_argument("--out", default=BAKED_DIR)
+    parser.add_argument("--force", action="store_true", help="auch unveränderte Quellen neu backen")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    stats = bake(args.assets, args.out, args.size or DEFAULT_WINDOW_SIZES, force=args.force)
+    print(f"{stats['gebacken']} gebacken, {stats['uebersprungen']} unverändert "
+          f"in {(time.perf_counter() - t0) * 1000:.0f} ms -> {os.path.normpath(args.out)}")
+    for fehler in stats["fehler"]:
+        print(f"  übersprungen: {fehler}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# asset_cache.py
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pygame
+
+# Schlüssel: (Pfad, Zielgröße, Konvertierungsmodus), z. B. ("../assets/Rooms/flur.png", (920, 520), "opaque")
+CacheKey = Tuple[Hashable, Tuple[int, int], str]
+
+# Standard-Budget: 64 MiB an dekodierten Pixeln
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Geschätzter Speicherbedarf einer Surface (Zeilenlänge * Höhe)."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class AssetCache:
+    """
+    LRU-Cache für fertig dekodierte, skalierte und konvertierte Surfaces.
+    Wird ein Eintrag angefordert, der nicht im Cache liegt, wird der übergebene
+    Loader aufgerufen. Überschreitet der Cache sein Byte-Budget, fliegen die am
+    längsten nicht benutzten Einträge raus.
+    """
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[pygame.Surface, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey):
+        return key in self._entries
+
+    def get(self, key: CacheKey) -> Optional[pygame.Surface]:
+        """Liefert eine Surface aus dem Cache (und markiert sie als zuletzt benutzt) oder None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: CacheKey, surface: pygame.Surface):
+        """Legt eine Surface ab und verdrängt bei Bedarf alte Einträge."""
+        size = surface_bytes(surface)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.used_bytes -= old[1]
+        if size > self.budget_bytes:
+            # Passt nie ins Budget → nicht cachen
+            return
+        self._entries[key] = (surface, size)
+        self.used_bytes += size
+        self._evict()
+
+    def get_or_load(self, key: CacheKey, loader: Callable[[], Optional[pygame.Surface]]) -> Optional[pygame.Surface]:
+        """Cache-Treffer zurückgeben, sonst Loader aufrufen und Ergebnis cachen."""
+        surf = self.get(key)
+        if surf is not None:
+            return surf
+        surf = loader()
+        if surf is not None:
+            self.put(key, surf)
+        return surf
+
+    def invalidate(self, path: Optional[Hashable] = None):
+        """
+        Entfernt alle Varianten eines Pfads (alle Größen/Modi).
+        Ohne Pfad wird der komplette Cache geleert.
+        """
+        if path is None:
+            self._entries.clear()
+            self.used_bytes = 0
+            return
+        for key in [k for k in self._entries if k[0] == path]:
+            _, size = self._entries.pop(key)
+            self.used_bytes -= size
+
+    def set_budget(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self._evict()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "used_bytes": self.used_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self):
+        while self.used_bytes > self.budget_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.used_bytes -= size
+            self.evictions += 1
+
+
+# Gemeinsamer Cache für Portraits und Raum-Hintergründe
+ASSET_CACHE = AssetCache()
@@ -1,8 +1,12 @@
 class Aufgabe:
-    def __init__(self, id, name, beschreibung):
+    __slots__ = ("id", "name", "beschreibung", "raum", "geber")
+
+    def __init__(self, id, name, beschreibung, raum=None, geber=None):
         self.id = id
         self.name = name
         self.beschreibung = beschreibung
+        self.raum = raum      # Schlüssel des Raums, in dem die Aufgabe erledigt wird
+        self.geber = geber    # Name der Person, die die Aufgabe vergeben hat
 
     def __str__(self):
         return f"[{self.id}] {self.name} - {self.beschreibung}"
@@ -0,0 +1,161 @@
+# aufgaben_register.py
+from typing import Callable, Dict, Iterator, List, Optional
+
+from aufgabe import Aufgabe
+
+
+class AufgabenRegister:
+    """
+    Zentrale Verwaltung aller offenen Aufgaben einer Sitzung.
+    Vergibt eindeutige IDs und hält Indizes nach ID, Raum und Auftraggeber –
+    Hinzufügen, Erledigen und Nachschlagen kosten O(1).
+
+    kopie() liefert ein Register, das sich die Indizes mit diesem teilt, bis
+    eines von beiden zum ersten Mal geändert wird (Copy-on-Write).
+    """
+    def __init__(self, erste_id: int = 1):
+        self._next_id = erste_id
+        self._by_id: Dict[int, Aufgabe] = {}
+        # Dicts statt Listen: Reihenfolge bleibt erhalten, Entfernen ist O(1)
+        self._by_raum: Dict[str, Dict[int, Aufgabe]] = {}
+        self._by_person: Dict[str, Dict[int, Aufgabe]] = {}
+        self.erledigt = 0
+        # Callbacks (aufgabe, hinzugefuegt), z. B. für Autosave
+        self._beobachter: List[Callable[[Aufgabe, bool], None]] = []
+        # True, solange die Indizes mit einer Kopie geteilt werden
+        self._geteilt = False
+        # Zählt jede Änderung mit (z. B. als Cache-Schlüssel für das Aufgaben-Panel)
+        self.version = 0
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, aufgabe_id: int):
+        return aufgabe_id in self._by_id
+
+    @property
+    def naechste_id(self) -> int:
+        return self._next_id
+
+    def bei_aenderung(self, callback: Callable[[Aufgabe, bool], None]):
+        self._beobachter.append(callback)
+
+    def kopie(self) -> "AufgabenRegister":
+        """Register mit denselben offenen Aufgaben (ohne Beobachter); kopiert wird erst beim Ändern."""
+        neu = AufgabenRegister(self._next_id)
+        neu._by_id, neu._by_raum, neu._by_person = self._by_id, self._by_raum, self._by_person
+        neu._geteilt = self._geteilt = True
+        neu.version = self.version
+        return neu
+
+    def _eigene_indizes(self):
+        if self._geteilt:
+            self._by_id = dict(self._by_id)
+            self._by_raum = {k: dict(v) for k, v in self._by_raum.items()}
+            self._by_person = {k: dict(v) for k, v in self._by_person.items()}
+            self._geteilt = False
+
+    def leeren(self, erste_id: int = 1):
+        """Alle Aufgaben entfernen (ohne Benachrichtigung), z. B. vor dem Laden eines Spielstands."""
+        self._by_id, self._by_raum, self._by_person = {}, {}, {}
+        self._geteilt = False
+        self._next_id = erste_id
+        self.version += 1
+
+    def neue_id(self) -> int:
+        aufgabe_id = self._next_id
+        self._next_id += 1
+        return aufgabe_id
+
+    def add(self, name: str, beschreibung: str, raum: str, geber: Optional[str] = None) -> Aufgabe:
+        """Neue Aufgabe mit frischer ID im Raum raum (Schlüssel) anlegen."""
+        return self.eintragen(Aufgabe(self.neue_id(), name, beschreibung, raum=raum, geber=geber))
+
+    def eintragen(self, aufgabe: Aufgabe) -> Aufgabe:
+        """Bestehende Aufgabe (z. B. aus der Weltdatei) übernehmen; ihre ID bleibt erhalten."""
+        if aufgabe.id in self._by_id:
+            raise ValueError(f"Aufgaben-ID {aufgabe.id} ist bereits vergeben.")
+        self._eigene_indizes()
+        self.version += 1
+        self._next_id = max(self._next_id, aufgabe.id + 1)
+        self._by_id[aufgabe.id] = aufgabe
+        self._by_raum.setdefault(aufgabe.raum, {})[aufgabe.id] = aufgabe
+        if aufgabe.geber is not None:
+            self._by_person.setdefault(aufgabe.geber, {})[aufgabe.id] = aufgabe
+        for callback in self._beobachter:
+            callback(aufgabe, True)
+        return aufgabe
+
+    def complete(self, aufgabe_id: int) -> Optional[Aufgabe]:
+        """Aufgabe als erledigt austragen; gibt sie zurück oder None, wenn es sie nicht gibt."""
+        if aufgabe_id not in self._by_id:
+            return None
+        self._eigene_indizes()
+        aufgabe = self._by_id.pop(aufgabe_id)
+        self.version += 1
+        self._by_raum[aufgabe.raum].pop(aufgabe_id, None)
+        if aufgabe.geber is not None:
+            self._by_person[aufgabe.geber].pop(aufgabe_id, None)
+        self.erledigt += 1
+        for callback in self._beobachter:
+            callback(aufgabe, False)
+        return aufgabe
+
+    def get(self, aufgabe_id: int) -> Optional[Aufgabe]:
+        return self._by_id.get(aufgabe_id)
+
+    def offene(self) -> Iterator[Aufgabe]:
+        """Alle offenen Aufgaben in Vergabe-Reihenfolge."""
+        return iter(self._by_id.values())
+
+    def in_raum(self, raum: str) -> List[Aufgabe]:
+        return list(self._by_raum.get(raum, {}).values())
+
+    def anzahl_in_raum(self, raum: str) -> int:
+        return len(self._by_raum.get(raum, ()))
+
+    def von_person(self, geber: str) -> List[Aufgabe]:
+        return list(self._by_person.get(geber, {}).values())
+
+    def ansicht(self, raum: str) -> "RaumAufgaben":
+        return RaumAufgaben(self, raum)
+
+
+class RaumAufgaben:
+    """
+    Listen-artige Sicht auf die Aufgaben eines Raums (für Raum.aufgaben).
+    append/remove gehen direkt ans Register, damit alle Indizes stimmen.
+    """
+    def __init__(self, register: AufgabenRegister, raum: str):
+        self._register = register
+        self._raum = raum
+
+    def _aufgaben(self) -> Dict[int, Aufgabe]:
+        return self._register._by_raum.get(self._raum, {})
+
+    def __iter__(self):
+        return iter(list(self._aufgaben().values()))
+
+    def __len__(self):
+        return len(self._aufgaben())
+
+    def __bool__(self):
+        return bool(self._aufgaben())
+
+    def __contains__(self, aufgabe):
+        return self._aufgaben().get(aufgabe.id) is aufgabe
+
+    def __getitem__(self, i):
+        return list(self._aufgaben().values())[i]
+
+    def append(self, aufgabe: Aufgabe):
+        aufgabe.raum = self._raum
+        self._register.eintragen(aufgabe)
+
+    def remove(self, aufgabe: Aufgabe):
+        if aufgabe not in self:
+            raise ValueError("Aufgabe ist nicht in diesem Raum.")
+        self._register.complete(aufgabe.id)
+
+    def __repr__(self):
+        return f"RaumAufgaben({self._raum!r}, {list(self._aufgaben().values())!r})"
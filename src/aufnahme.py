@@ -0,0 +1,280 @@
+# aufnahme.py
+"""
+Aufnahme und Wiedergabe von Spielsitzungen.
+
+Aufgezeichnet werden nicht die rohen pygame-Events, sondern die Aktionen,
+die sie auslösen (Person anklicken, Antwort wählen, Raum wechseln, Auto-Reise,
+Aufgabe ausführen), jeweils mit Frame-Nummer und Spielzeit (Minute der
+Welt-Uhr, siehe zeitplan.py). Eine Aufnahme ist eine JSON-Lines-Datei:
+
+    {"typ": "kopf", "version": 1, "fps": 60, "zustand": null | {...}}
+    {"typ": "aktion", "frame": 42, "ms": 701, "zeit": 0, "aktion": "talk", "arg": "Holger"}
+    ...
+    {"typ": "ende", "frame": 900, "ms": 15010, "ergebnis": {"raum": "post", "moves": 3, "zeit": 15, ...}}
+
+Vor jeder Aktion läuft die Welt bei der Wiedergabe bis zu ihrer Spielzeit
+weiter, damit die NPCs dort stehen, wo sie bei der Aufnahme standen.
+
+"zustand" ist der Spielstand beim Start (siehe spielstand.py), falls die
+Sitzung aus einem Spielstand heraus begann. Die Aktionsnamen sind dieselben
+wie in simulation.py (move/talk/answer/execute, dazu travel).
+
+Wiedergabe mit festem Zeitschritt und ohne Frame-Limit:
+
+    python aufnahme.py sitzung.jsonl                 # nur Engine, so schnell wie möglich
+    python aufnahme.py sitzung.jsonl --rendern       # GameApp (Dummy-Treiber), jeder Frame wird gezeichnet
+    python aufnahme.py sitzung.jsonl --rendern --fenster   # sichtbar mitverfolgen
+    python aufnahme.py sitzung.jsonl --wiederholen 100     # als Performance-Fixture
+
+Am Ende wird das Ergebnis mit dem aufgezeichneten verglichen; Abweichungen
+ergeben Exit-Code 1.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, IO, List, NamedTuple, Optional
+
+from engine import Engine
+import spielstand
+
+VERSION = 1
+FPS = 60
+
+
+class Eintrag(NamedTuple):
+    frame: int
+    aktion: str
+    arg: str
+    zeit: int = 0
+
+
+def ergebnis(engine: Engine) -> Dict[str, object]:
+    """Kennzahlen, an denen eine Wiedergabe gegen die Aufnahme geprüft wird."""
+    return {
+        "raum": engine.raum_key,
+        "moves": engine.moves,
+        "tasks_created": engine.tasks_created,
+        "tasks_done": engine.tasks_done,
+        "offene_aufgaben": sorted(a.id for a in engine.welt.aufgaben.offene()),
+        "beziehungen": {p.name: p.relationship for p in engine.personen.values() if p.relationship},
+        "zeit": engine.zeit,
+    }
+
+
+def _zustand_als_json(zustand: dict) -> dict:
+    return dict(zustand, aufgaben={str(k): list(v) for k, v in zustand["aufgaben"].items()},
+                kanten_plus=sorted(zustand["kanten_plus"]), kanten_minus=sorted(zustand["kanten_minus"]))
+
+
+def _zustand_aus_json(daten: dict) -> dict:
+    return dict(daten, aufgaben={int(k): tuple(v) for k, v in daten["aufgaben"].items()},
+                zaehler=tuple(daten["zaehler"]),
+                kanten_plus=set(map(tuple, daten["kanten_plus"])),
+                kanten_minus=set(map(tuple, daten["kanten_minus"])))
+
+
+# ---------------------------------------------------------------------- Aufnahme
+
+class Aufnahme:
+    """
+    Schreibt Aktionen mit Frame-Nummer in eine JSON-Lines-Datei.
+    mit_zustand=True legt den Spielstand beim Start in den Kopf (nötig, wenn
+    die Sitzung nicht mit einer frischen Welt beginnt).
+    """
+    def __init__(self, pfad: str, engine: Engine, mit_zustand: bool = False):
+        self.pfad = pfad
+        self.engine = engine
+        self._t0 = time.perf_counter()
+        self._f: Optional[IO[str]] = open(pfad, "w", encoding="utf-8")
+        zustand = _zustand_als_json(spielstand.snapshot_erstellen(engine)) if mit_zustand else None
+        self._schreiben({"typ": "kopf", "version": VERSION, "fps": FPS, "zustand": zustand})
+        self.anzahl = 0
+
+    def aufzeichnen(self, frame: int, aktion: str, arg, zeit: int = 0):
+        self._schreiben({"typ": "aktion", "frame": frame, "ms": self._ms(), "zeit": zeit,
+                         "aktion": aktion, "arg": str(arg)})
+        self.anzahl += 1
+
+    def close(self, frame: int):
+        if self._f is None:
+            return
+        self._schreiben({"typ": "ende", "frame": frame, "ms": self._ms(), "ergebnis": ergebnis(self.engine)})
+        self._f.close()
+        self._f = None
+
+    def _ms(self) -> int:
+        return int((time.perf_counter() - self._t0) * 1000)
+
+    def _schreiben(self, obj: dict):
+        self._f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+
+
+class Sitzung(NamedTuple):
+    zustand: Optional[dict]
+    eintraege: List[Eintrag]
+    frames: int
+    ms: int
+    ergebnis: Optional[dict]
+
+
+def lesen(pfad: str) -> Sitzung:
+    zustand = None
+    eintraege: List[Eintrag] = []
+    frames = ms = 0
+    erwartet = None
+    with open(pfad, encoding="utf-8") as f:
+        for zeile in f:
+            if not zeile.strip():
+                continue
+            obj = json.loads(zeile)
+            typ = obj["typ"]
+            if typ == "kopf":
+                if obj["version"] != VERSION:
+                    raise ValueError(f"{pfad}: unbekannte Aufnahme-Version {obj['version']}")
+                zustand = _zustand_aus_json(obj["zustand"]) if obj["zustand"] else None
+            elif typ == "aktion":
+                eintraege.append(Eintrag(obj["frame"], obj["aktion"], obj["arg"], obj.get("zeit", 0)))
+                frames, ms = max(frames, obj["frame"]), max(ms, obj["ms"])
+            elif typ == "ende":
+                frames, ms, erwartet = obj["frame"], obj["ms"], obj["ergebnis"]
+    # Ohne "ende" (z. B. Absturz) endet die Sitzung mit der letzten Aktion
+    return Sitzung(zustand, eintraege, frames, ms, erwartet)
+
+
+# ---------------------------------------------------------------------- Wiedergabe
+
+class Bericht(NamedTuple):
+    frames: int
+    aktionen: int
+    sekunden: float
+    # Aufgenommene Spielzeit / Wiedergabezeit
+    beschleunigung: float
+    ergebnis: dict
+    abweichungen: List[str]
+
+
+def _vergleichen(erwartet: Optional[dict], ist: dict) -> List[str]:
+    if erwartet is None:
+        return []
+    return [f"{k}: erwartet {erwartet[k]!r}, ist {ist.get(k)!r}" for k in erwartet if erwartet[k] != ist.get(k)]
+
+
+def endzeit(sitzung: Sitzung) -> int:
+    """Spielzeit am Ende der Aufnahme (ältere Aufnahmen: 0)."""
+    return (sitzung.ergebnis or {}).get("zeit", 0)
+
+
+def _bericht(sitzung: Sitzung, engine: Engine, sekunden: float) -> Bericht:
+    ist = ergebnis(engine)
+    spielzeit = max(sitzung.ms / 1000, sitzung.frames / FPS)
+    return Bericht(sitzung.frames, len(sitzung.eintraege), sekunden,
+                   spielzeit / sekunden if sekunden else 0.0, ist, _vergleichen(sitzung.ergebnis, ist))
+
+
+def wiedergabe_headless(sitzung: Sitzung) -> Bericht:
+    """Nur die Engine, Aktionen direkt hintereinander (Frames spielen keine Rolle)."""
+    from simulation import apply_action, welt_daten
+    from welt import Welt
+
+    t0 = time.perf_counter()
+    engine = Engine(Welt(welt_daten()))
+    if sitzung.zustand is not None:
+        spielstand.zustand_laden(engine, sitzung.zustand)
+    for eintrag in sitzung.eintraege:
+        engine.zeit_bis(eintrag.zeit)
+        apply_action(engine, (eintrag.aktion, eintrag.arg))
+    engine.zeit_bis(endzeit(sitzung))
+    return _bericht(sitzung, engine, time.perf_counter() - t0)
+
+
+def aktion_ausfuehren(app, aktion: str, arg: str):
+    """Aktion so auslösen, wie es der passende Button täte."""
+    if aktion == "talk":
+        person = app.engine.person_by_name(arg)
+        if person is not None:
+            app.on_person_clicked(person)
+    elif aktion == "answer":
+        app.choose_dialog(arg)
+    elif aktion == "move":
+        app.on_change_room(arg)
+    elif aktion == "travel":
+        app.on_travel_to_task(int(arg))
+    elif aktion == "execute":
+        app.on_execute_task(int(arg))
+    else:
+        raise ValueError(f"Unbekannte Aktion: {aktion}")
+
+
+def wiedergabe_app(sitzung: Sitzung, app=None) -> Bericht:
+    """
+    Wiedergabe über GameApp mit festem Zeitschritt: Frame für Frame werden die
+    fälligen Aktionen ausgelöst, Vorladen übernommen und gezeichnet – ohne
+    clock.tick, also so schnell wie möglich.
+    """
+    import pygame_game
+    from simulation import welt_daten
+    from welt import Welt
+
+    if app is None:
+        app = pygame_game.GameApp()
+    t0 = time.perf_counter()
+    # Frische Welt wie bei wiedergabe_headless; die App setzt alles zurück, was an der alten hing
+    engine = Engine(Welt(welt_daten()))
+    if sitzung.zustand is not None:
+        spielstand.zustand_laden(engine, sitzung.zustand)
+    app.engine_setzen(engine)
+    app.draw()
+    faellig = iter(sitzung.eintraege)
+    naechster = next(faellig, None)
+    for frame in range(sitzung.frames + 1):
+        app.frame = frame
+        pygame_game.PROFILER.begin_frame()
+        while naechster is not None and naechster.frame <= frame:
+            app.zeit_anwenden(naechster.zeit)
+            aktion_ausfuehren(app, naechster.aktion, naechster.arg)
+            naechster = next(faellig, None)
+        app.prefetcher.pump()
+        app.draw()
+        pygame_game.PROFILER.end_frame()
+    app.zeit_anwenden(endzeit(sitzung))
+    sekunden = time.perf_counter() - t0
+    return _bericht(sitzung, app.engine, sekunden)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Aufgenommene Sitzung wiedergeben")
+    parser.add_argument("aufnahme")
+    parser.add_argument("--rendern", action="store_true", help="über GameApp wiedergeben und jeden Frame zeichnen")
+    parser.add_argument("--fenster", action="store_true", help="mit --rendern: echtes Fenster statt Dummy-Treiber")
+    parser.add_argument("--wiederholen", type=int, default=1, help="mehrfach abspielen (Performance-Fixture)")
+    args = parser.parse_args(argv)
+
+    if args.rendern and not args.fenster:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    sitzung = lesen(args.aufnahme)
+    app = None
+    if args.rendern:
+        import pygame_game
+        app = pygame_game.GameApp()
+
+    berichte = []
+    for _ in range(args.wiederholen):
+        if args.rendern:
+            berichte.append(wiedergabe_app(sitzung, app))
+        else:
+            berichte.append(wiedergabe_headless(sitzung))
+
+    b = berichte[-1]
+    median = sorted(berichte, key=lambda x: x.sekunden)[len(berichte) // 2]
+    print(f"{b.aktionen} Aktionen, {b.frames} Frames in {median.sekunden * 1000:.1f} ms "
+          f"(Median über {len(berichte)}), {median.beschleunigung:.0f}x Echtzeit")
+    abweichungen = [a for x in berichte for a in x.abweichungen]
+    for a in sorted(set(abweichungen)):
+        print(f"  Abweichung: {a}")
+    return 1 if abweichungen else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+# belegung.py
+from typing import Callable, Dict, List, Mapping, Optional
+
+from person import Person
+
+
+class Belegung:
+    """
+    Wer ist wo: Raum-Schlüssel -> Personen-Schlüssel (in Ankunfts-Reihenfolge)
+    und umgekehrt. Umziehen, „wer ist hier?“ und „wo ist X?“ kosten O(1).
+    Raum.personen ist eine Sicht darauf (siehe RaumPersonen).
+
+    Je Raum zählt ein Änderungszähler mit (Cache-Schlüssel für die
+    Personenliste der UI). kopie() teilt die Indizes bis zur ersten Änderung
+    (Copy-on-Write, wie AufgabenRegister.kopie).
+    """
+    def __init__(self):
+        # Dicts statt Listen: Reihenfolge bleibt erhalten, Entfernen ist O(1)
+        self._by_raum: Dict[str, Dict[str, None]] = {}
+        self._ort: Dict[str, str] = {}
+        self._versionen: Dict[str, int] = {}
+        self._geteilt = False
+
+    def __len__(self):
+        return len(self._ort)
+
+    def kopie(self) -> "Belegung":
+        neu = Belegung()
+        neu._by_raum, neu._ort, neu._versionen = self._by_raum, self._ort, self._versionen
+        neu._geteilt = self._geteilt = True
+        return neu
+
+    def _eigene_indizes(self):
+        if self._geteilt:
+            self._by_raum = {k: dict(v) for k, v in self._by_raum.items()}
+            self._ort = dict(self._ort)
+            self._versionen = dict(self._versionen)
+            self._geteilt = False
+
+    def ort(self, person: str) -> Optional[str]:
+        return self._ort.get(person)
+
+    def in_raum(self, raum: str) -> List[str]:
+        return list(self._by_raum.get(raum, ()))
+
+    def anzahl_in_raum(self, raum: str) -> int:
+        return len(self._by_raum.get(raum, ()))
+
+    def version(self, raum: str) -> int:
+        return self._versionen.get(raum, 0)
+
+    def setzen(self, person: str, raum: str):
+        """person (neu) in raum eintragen; ein alter Aufenthaltsort wird ausgetragen."""
+        alt = self._ort.get(person)
+        if alt == raum:
+            return
+        if self._geteilt:
+            self._eigene_indizes()
+        if alt is not None:
+            self._austragen(person, alt)
+        self._ort[person] = raum
+        self._by_raum.setdefault(raum, {})[person] = None
+        self._versionen[raum] = self._versionen.get(raum, 0) + 1
+
+    def entfernen(self, person: str):
+        alt = self._ort.get(person)
+        if alt is None:
+            return
+        self._eigene_indizes()
+        self._austragen(person, alt)
+        del self._ort[person]
+
+    def _austragen(self, person: str, raum: str):
+        personen = self._by_raum[raum]
+        del personen[person]
+        if not personen:
+            del self._by_raum[raum]
+        self._versionen[raum] = self._versionen.get(raum, 0) + 1
+
+    def ansicht(self, raum: str, personen: Mapping[str, Person],
+                person_key: Callable[[Person], Optional[str]]) -> "RaumPersonen":
+        return RaumPersonen(self, raum, personen, person_key)
+
+
+class RaumPersonen:
+    """
+    Listen-artige Sicht auf die Personen eines Raums (für Raum.personen).
+    Die Person-Objekte kommen aus dem (trägen) Personen-Mapping der Welt;
+    append/remove gehen direkt an die Belegung.
+    """
+    __slots__ = ("_belegung", "_raum", "_personen", "_person_key")
+
+    def __init__(self, belegung: Belegung, raum: str, personen: Mapping[str, Person],
+                 person_key: Callable[[Person], Optional[str]]):
+        self._belegung = belegung
+        self._raum = raum
+        self._personen = personen
+        self._person_key = person_key
+
+    def _keys(self):
+        return self._belegung._by_raum.get(self._raum, ())
+
+    def __iter__(self):
+        personen = self._personen
+        return iter([personen[k] for k in self._keys()])
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __bool__(self):
+        return bool(self._keys())
+
+    def __contains__(self, person):
+        key = self._person_key(person)
+        return key is not None and self._belegung.ort(key) == self._raum
+
+    def __getitem__(self, i):
+        return list(self)[i]
+
+    def append(self, person: Person):
+        key = self._person_key(person)
+        if key is None:
+            raise ValueError(f"{person.name} gehört nicht zu dieser Welt.")
+        self._belegung.setzen(key, self._raum)
+
+    def remove(self, person: Person):
+        if person not in self:
+            raise ValueError(f"{person.name} ist nicht in diesem Raum.")
+        self._belegung.entfernen(self._person_key(person))
+
+    def __repr__(self):
+        return f"RaumPersonen({self._raum!r}, {list(self._keys())!r})"
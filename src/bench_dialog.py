@@ -0,0 +1,166 @@
+# bench_dialog.py
+"""
+Benchmark: datengetriebene Dialoge (dialog.py) mit vielen Personen und großen Dialoggraphen.
+
+    python bench_dialog.py                               # 300 Personen à 1 000 Knoten
+    python bench_dialog.py --personen 100 --out dialog.json
+    python bench_dialog.py --baseline dialog.json
+
+Die Dialogdateien werden in ein temporäres Verzeichnis geschrieben. Gemessen
+werden der Weltstart (darf nicht von der Dialogmenge abhängen), das erste
+Gespräch je Person (Datei lesen und kompilieren), ein Dialogschritt im warmen
+Graphen – einmal direkt über Knoten.weiter, einmal über Engine.answer mit
+Meldungen und Effekten. Zum Vergleich: alle Dateien beim Start kompilieren.
+Der Speicher wird (tracemalloc ist langsam) an einer Stichprobe von
+Personen gemessen, die größer als der LRU-Cache ist; der Wert für „alle
+behalten“ ist daraus hochgerechnet.
+Ergebnisformat und Baseline-Vergleich: siehe bench_ergebnis.py.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import List
+
+from bench_ergebnis import Ergebnis, als_json, berichten, meta
+from dialog import DialogBibliothek, kompilieren
+from engine import Engine
+from profiler import percentile
+from welt import Welt
+
+ANTWORTEN = ("ja", "nein", "smalltalk", "frage", "später", "warum")
+
+
+def dialog_daten(knoten: int, rng: random.Random) -> dict:
+    """Zufälliger Dialoggraph: jeder Knoten hat 0–4 Optionen, manche mit Bedingungen und Effekten."""
+    roh = {}
+    for i in range(knoten):
+        d = {"text": f"Satz {i} – " + "bla " * rng.randint(3, 20)}
+        if rng.random() < 0.9:
+            optionen = []
+            for antwort in rng.sample(ANTWORTEN, rng.randint(1, 4)):
+                o = {"antwort": antwort, "ziel": f"k{rng.randrange(knoten)}"}
+                if rng.random() < 0.3:
+                    o["wenn"] = {rng.choice(("beziehung", "rede_lust")): f">= {rng.randint(-2, 6)}"}
+                optionen.append(o)
+            d["optionen"] = optionen
+            d["sonst"] = f"k{rng.randrange(knoten)}"
+        if rng.random() < 0.2:
+            d["effekte"] = [{"beziehung": rng.choice((-1, 1, 2))}]
+        roh[f"k{i}"] = d
+    return {"start": "k0", "knoten": roh}
+
+
+def dialog_welt(personen: int) -> dict:
+    """Ein Raum mit allen Personen, damit jede ansprechbar ist."""
+    return {"start": "halle",
+            "personen": {f"p{i}": {"name": f"Person {i}", "rolle": "NPC", "beschreibung": "."}
+                         for i in range(personen)},
+            "raeume": {"halle": {"name": "Halle", "beschreibung": ".", "personen": [f"p{i}" for i in range(personen)]}}}
+
+
+def messen(args) -> List[Ergebnis]:
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as ordner:
+        for i in range(args.personen):
+            with open(os.path.join(ordner, f"p{i}.json"), "w", encoding="utf-8") as f:
+                json.dump(dialog_daten(args.knoten, rng), f, ensure_ascii=False)
+        groesse = sum(os.path.getsize(os.path.join(ordner, n)) for n in os.listdir(ordner))
+        daten = dialog_welt(args.personen)
+
+        t0 = time.perf_counter()
+        welt = Welt(daten, dialog_ordner=ordner)
+        engine = Engine(welt)
+        t_start = time.perf_counter() - t0
+
+        # Erstes Gespräch je Person: Datei laden und kompilieren
+        erstes: List[float] = []
+        personen = [engine.personen[f"p{i}"] for i in range(args.personen)]
+        for person in personen:
+            t0 = time.perf_counter()
+            engine.talk(person)
+            erstes.append(time.perf_counter() - t0)
+
+        # Warmer Graph: Zufallsweg über Knoten.weiter bzw. Engine.answer
+        person = personen[0]
+        graph = welt.dialoge.graph(welt.dialog_datei("p0"))
+        knoten = graph.start
+        wahl = [rng.choice(ANTWORTEN) for _ in range(args.schritte)]
+        t0 = time.perf_counter()
+        for antwort in wahl:
+            knoten = knoten.weiter(antwort, person) or graph.start
+        t_weiter = (time.perf_counter() - t0) / args.schritte
+        engine.talk(person)
+        t0 = time.perf_counter()
+        for antwort in wahl:
+            if engine.active_person is None:
+                engine.talk(person)
+            engine.answer(antwort)
+        t_answer = (time.perf_counter() - t0) / args.schritte
+
+        # Vergleich: alles beim Start kompilieren
+        t0 = time.perf_counter()
+        alle = DialogBibliothek(ordner, max_graphen=args.personen)
+        for i in range(args.personen):
+            alle.graph(f"p{i}")
+        t_alle = time.perf_counter() - t0
+        del alle
+
+        # Speicher nach Gesprächen mit stichprobe Personen (LRU hält nur max_graphen)
+        stichprobe = min(args.personen, args.stichprobe)
+        tracemalloc.start()
+        lru = DialogBibliothek(ordner)
+        for i in range(stichprobe):
+            lru.graph(f"p{i}")
+        speicher_lru, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        speicher_alle = speicher_lru / len(lru) * args.personen
+        del lru
+
+    # Reines Kompilieren (ohne Datei-I/O) eines Graphen
+    roh = dialog_daten(args.knoten, random.Random(args.seed))
+    t0 = time.perf_counter()
+    kompilieren(roh, "bench")
+    t_kompilieren = time.perf_counter() - t0
+
+    erstes.sort()
+    print(f"{args.personen} Personen à {args.knoten} Knoten ({groesse / 1e6:.1f} MB Dialogdateien): "
+          f"Start {t_start * 1000:.1f} ms, alles vorab kompilieren {t_alle:.2f} s")
+    print(f"Erstes Gespräch p50 {percentile(erstes, 50) * 1000:.1f} ms, Schritt {t_weiter * 1e9:.0f} ns "
+          f"(Engine.answer {t_answer * 1e6:.1f} µs)")
+    print(f"Speicher nach {stichprobe} Gesprächen {speicher_lru / 1e6:.1f} MB (LRU {welt.dialoge.max_graphen} "
+          f"Graphen), alle {args.personen} behalten ≈ {speicher_alle / 1e6:.1f} MB")
+    return [
+        Ergebnis("dialog.start_ms", t_start * 1000, "ms", False),
+        Ergebnis("dialog.erstes_gespraech_p50", percentile(erstes, 50) * 1000, "ms", False),
+        Ergebnis("dialog.erstes_gespraech_p95", percentile(erstes, 95) * 1000, "ms", False),
+        Ergebnis("dialog.kompilieren_ms", t_kompilieren * 1000, "ms", False),
+        Ergebnis("dialog.schritt_ns", t_weiter * 1e9, "ns", False),
+        Ergebnis("dialog.answer_us", t_answer * 1e6, "µs", False),
+        Ergebnis("dialog.speicher_mb", speicher_lru / 1e6, "MB", False),
+        Ergebnis("dialog.speicher_alle_mb", speicher_alle / 1e6, "MB", False),
+    ]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für datengetriebene Dialoge")
+    parser.add_argument("--personen", type=int, default=300)
+    parser.add_argument("--knoten", type=int, default=1000, help="Knoten je Dialoggraph")
+    parser.add_argument("--schritte", type=int, default=200_000, help="gemessene Dialogschritte")
+    parser.add_argument("--stichprobe", type=int, default=80, help="Personen für die Speichermessung")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Ergebnisse als JSON speichern")
+    parser.add_argument("--baseline", help="JSON-Ergebnisse, gegen die verglichen wird")
+    parser.add_argument("--toleranz", type=float, default=0.2, help="erlaubte Verschlechterung (0.2 = 20 %%)")
+    args = parser.parse_args(argv)
+
+    aktuell = als_json(messen(args), meta(personen=args.personen, knoten=args.knoten))
+    return berichten(aktuell, args.baseline, args.out, args.toleranz)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# bench_ergebnis.py
+"""
+Gemeinsames Ergebnisformat der Benchmarks (bench_frontend.py, bench_server.py):
+
+    {"version": 1, "meta": {...},
+     "ergebnisse": {"draw.full_fps": {"wert": 812.4, "einheit": "fps", "hoeher_besser": true}, ...}}
+
+Beim Vergleich gilt ein Wert als Regression, wenn er um mehr als die
+Toleranz schlechter ist als in der Baseline.
+"""
+import json
+import platform
+import time
+from typing import List, NamedTuple, Optional
+
+VERSION = 1
+
+
+class Ergebnis(NamedTuple):
+    name: str
+    wert: float
+    einheit: str
+    hoeher_besser: bool
+
+
+def meta(**extra) -> dict:
+    daten = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "zeit": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    daten.update(extra)
+    return daten
+
+
+def als_json(ergebnisse: List[Ergebnis], meta_daten: dict) -> dict:
+    return {"version": VERSION, "meta": meta_daten,
+            "ergebnisse": {e.name: {"wert": round(e.wert, 4), "einheit": e.einheit, "hoeher_besser": e.hoeher_besser}
+                           for e in ergebnisse}}
+
+
+def vergleichen(aktuell: dict, baseline: dict, toleranz: float) -> List[str]:
+    """Namen der Messungen, die mehr als toleranz schlechter sind als die Baseline."""
+    regressionen = []
+    for name, neu in aktuell["ergebnisse"].items():
+        alt = baseline["ergebnisse"].get(name)
+        if alt is None or alt["wert"] <= 0:
+            continue
+        verhaeltnis = neu["wert"] / alt["wert"]
+        schlechter = verhaeltnis < 1 - toleranz if neu["hoeher_besser"] else verhaeltnis > 1 + toleranz
+        if schlechter:
+            regressionen.append(name)
+    return regressionen
+
+
+def tabelle(aktuell: dict, baseline: Optional[dict], regressionen: List[str]) -> List[str]:
+    zeilen = []
+    for name, neu in aktuell["ergebnisse"].items():
+        zeile = f"{name:<44} {neu['wert']:>12.3f} {neu['einheit']:<4}"
+        alt = baseline["ergebnisse"].get(name) if baseline else None
+        if alt and alt["wert"] > 0:
+            delta = (neu["wert"] / alt["wert"] - 1) * 100
+            zeile += f"  (Baseline {alt['wert']:.3f}, {delta:+.1f} %)"
+            if name in regressionen:
+                zeile += "  REGRESSION"
+        zeilen.append(zeile)
+    return zeilen
+
+
+def berichten(aktuell: dict, baseline_pfad: Optional[str], out: Optional[str], toleranz: float) -> int:
+    """Tabelle ausgeben, optional speichern und vergleichen; 1 bei Regression, sonst 0."""
+    baseline = None
+    regressionen: List[str] = []
+    if baseline_pfad:
+        with open(baseline_pfad, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressionen = vergleichen(aktuell, baseline, toleranz)
+    print("\n".join(tabelle(aktuell, baseline, regressionen)))
+    if out:
+        with open(out, "w", encoding="utf-8") as f:
+            json.dump(aktuell, f, ensure_ascii=False, indent=1)
+    if regressionen:
+        print(f"{len(regressionen)} Regression(en) über {toleranz:.0%}.")
+        return 1
+    return 0
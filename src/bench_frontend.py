@@ -0,0 +1,272 @@
+# bench_frontend.py
+"""
+Benchmark-Suite für das pygame-Frontend, läuft ohne Grafikkarte (SDL-Dummy-Treiber).
+
+    python bench_frontend.py                               # messen + Tabelle
+    python bench_frontend.py --out ergebnis.json           # zusätzlich als JSON speichern
+    python bench_frontend.py --baseline baseline.json      # vergleichen, Exit-Code 1 bei Regression
+    python bench_frontend.py --out baseline.json --nur draw,textlog   # nur einzelne Gruppen
+
+Gemessen wird jeweils der Median über mehrere Durchläufe. Ergebnisdatei: siehe bench_ergebnis.py.
+
+Beim Vergleich gilt ein Wert als Regression, wenn er um mehr als --toleranz
+(Standard 20 %) schlechter ist als in der Baseline. Die Baseline sollte auf
+derselben Maschine (z. B. dem CI-Runner) erzeugt werden.
+"""
+import os
+
+# Muss vor dem ersten pygame-Import gesetzt sein
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+import pygame
+
+import pygame_game as pg
+from asset_bake import BAKED, leeres_manifest
+from asset_cache import ASSET_CACHE
+from bench_ergebnis import Ergebnis, als_json, berichten, meta
+from bench_welt import synthetische_welt
+from engine import Engine
+from raum import Raum
+from setup import Setup
+from text_layout import clear_layout_cache, wrap_text
+from welt import Welt
+
+
+def messen(func: Callable[[], object], wiederholungen: int = 7, anzahl: int = 1,
+           vorbereiten: Optional[Callable[[], object]] = None) -> float:
+    """Median der Sekunden pro Aufruf über wiederholungen Durchläufe à anzahl Aufrufe."""
+    zeiten = []
+    for _ in range(wiederholungen):
+        if vorbereiten is not None:
+            vorbereiten()
+        t0 = time.perf_counter()
+        for _ in range(anzahl):
+            func()
+        zeiten.append((time.perf_counter() - t0) / anzahl)
+    return statistics.median(zeiten)
+
+
+def ms(name: str, sekunden: float) -> Ergebnis:
+    return Ergebnis(name, sekunden * 1000, "ms", False)
+
+
+def us(name: str, sekunden: float) -> Ergebnis:
+    return Ergebnis(name, sekunden * 1e6, "µs", False)
+
+
+def lorem(woerter: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    vorrat = ("Holger", "Büro", "Drucker", "Aufgabe", "Großraumbüro", "kontrollieren", "und", "die", "der",
+              "Technikraum", "Dokument", "Post", "Kaffee", "Besprechung", "Donaudampfschifffahrtsgesellschaft")
+    return " ".join(rng.choice(vorrat) for _ in range(woerter))
+
+
+# ---------------------------------------------------------------------- Benchmarks
+
+def bench_draw(app: pg.GameApp, r: int) -> List[Ergebnis]:
+    """Frames/Sekunde für Vollbild-Neuzeichnen und für kleine Teil-Updates (Hover)."""
+    app.finish_startup()
+    app.full_redraw = True
+    full = messen(app.draw, wiederholungen=r, anzahl=50)
+    app.full_redraw = False
+    app.draw()
+    button = app.nav_buttons[0]
+
+    def hover_frame():
+        button.set_hover(not button.hover)
+        app.draw()
+
+    dirty = messen(hover_frame, wiederholungen=r, anzahl=200)
+    return [Ergebnis("draw.full_fps", 1 / full, "fps", True),
+            Ergebnis("draw.dirty_hover_fps", 1 / dirty, "fps", True)]
+
+
+def bench_textlog(app: pg.GameApp, r: int) -> List[Ergebnis]:
+    """TextLog.add bei vollem Ringpuffer, add + draw (Umbruch der neuen Zeile) und draw."""
+    zeilen = [f"[{i}] " + lorem(5 + i % 40, seed=i) for i in range(5000)]
+
+    def alles_hinzufuegen():
+        log = pg.TextLog(app.log.rect.copy(), max_lines=8)
+        for zeile in zeilen:
+            log.add(zeile)
+
+    def hinzufuegen_und_zeichnen():
+        log = pg.TextLog(app.log.rect.copy(), max_lines=8)
+        for zeile in zeilen[:500]:
+            log.add(zeile)
+            log.draw(app.screen)
+
+    add = messen(alles_hinzufuegen, wiederholungen=r) / len(zeilen)
+    add_draw = messen(hinzufuegen_und_zeichnen, wiederholungen=r, vorbereiten=clear_layout_cache) / 500
+    log = pg.TextLog(app.log.rect.copy(), max_lines=8)
+    for zeile in zeilen:
+        log.add(zeile)
+    log.draw(app.screen)
+    draw = messen(lambda: log.draw(app.screen), wiederholungen=r, anzahl=200)
+    log.scroll(50)
+    draw_scrolled = messen(lambda: log.draw(app.screen), wiederholungen=r, anzahl=200)
+    return [us("textlog.add_5000_per_line", add), us("textlog.add_draw_per_line", add_draw),
+            us("textlog.draw", draw), us("textlog.draw_scrolled", draw_scrolled)]
+
+
+def bench_wrap(app: pg.GameApp, r: int) -> List[Ergebnis]:
+    """wrap_text auf einem langen Absatz: kalt (Layout-Cache geleert) und warm."""
+    absatz = lorem(2000, seed=42)
+    breite = app.log.rect.width - 20
+    kalt = messen(lambda: wrap_text(absatz, pg.FONT_SMALL, breite), wiederholungen=r, vorbereiten=clear_layout_cache)
+    warm = messen(lambda: wrap_text(absatz, pg.FONT_SMALL, breite), wiederholungen=r, anzahl=1000)
+    return [ms("wrap.2000_words_cold", kalt), us("wrap.2000_words_warm", warm)]
+
+
+def bench_assets(app: pg.GameApp, r: int) -> List[Ergebnis]:
+    """Hintergrund- und Portrait-Laden kalt (Cache leer) und warm, aus PNG und – falls gebacken – aus Rohdaten."""
+    # technik_blur.png ist das einzige gültige Raumbild im Repo
+    raum = Raum("Technik blur", "Benchmark-Raum")
+    ergebnisse = []
+    gebacken = BAKED.manifest
+    varianten = [("png", leeres_manifest())]
+    if gebacken["raeume"] or gebacken["portraits"]:
+        varianten.append(("baked", gebacken))
+    try:
+        for variante, manifest in varianten:
+            BAKED._manifest = manifest
+            pg._PORTRAIT_PATHS.clear()
+            kalt = messen(lambda: pg.load_room_background(raum, app.room_size), wiederholungen=r,
+                          vorbereiten=ASSET_CACHE.invalidate)
+            ergebnisse.append(ms(f"assets.room_background_cold_{variante}", kalt))
+            kalt = messen(lambda: pg.load_person_portrait("Holger", pg.PORTRAIT_SIZE), wiederholungen=r,
+                          vorbereiten=ASSET_CACHE.invalidate)
+            ergebnisse.append(ms(f"assets.portrait_cold_{variante}", kalt))
+        warm = messen(lambda: pg.load_room_background(raum, app.room_size), wiederholungen=r, anzahl=1000)
+        ergebnisse.append(us("assets.room_background_warm", warm))
+        warm = messen(lambda: pg.load_person_portrait("Holger", pg.PORTRAIT_SIZE), wiederholungen=r, anzahl=1000)
+        ergebnisse.append(us("assets.portrait_warm", warm))
+    finally:
+        BAKED.neu_laden()
+        pg._PORTRAIT_PATHS.clear()
+    return ergebnisse
+
+
+def grosser_raum(personen: int = 40, ausgaenge: int = 60, aufgaben: int = 50) -> Welt:
+    """Welt mit einem Knotenraum voller Personen, Ausgänge und Aufgaben."""
+    raeume = {"hub": {"name": "Hub", "beschreibung": "Knotenpunkt.", "verbindungen": [], "personen": [],
+                      "aufgaben": []}}
+    personen_daten = {}
+    for i in range(ausgaenge):
+        key = f"raum_{i}"
+        raeume[key] = {"name": f"Raum {i}", "beschreibung": "Nebenraum.", "verbindungen": ["hub"]}
+        raeume["hub"]["verbindungen"].append(key)
+    for i in range(personen):
+        key = f"person_{i}"
+        personen_daten[key] = {"name": f"Person {i}", "rolle": "NPC", "beschreibung": "Statist.", "rede_lust": i % 10}
+        raeume["hub"]["personen"].append(key)
+    for i in range(aufgaben):
+        ziel = "hub" if i % 2 == 0 else f"raum_{i % ausgaenge}"
+        raeume[ziel].setdefault("aufgaben", []).append({"id": i + 1, "name": f"Aufgabe {i}",
+                                                         "beschreibung": "Etwas erledigen."})
+    return Welt({"start": "hub", "personen": personen_daten, "raeume": raeume})
+
+
+def bench_room_ui(app: pg.GameApp, r: int) -> List[Ergebnis]:
+    """rebuild_room_ui in einem vollen Raum, dazu Neuaufbau, Scrollen und Zeichnen in einem Knoten mit 10 000 Ausgängen."""
+    alte_engine = app.engine
+    app.engine = Engine(grosser_raum())
+    try:
+        app.rebuild_room_ui(full=True)
+        ui = messen(app.rebuild_room_ui, wiederholungen=r, anzahl=50)
+        full = messen(lambda: app.rebuild_room_ui(full=True), wiederholungen=r, anzahl=20)
+
+        app.engine = Engine(grosser_raum(personen=2000, ausgaenge=10000, aufgaben=500))
+        kalt = messen(app.rebuild_room_ui, wiederholungen=r, vorbereiten=app.layout_cache.clear)
+        warm = messen(app.rebuild_room_ui, wiederholungen=r, anzahl=50)
+        richtung = [1]
+
+        def scrollen():
+            if not app.nav_list.scroll(richtung[0]):
+                richtung[0] = -richtung[0]
+            app.rebuild_hit_index()
+
+        scroll = messen(scrollen, wiederholungen=r, anzahl=200)
+        app.full_redraw = True
+        draw = messen(app.draw, wiederholungen=r, anzahl=20)
+        app.full_redraw = False
+    finally:
+        app.engine = alte_engine
+        app.rebuild_room_ui(full=True)
+    return [ms("room_ui.rebuild_40p_60exits_50tasks", ui), ms("room_ui.rebuild_full_40p_60exits_50tasks", full),
+            ms("room_ui.rebuild_cold_10000exits", kalt), ms("room_ui.rebuild_10000exits", warm),
+            us("room_ui.scroll_10000exits", scroll), Ergebnis("room_ui.draw_10000exits_fps", 1 / draw, "fps", True)]
+
+
+def bench_setup(app: pg.GameApp, r: int) -> List[Ergebnis]:
+    """Weltaufbau über Setup aus einer synthetischen Weltdatei mit 10 000 Räumen."""
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+        json.dump(synthetische_welt(10000), f)
+        pfad = f.name
+    try:
+        laden = messen(lambda: Setup(pfad).welt_laden(), wiederholungen=r)
+        setup = Setup(pfad)
+
+        def alles_bauen():
+            setup._welt = None
+            setup.raum_erzeugen()
+            setup.personen_erzeugen()
+
+        bauen = messen(alles_bauen, wiederholungen=r)
+    finally:
+        os.unlink(pfad)
+    return [ms("setup.welt_laden_10k", laden), ms("setup.alles_bauen_10k", bauen)]
+
+
+BENCHMARKS: Dict[str, Callable[[pg.GameApp, int], List[Ergebnis]]] = {
+    "draw": bench_draw,
+    "textlog": bench_textlog,
+    "wrap": bench_wrap,
+    "assets": bench_assets,
+    "room_ui": bench_room_ui,
+    "setup": bench_setup,
+}
+
+
+# ---------------------------------------------------------------------- Ergebnisse
+
+def pygame_meta() -> dict:
+    return meta(pygame=pygame.version.ver, sdl=".".join(map(str, pygame.get_sdl_version())),
+                video_driver=os.environ.get("SDL_VIDEODRIVER"))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Headless-Benchmarks für das pygame-Frontend")
+    parser.add_argument("--out", help="Ergebnisse als JSON speichern")
+    parser.add_argument("--baseline", help="JSON-Ergebnisse, gegen die verglichen wird")
+    parser.add_argument("--toleranz", type=float, default=0.2, help="erlaubte Verschlechterung (0.2 = 20 %%)")
+    parser.add_argument("--nur", help="kommagetrennte Gruppen: " + ",".join(BENCHMARKS))
+    parser.add_argument("--wiederholungen", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    gruppen = args.nur.split(",") if args.nur else list(BENCHMARKS)
+    unbekannt = [g for g in gruppen if g not in BENCHMARKS]
+    if unbekannt:
+        parser.error(f"Unbekannte Gruppe(n): {', '.join(unbekannt)}")
+
+    app = pg.GameApp()
+    ergebnisse: List[Ergebnis] = []
+    for gruppe in gruppen:
+        ergebnisse.extend(BENCHMARKS[gruppe](app, args.wiederholungen))
+    app.prefetcher.shutdown()
+
+    return berichten(als_json(ergebnisse, pygame_meta()), args.baseline, args.out, args.toleranz)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
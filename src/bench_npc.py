@@ -0,0 +1,160 @@
+# bench_npc.py
+"""
+Benchmark: Tagesablauf vieler NPCs (zeitplan.py) in einer synthetischen Welt.
+
+    python bench_npc.py                                  # 50 000 NPCs, 2 000 Räume
+    python bench_npc.py --npcs 5000 --out npc.json
+    python bench_npc.py --baseline npc.json
+
+Jede Person läuft reihum durch einige Stationen (1–2 Räume voneinander
+entfernt, hin und auf demselben Weg zurück) und bleibt dort 5–90 Minuten
+(--max-dauer; ab 256 Minuten kommt die Kaskade des Zeitrads ins Spiel).
+Gemessen wird die Dauer je Tick (eine Spielminute, p50/p99/max) nach einem
+Einschwing-Tag, in dem die Wege einmal berechnet werden; danach wird die Welt
+wie im Spiel aus dem GC genommen (gc.freeze). Zum Vergleich läuft dieselbe
+Simulation naiv weiter: jeder Tick prüft alle NPCs auf Fälligkeit und erledigt
+dann dieselbe Arbeit (Raumwechsel, Belegung).
+Ergebnisformat und Baseline-Vergleich: siehe bench_ergebnis.py.
+"""
+import argparse
+import gc
+import random
+import sys
+import time
+from typing import List
+
+from bench_ergebnis import Ergebnis, als_json, berichten, meta
+from bench_welt import synthetische_welt
+from profiler import percentile
+from welt import Welt
+from zeitplan import Bewegung, Npc, Zeitplan
+
+TAG = 24 * 60
+
+
+def npc_welt(raeume: int, npcs: int, stationen: int = 4, seed: int = 0, max_dauer: int = 90) -> dict:
+    """Synthetische Welt (bench_welt) plus npcs Personen mit zufälligem Plan entlang der Verbindungen."""
+    daten = synthetische_welt(raeume, people_every=raeume + 1, seed=seed)
+    rng = random.Random(seed)
+    nachbarn = {key: d["verbindungen"] for key, d in daten["raeume"].items()}
+    keys = list(nachbarn)
+    personen = daten["personen"]
+    for i in range(npcs):
+        # Hin über die Stationen und auf demselben Weg zurück (wie Zuhause → Büro → Kantine → Büro)
+        raum = rng.choice(keys)
+        hin = []
+        for _ in range(stationen // 2 + 1):
+            hin.append(raum)
+            for _ in range(rng.randint(1, 2)):
+                raum = rng.choice(nachbarn[raum])
+        stopps = (hin + hin[-2:0:-1])[:max(stationen, 1)]
+        plan = [{"raum": r, "dauer": rng.randint(5, max_dauer)} for r in stopps]
+        personen[f"npc_{i}"] = {"name": f"NPC {i}", "rolle": "NPC", "beschreibung": "Unterwegs.", "plan": plan}
+    return daten
+
+
+def naiver_tick(zeitplan: Zeitplan, npcs: List[Npc], jetzt: int) -> List[Bewegung]:
+    """Vergleich: jeden Tick alle NPCs anfassen, um die fälligen zu finden – danach dieselbe Arbeit wie im Zeitrad."""
+    bewegungen: List[Bewegung] = []
+    for npc in npcs:
+        if npc.faellig == jetzt:
+            zeitplan.termin_bearbeiten(npc, jetzt, None, bewegungen)
+    return bewegungen
+
+
+def _quantile(dauer: List[float]) -> str:
+    return (f"p50 {percentile(dauer, 50) * 1000:.2f} / p99 {percentile(dauer, 99) * 1000:.2f} / "
+            f"max {dauer[-1] * 1000:.2f} ms")
+
+
+def messen(args) -> List[Ergebnis]:
+    daten = npc_welt(args.raeume, args.npcs, args.stationen, args.seed, args.max_dauer)
+    t0 = time.perf_counter()
+    welt = Welt(daten)
+    zeitplan = Zeitplan(welt)
+    t_start = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    zeitplan.vorruecken(args.einschwingen)
+    t_einschwingen = time.perf_counter() - t0
+    # Wie GameApp nach dem Start: die langlebige Welt nicht bei jeder vollen GC-Sammlung erneut durchsuchen
+    gc.collect()
+    gc.freeze()
+
+    dauer: List[float] = []
+    ereignisse = zeitplan.ereignisse
+    bewegungen = 0
+    t_gesamt = time.perf_counter()
+    for _ in range(args.minuten):
+        t0 = time.perf_counter()
+        bewegungen += len(zeitplan.tick())
+        dauer.append(time.perf_counter() - t0)
+    t_gesamt = time.perf_counter() - t_gesamt
+    ereignisse = zeitplan.ereignisse - ereignisse
+
+    # Naiv weiter ab dem erreichten Stand (das Zeitrad wird danach nicht mehr benutzt)
+    npcs = list(zeitplan.npcs.values())
+    naiv: List[float] = []
+    naiv_bewegungen = 0
+    for minute in range(zeitplan.zeit + 1, zeitplan.zeit + 1 + args.naiv_minuten):
+        t0 = time.perf_counter()
+        naiv_bewegungen += len(naiver_tick(zeitplan, npcs, minute))
+        naiv.append(time.perf_counter() - t0)
+
+    # "Wer ist hier?" über Raum.personen (Sicht auf die Belegung)
+    rng = random.Random(args.seed)
+    raeume = [welt.raeume[k] for k in rng.sample(list(welt.adjazenz), min(1000, len(welt.adjazenz)))]
+    t0 = time.perf_counter()
+    for _ in range(100):
+        for raum in raeume:
+            len(raum.personen)
+    t_wer = (time.perf_counter() - t0) / (100 * len(raeume))
+
+    gc.unfreeze()
+    dauer.sort()
+    naiv.sort()
+    print(f"{args.npcs} NPCs in {args.raeume} Räumen: Start {t_start * 1000:.0f} ms, "
+          f"Einschwingen ({args.einschwingen} min) {t_einschwingen:.2f} s")
+    print(f"{args.minuten} Ticks: {ereignisse / args.minuten:.0f} Termine und {bewegungen / args.minuten:.0f} "
+          f"Raumwechsel je Tick, {t_gesamt / args.minuten * 1000:.2f} ms/Tick, {zeitplan.rad.kaskadiert} kaskadiert")
+    print(f"  Zeitrad: {_quantile(dauer)}")
+    print(f"  naiv:    {_quantile(naiv)} ({args.naiv_minuten} Ticks, "
+          f"{naiv_bewegungen / args.naiv_minuten:.0f} Raumwechsel je Tick)")
+    return [
+        Ergebnis("npc.start_ms", t_start * 1000, "ms", False),
+        Ergebnis("npc.tick_p50", percentile(dauer, 50) * 1000, "ms", False),
+        Ergebnis("npc.tick_p95", percentile(dauer, 95) * 1000, "ms", False),
+        Ergebnis("npc.tick_p99", percentile(dauer, 99) * 1000, "ms", False),
+        Ergebnis("npc.tick_max", dauer[-1] * 1000, "ms", False),
+        Ergebnis("npc.us_pro_termin", t_gesamt / max(1, ereignisse) * 1e6, "µs", False),
+        Ergebnis("npc.naiv_p50", percentile(naiv, 50) * 1000, "ms", False),
+        Ergebnis("npc.naiv_p99", percentile(naiv, 99) * 1000, "ms", False),
+        Ergebnis("npc.naiv_max", naiv[-1] * 1000, "ms", False),
+        Ergebnis("npc.wer_ist_hier_ns", t_wer * 1e9, "ns", False),
+    ]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für den Tagesablauf vieler NPCs")
+    parser.add_argument("--npcs", type=int, default=50_000)
+    parser.add_argument("--raeume", type=int, default=2000)
+    parser.add_argument("--stationen", type=int, default=4, help="Stationen je Plan")
+    parser.add_argument("--max-dauer", type=int, default=90, help="längster Aufenthalt an einer Station (Minuten)")
+    parser.add_argument("--einschwingen", type=int, default=TAG, help="Spielminuten vor der Messung")
+    parser.add_argument("--minuten", type=int, default=2 * TAG, help="gemessene Ticks")
+    parser.add_argument("--naiv-minuten", type=int, help="gemessene Ticks der naiven Variante (Standard: --minuten)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Ergebnisse als JSON speichern")
+    parser.add_argument("--baseline", help="JSON-Ergebnisse, gegen die verglichen wird")
+    parser.add_argument("--toleranz", type=float, default=0.2, help="erlaubte Verschlechterung (0.2 = 20 %%)")
+    args = parser.parse_args(argv)
+    if args.naiv_minuten is None:
+        args.naiv_minuten = args.minuten
+
+    aktuell = als_json(messen(args), meta(npcs=args.npcs, raeume=args.raeume, stationen=args.stationen,
+                                          max_dauer=args.max_dauer, minuten=args.minuten))
+    return berichten(aktuell, args.baseline, args.out, args.toleranz)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# bench_server.py
+"""
+Lastgenerator für server.py: öffnet viele Sitzungen gleichzeitig, spielt in
+jeder ein paar zufällige Befehle und misst Sitzungen/s sowie die Latenz
+(Verbindungsaufbau bis zum ersten Prompt, Befehl bis zum nächsten Prompt).
+
+    python bench_server.py --sitzungen 5000 --parallel 1000       # startet den Server im selben Prozess
+    python bench_server.py --host 10.0.0.5 --port 4000 --sitzungen 20000 --parallel 2000
+    python bench_server.py --out last.json --baseline baseline.json
+
+Ergebnisformat und Baseline-Vergleich: siehe bench_ergebnis.py.
+"""
+import argparse
+import asyncio
+import random
+import re
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from bench_ergebnis import Ergebnis, als_json, berichten, meta
+from profiler import percentile
+from server import ENCODING, TextServer
+from setup import Setup
+from spiel import BEFEHL_PROMPT
+
+BEFEHL_PROMPT_BYTES = BEFEHL_PROMPT.replace("\n", "\r\n").encode(ENCODING)
+
+# Antwort-Prompt mit den Optionen des laufenden Dialogs (siehe spiel.antwort_prompt)
+_ANTWORT_PROMPT = re.compile(r"Deine Antwort \((.*)\): $")
+
+_AUSGAENGE = re.compile(r"^Ausgänge: (.*)$", re.M)
+_PERSONEN = re.compile(r"^Personen hier: (.*)$", re.M)
+_AUFGABEN = re.compile(r"^Aufgabe: \[(\d+)\]", re.M)
+_NAME = re.compile(r"(.+?) \(")
+
+
+class Messung:
+    def __init__(self):
+        self.verbinden: List[float] = []
+        self.befehle: List[float] = []
+        self.sitzungen = 0
+        self.fehler = 0
+
+
+async def bis_prompt(reader: asyncio.StreamReader) -> str:
+    """Liest, bis die Ausgabe auf den Befehls- oder einen Antwort-Prompt endet."""
+    puffer = b""
+    while not puffer.endswith(BEFEHL_PROMPT_BYTES) and not ist_antwort_prompt(puffer[-256:].decode(ENCODING, "ignore")):
+        daten = await reader.read(65536)
+        if not daten:
+            raise ConnectionError("Verbindung vom Server beendet")
+        puffer += daten
+    return puffer.decode(ENCODING).replace("\r\n", "\n")
+
+
+def ist_antwort_prompt(text: str) -> bool:
+    return _ANTWORT_PROMPT.search(text.rpartition("\n")[2]) is not None
+
+
+def naechster_befehl(text: str, rng: random.Random) -> str:
+    """Zufälliger sinnvoller Befehl anhand der letzten Ausgabe (wie simulation.random_action)."""
+    m = _ANTWORT_PROMPT.search(text.rpartition("\n")[2])
+    if m:
+        return rng.choice(m.group(1).split("/"))
+    befehle = []
+    m = _AUSGAENGE.search(text)
+    if m:
+        befehle += ["gehe " + r for r in m.group(1).split(", ")]
+    m = _PERSONEN.search(text)
+    if m:
+        befehle += ["rede " + _NAME.match(p + " ").group(1) for p in m.group(1).split("), ")]
+    befehle += ["aufgabe " + a for a in _AUFGABEN.findall(text)]
+    return rng.choice(befehle) if befehle else "gehe flur"
+
+
+async def sitzung_spielen(host: str, port: int, befehle: int, seed: int, messung: Messung):
+    rng = random.Random(seed)
+    t0 = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        text = await bis_prompt(reader)
+        messung.verbinden.append(time.perf_counter() - t0)
+        n = 0
+        # Offenes Gespräch zuerst beantworten, sonst wäre "ende" die Antwort
+        while n < befehle or ist_antwort_prompt(text):
+            n += 1
+            befehl = naechster_befehl(text, rng)
+            t0 = time.perf_counter()
+            writer.write((befehl + "\r\n").encode(ENCODING))
+            await writer.drain()
+            text = await bis_prompt(reader)
+            messung.befehle.append(time.perf_counter() - t0)
+        writer.write(b"ende\r\n")
+        await writer.drain()
+        await reader.read()
+        messung.sitzungen += 1
+    finally:
+        writer.close()
+
+
+async def last_erzeugen(host: str, port: int, sitzungen: int, parallel: int, befehle: int,
+                        seed: int = 0) -> Tuple[Messung, float]:
+    messung = Messung()
+    frei = asyncio.Semaphore(parallel)
+
+    async def eine(i: int):
+        async with frei:
+            try:
+                await sitzung_spielen(host, port, befehle, seed + i, messung)
+            except (OSError, ConnectionError, asyncio.IncompleteReadError):
+                messung.fehler += 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(eine(i) for i in range(sitzungen)))
+    return messung, time.perf_counter() - t0
+
+
+def auswerten(messung: Messung, sekunden: float) -> List[Ergebnis]:
+    ergebnisse = [Ergebnis("server.sitzungen_pro_s", messung.sitzungen / sekunden, "1/s", True),
+                  Ergebnis("server.befehle_pro_s", len(messung.befehle) / sekunden, "1/s", True)]
+    for name, werte in (("verbinden", messung.verbinden), ("befehl", messung.befehle)):
+        werte = sorted(werte)
+        for p in (50, 95, 99):
+            ergebnisse.append(Ergebnis(f"server.{name}_p{p}", percentile(werte, p) * 1000, "ms", False))
+    return ergebnisse
+
+
+def _dateien_erlauben(anzahl: int):
+    """Weiches Limit offener Dateien anheben (Client und Server im selben Prozess brauchen 2 pro Sitzung)."""
+    try:
+        import resource
+    except ImportError:
+        return
+    weich, hart = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if weich < anzahl:
+        ziel = anzahl if hart == resource.RLIM_INFINITY else min(anzahl, hart)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (ziel, hart))
+
+
+async def _main(args) -> Tuple[Messung, float]:
+    server: Optional[TextServer] = None
+    port = args.port
+    if args.host is None:
+        server = TextServer(Setup().welt_laden(), max_sitzungen=args.parallel)
+        port = await server.starten("127.0.0.1", 0)
+    try:
+        return await last_erzeugen(args.host or "127.0.0.1", port, args.sitzungen, args.parallel,
+                                   args.befehle, args.seed)
+    finally:
+        if server is not None:
+            await server.stoppen()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Lastgenerator für den Text-Server")
+    parser.add_argument("--host", help="laufender Server; ohne Angabe wird einer im selben Prozess gestartet")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--sitzungen", type=int, default=2000, help="Sitzungen insgesamt")
+    parser.add_argument("--parallel", type=int, default=500, help="gleichzeitig offene Sitzungen")
+    parser.add_argument("--befehle", type=int, default=20, help="Befehle je Sitzung")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Ergebnisse als JSON speichern")
+    parser.add_argument("--baseline", help="JSON-Ergebnisse, gegen die verglichen wird")
+    parser.add_argument("--toleranz", type=float, default=0.2, help="erlaubte Verschlechterung (0.2 = 20 %%)")
+    args = parser.parse_args(argv)
+
+    _dateien_erlauben(2 * args.parallel + 64)
+    messung, sekunden = asyncio.run(_main(args))
+    print(f"{messung.sitzungen} Sitzungen, {len(messung.befehle)} Befehle in {sekunden:.2f} s, "
+          f"{messung.fehler} Fehler")
+
+    aktuell = als_json(auswerten(messung, sekunden),
+                       meta(sitzungen=args.sitzungen, parallel=args.parallel, befehle=args.befehle))
+    status = berichten(aktuell, args.baseline, args.out, args.toleranz)
+    return status or (1 if messung.fehler else 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
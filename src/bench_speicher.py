@@ -0,0 +1,76 @@
+# bench_speicher.py
+"""
+Speicher-Benchmark: legt viele NPCs und Räume an und misst Bytes pro Objekt.
+Verglichen werden die alten dict-basierten Modelle (Nachbau unten) mit den
+kompakten __slots__-Modellen aus person.py / raum.py.
+
+    python bench_speicher.py --count 100000
+"""
+import argparse
+import gc
+import tracemalloc
+
+from person import Person
+from raum import Raum
+
+
+class AltePerson:
+    """Person wie vor der Umstellung (dict-basiert, unbegrenzte dialog_history)."""
+    def __init__(self, name, rolle, beschreibung, rede_lust=5):
+        self.name = name
+        self.rolle = rolle
+        self.beschreibung = beschreibung
+        self.dialog_history = []
+        self.relationship = 0
+        self.rede_lust = rede_lust
+
+
+class AlterRaum:
+    """Raum wie vor der Umstellung (dict-basiert, vier eigene Listen)."""
+    def __init__(self, name, beschreibung, aufgaben=None, personen=None, gegenstaende=None, verbindungen=None):
+        self.name = name
+        self.beschreibung = beschreibung
+        self.aufgaben = aufgaben if aufgaben is not None else []
+        self.personen = personen if personen is not None else []
+        self.gegenstaende = gegenstaende if gegenstaende is not None else []
+        self.verbindungen = verbindungen if verbindungen is not None else []
+
+
+def messen(factory, count: int) -> float:
+    """Bytes pro Objekt, das factory(i) erzeugt (ohne die geteilten Strings)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Die Liste selbst nicht mitzählen
+    per_obj = (after - before - objs.__sizeof__()) / count
+    del objs
+    return per_obj
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Speicher pro NPC/Raum")
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args(argv)
+    n = args.count
+
+    # Texte vorab anlegen, damit nur die Objekte selbst gemessen werden
+    rollen = ["Teamleiter", "Entwickler", "Projektmanager"]
+    beschreibung = "Ein ganz normaler Mensch im Büro."
+    raum_text = "Ein Raum mit Tischen."
+
+    ergebnisse = [
+        ("Person (alt)", messen(lambda i: AltePerson("NPC", rollen[i % 3], beschreibung), n)),
+        ("Person (neu)", messen(lambda i: Person("NPC", rollen[i % 3], beschreibung), n)),
+        ("Raum (alt)", messen(lambda i: AlterRaum("Büro", raum_text), n)),
+        ("Raum (neu)", messen(lambda i: Raum("Büro", raum_text), n)),
+    ]
+    print(f"{n} Objekte je Typ")
+    for name, per_obj in ergebnisse:
+        print(f"{name:<14} {per_obj:8.1f} Bytes/Objekt  ({per_obj * n / 1024 / 1024:6.1f} MiB gesamt)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# bench_welt.py
+"""
+Benchmark: synthetische große Welt laden und darin herumlaufen.
+
+    python bench_welt.py --rooms 10000 --moves 100000
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from engine import Engine
+from welt import Welt
+
+
+def synthetische_welt(rooms: int, exits: int = 4, people_every: int = 10, seed: int = 0) -> dict:
+    """Räume entlang eines Flurs (raum_i <-> raum_i+1) plus zufällige Querverbindungen."""
+    rng = random.Random(seed)
+    raeume = {}
+    personen = {}
+    for i in range(rooms):
+        verbindungen = set()
+        if i > 0:
+            verbindungen.add(f"raum_{i - 1}")
+        if i < rooms - 1:
+            verbindungen.add(f"raum_{i + 1}")
+        raeume[f"raum_{i}"] = {"name": f"Raum {i}", "beschreibung": f"Synthetischer Raum Nummer {i}.",
+                               "verbindungen": verbindungen, "personen": []}
+    for i in range(rooms):
+        for _ in range(exits - 2):
+            j = rng.randrange(rooms)
+            if j != i:
+                raeume[f"raum_{i}"]["verbindungen"].add(f"raum_{j}")
+                raeume[f"raum_{j}"]["verbindungen"].add(f"raum_{i}")
+        if i % people_every == 0:
+            key = f"person_{i}"
+            personen[key] = {"name": f"Person {i}", "rolle": "NPC", "beschreibung": "Statist.", "rede_lust": i % 10}
+            raeume[f"raum_{i}"]["personen"].append(key)
+    for d in raeume.values():
+        d["verbindungen"] = sorted(d["verbindungen"])
+    return {"start": "raum_0", "personen": personen, "raeume": raeume}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark für große Welten")
+    parser.add_argument("--rooms", type=int, default=10000)
+    parser.add_argument("--moves", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    daten = synthetische_welt(args.rooms)
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+        json.dump(daten, f)
+        pfad = f.name
+    try:
+        t0 = time.perf_counter()
+        welt = Welt.laden(pfad)
+        t_load = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        engine = Engine(welt)
+        t_start = time.perf_counter() - t0
+
+        rng = random.Random(1)
+        t0 = time.perf_counter()
+        for _ in range(args.moves):
+            ziel = rng.choice(sorted(welt.adjazenz[engine.raum_key]))
+            engine.move(welt.raeume[ziel].name)
+        t_moves = time.perf_counter() - t0
+    finally:
+        os.unlink(pfad)
+
+    print(f"Räume:              {len(welt.raeume)}")
+    print(f"Welt laden:         {t_load * 1000:.1f} ms")
+    print(f"Engine starten:     {t_start * 1000:.3f} ms")
+    print(f"{args.moves} Züge:    {t_moves * 1000:.1f} ms ({t_moves / args.moves * 1e6:.2f} µs/Zug)")
+    print(f"Gebaute Räume:      {len(welt.raeume.materialisiert())}")
+
+
+if __name__ == "__main__":
+    main()
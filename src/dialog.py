@@ -0,0 +1,249 @@
+# dialog.py
+"""
+Datengetriebene Dialoge: je Person ein Dialoggraph aus einer JSON-Datei im
+Ordner dialoge/ neben der Weltdatei (Name = Personen-Schlüssel oder "dialog"
+in der Weltdatei; fehlt die Datei, gilt _standard.json):
+
+    {
+      "start": "hallo",
+      "knoten": {
+        "hallo": {"text": "Hallo! Möchtest du etwas für mich erledigen?",
+                  "optionen": [
+                    {"antwort": "ja", "ziel": "ja"},
+                    {"antwort": "smalltalk", "label": "Smalltalk", "ziel": "plaudern", "wenn": {"rede_lust": "> 3"}},
+                    {"antwort": "smalltalk", "label": "Smalltalk", "ziel": "knapp"}
+                  ],
+                  "sonst": "okay"},
+        "ja": {"text": "Super!", "ausdruck": "Happy", "effekte": [{"aufgabe": true}, {"beziehung": 2}]},
+        ...
+      }
+    }
+
+"label" ist die Beschriftung für Buttons und Prompt (Standard: die Antwort;
+auch sie wird als Eingabe akzeptiert). Optionen mit derselben Antwort werden
+der Reihe nach geprüft, die erste, deren Bedingungen ("wenn": beziehung /
+rede_lust mit <, <=, >, >=, ==, !=) passen, gewinnt. "sonst" fängt alle
+anderen Antworten ab; ist gerade keine Option möglich, wird er als Antwort
+"weiter" angeboten. Ein Knoten, an dem keine Antwort möglich ist (keine
+passende Option, kein "sonst"), beendet das Gespräch. Effekte:
+{"beziehung": n} ändert die Beziehung, {"aufgabe": true} vergibt die Aufgabe
+der Person aus der Weltdatei, {"aufgabe": {"name": ..., "beschreibung": ...,
+"raum": ...}} eine eigene (raum muss ein Raum-Schlüssel der Welt sein).
+
+Beim Laden wird eine Datei einmal zu Knoten-Objekten kompiliert: Ziele sind
+direkte Verweise, Antworten internierte Strings in einem Dict – ein Schritt
+kostet O(1). Dateien werden erst beim ersten Gespräch mit der Person gelesen
+und in einem LRU-Cache gehalten; Startzeit und Speicher hängen also nicht
+davon ab, wie viel Dialog insgesamt auf der Platte liegt.
+"""
+import gc
+import json
+import operator
+import os
+import sys
+from collections import OrderedDict
+from typing import Callable, Container, Dict, List, Optional, Tuple
+
+DEFAULT_DIALOGE = os.path.join(os.path.dirname(__file__), "../data/dialoge")
+STANDARD = "_standard"
+# Angebotene Antwort, wenn keine Option passt, der Knoten aber ein "sonst" hat
+WEITER = "weiter"
+
+_VERGLEICHE: Dict[str, Callable[[int, int], bool]] = {
+    "<=": operator.le, ">=": operator.ge, "==": operator.eq, "!=": operator.ne,
+    "<": operator.lt, ">": operator.gt,
+}
+# Bedingungs-Name in der Datei -> Attribut der Person
+_ATTRIBUTE = {"beziehung": "relationship", "rede_lust": "rede_lust"}
+_EFFEKTE = ("beziehung", "aufgabe")
+
+# (Attribut, Vergleich, Wert)
+Bedingung = Tuple[str, Callable[[int, int], bool], int]
+# (Art, Wert) – Art ist "beziehung" oder "aufgabe"
+Effekt = Tuple[str, object]
+
+
+class Knoten:
+    __slots__ = ("id", "text", "ausdruck", "effekte", "optionen", "uebergaenge", "sonst")
+
+    def __init__(self, knoten_id: str, text: str, ausdruck: Optional[str], effekte: Tuple[Effekt, ...]):
+        self.id = knoten_id
+        self.text = text
+        # Portrait-Ausdruck für diesen Knoten (None = nach Beziehung)
+        self.ausdruck = ausdruck
+        self.effekte = effekte
+        # (Antwort, Beschriftung, Bedingungen) in Datei-Reihenfolge, für Buttons und Prompt
+        self.optionen: Tuple[Tuple[str, str, Tuple[Bedingung, ...]], ...] = ()
+        # Antwort -> ((Bedingungen, Ziel), ...)
+        self.uebergaenge: Dict[str, Tuple[Tuple[Tuple[Bedingung, ...], "Knoten"], ...]] = {}
+        self.sonst: Optional["Knoten"] = None
+
+    def weiter(self, antwort: str, person) -> Optional["Knoten"]:
+        """Ziel für antwort (normalisiert) bei dieser Person; None, wenn nichts passt."""
+        for bedingungen, ziel in self.uebergaenge.get(antwort, ()):
+            if _erfuellt(bedingungen, person):
+                return ziel
+        return self.sonst
+
+    def antworten(self, person) -> List[Tuple[str, str]]:
+        """Gerade mögliche (Antwort, Beschriftung) – jede Antwort einmal; leer = Gespräch zu Ende."""
+        gesehen = set()
+        moeglich = []
+        for antwort, label, bedingungen in self.optionen:
+            if antwort not in gesehen and _erfuellt(bedingungen, person):
+                gesehen.add(antwort)
+                moeglich.append((antwort, label))
+        if not moeglich and self.sonst is not None:
+            # Alles gesperrt, aber es gibt einen Ausweg: den anbieten statt festzuhängen
+            moeglich.append((WEITER, WEITER))
+        return moeglich
+
+    def __repr__(self):
+        return f"Knoten({self.id!r})"
+
+
+def _erfuellt(bedingungen: Tuple[Bedingung, ...], person) -> bool:
+    for attribut, vergleich, wert in bedingungen:
+        if not vergleich(getattr(person, attribut), wert):
+            return False
+    return True
+
+
+class DialogGraph:
+    __slots__ = ("name", "start", "knoten")
+
+    def __init__(self, name: str, start: Knoten, knoten: Dict[str, Knoten]):
+        self.name = name
+        self.start = start
+        self.knoten = knoten
+
+    def __len__(self):
+        return len(self.knoten)
+
+
+# ---------------------------------------------------------------------- Kompilieren
+
+def kompilieren(daten: dict, name: str = "", raeume: Optional[Container[str]] = None) -> DialogGraph:
+    """
+    Dialogdatei (geparstes JSON) in Knoten mit direkten Verweisen übersetzen; Fehler → ValueError.
+    raeume: gültige Raum-Schlüssel für eigene Aufgaben (None = nicht prüfen).
+    """
+    roh: Dict[str, dict] = daten.get("knoten", {})
+    if not roh:
+        raise ValueError(f"Dialog {name}: keine Knoten.")
+    knoten = {sys.intern(k): Knoten(sys.intern(k), d.get("text", ""), d.get("ausdruck"),
+                                    tuple(_effekt(e, name, k, raeume) for e in d.get("effekte", ())))
+              for k, d in roh.items()}
+
+    def ziel(knoten_id: str, von: str) -> Knoten:
+        if knoten_id not in knoten:
+            raise ValueError(f"Dialog {name}: Knoten {von!r} verweist auf unbekannten Knoten {knoten_id!r}.")
+        return knoten[knoten_id]
+
+    for k, d in roh.items():
+        kn = knoten[k]
+        optionen = []
+        uebergaenge: Dict[str, list] = {}
+        for o in d.get("optionen", ()):
+            antwort = sys.intern(o["antwort"].strip().lower())
+            bedingungen = tuple(_bedingung(attr, ausdruck, name, k) for attr, ausdruck in o.get("wenn", {}).items())
+            label = o.get("label", antwort)
+            optionen.append((antwort, label, bedingungen))
+            uebergang = (bedingungen, ziel(o["ziel"], k))
+            uebergaenge.setdefault(antwort, []).append(uebergang)
+            # Wer die Beschriftung eintippt, meint dieselbe Antwort
+            if label.strip().lower() != antwort:
+                uebergaenge.setdefault(sys.intern(label.strip().lower()), []).append(uebergang)
+        kn.optionen = tuple(optionen)
+        kn.uebergaenge = {a: tuple(u) for a, u in uebergaenge.items()}
+        if d.get("sonst"):
+            kn.sonst = ziel(d["sonst"], k)
+    start = daten.get("start") or next(iter(roh))
+    return DialogGraph(name, ziel(start, "start"), knoten)
+
+
+def _bedingung(attr: str, ausdruck, name: str, knoten_id: str) -> Bedingung:
+    if attr not in _ATTRIBUTE:
+        raise ValueError(f"Dialog {name}, Knoten {knoten_id!r}: unbekannte Bedingung {attr!r}.")
+    if isinstance(ausdruck, int):
+        return _ATTRIBUTE[attr], operator.eq, ausdruck
+    text = str(ausdruck).strip()
+    # Zweizeichen-Vergleiche zuerst, sonst würde "<=" als "<" gelesen
+    for zeichen, vergleich in _VERGLEICHE.items():
+        if text.startswith(zeichen):
+            return _ATTRIBUTE[attr], vergleich, int(text[len(zeichen):])
+    raise ValueError(f"Dialog {name}, Knoten {knoten_id!r}: ungültiger Vergleich {ausdruck!r}.")
+
+
+def _effekt(effekt: dict, name: str, knoten_id: str, raeume: Optional[Container[str]]) -> Effekt:
+    if len(effekt) != 1 or next(iter(effekt)) not in _EFFEKTE:
+        raise ValueError(f"Dialog {name}, Knoten {knoten_id!r}: unbekannter Effekt {effekt!r}.")
+    art, wert = next(iter(effekt.items()))
+    if art == "beziehung":
+        wert = int(wert)
+    elif wert is not True:
+        _aufgabe_pruefen(wert, name, knoten_id, raeume)
+    return sys.intern(art), wert
+
+
+def _aufgabe_pruefen(vorlage, name: str, knoten_id: str, raeume: Optional[Container[str]]):
+    """Eigene Aufgabe: name und raum Pflicht, beschreibung optional – sonst scheitert sie erst mitten im Gespräch."""
+    fehler = f"Dialog {name}, Knoten {knoten_id!r}: ungültige Aufgabe {vorlage!r}"
+    if not isinstance(vorlage, dict):
+        raise ValueError(f"{fehler} (erwartet true oder {{\"name\", \"raum\", ...}}).")
+    for feld in ("name", "raum"):
+        if not isinstance(vorlage.get(feld), str) or not vorlage[feld]:
+            raise ValueError(f"{fehler} (\"{feld}\" fehlt).")
+    if not isinstance(vorlage.get("beschreibung", ""), str):
+        raise ValueError(f"{fehler} (\"beschreibung\" ist kein Text).")
+    if raeume is not None and vorlage["raum"] not in raeume:
+        raise ValueError(f"{fehler} (unbekannter Raum {vorlage['raum']!r}).")
+
+
+# ---------------------------------------------------------------------- Laden
+
+class DialogBibliothek:
+    """
+    Lädt Dialogdateien aus ordner erst bei Bedarf und hält höchstens
+    max_graphen kompilierte Graphen (LRU). Wird von allen Sitzungen einer
+    Welt geteilt – die Graphen selbst werden nie verändert. raeume: gültige
+    Raum-Schlüssel der Welt, gegen die eigene Aufgaben beim Laden geprüft werden.
+    """
+    def __init__(self, ordner: str = DEFAULT_DIALOGE, max_graphen: int = 64,
+                 raeume: Optional[Container[str]] = None):
+        self.ordner = ordner
+        self.max_graphen = max_graphen
+        self.raeume = raeume
+        self._graphen: "OrderedDict[str, DialogGraph]" = OrderedDict()
+        self.geladen = 0
+
+    def __len__(self):
+        return len(self._graphen)
+
+    def graph(self, name: str) -> DialogGraph:
+        """Graph für die Datei name (ohne .json); fehlt sie, der Standard-Dialog."""
+        graph = self._graphen.get(name)
+        if graph is not None:
+            self._graphen.move_to_end(name)
+            return graph
+        pfad = os.path.join(self.ordner, name + ".json")
+        if name != STANDARD and not os.path.exists(pfad):
+            graph = self.graph(STANDARD)
+        else:
+            # Ein Graph sind tausende neue Container: ohne GC-Läufe mittendrin keine Ausreißer beim ersten Gespräch
+            gc_an = gc.isenabled()
+            gc.disable()
+            try:
+                with open(pfad, encoding="utf-8") as f:
+                    graph = kompilieren(json.load(f), name, self.raeume)
+            finally:
+                if gc_an:
+                    gc.enable()
+            self.geladen += 1
+        self._graphen[name] = graph
+        if len(self._graphen) > self.max_graphen:
+            self._graphen.popitem(last=False)
+        return graph
+
+    def clear(self):
+        self._graphen.clear()
@@ -0,0 +1,61 @@
+# dirty.py
+from typing import List
+
+import pygame
+
+
+class DirtyTracker:
+    """
+    Sammelt Bildschirmbereiche, die sich seit dem letzten Frame geändert haben.
+    Widgets melden sich mit mark(rect); GameApp zeichnet dann nur diese
+    Bereiche neu und schiebt sie per pygame.display.update(rects) raus.
+    """
+    def __init__(self):
+        self._rects: List[pygame.Rect] = []
+        self._full = False
+
+    def __bool__(self):
+        return self._full or bool(self._rects)
+
+    def mark(self, rect: pygame.Rect):
+        if not self._full:
+            self._rects.append(pygame.Rect(rect))
+
+    def mark_all(self):
+        self._full = True
+        self._rects.clear()
+
+    def clear(self):
+        self._full = False
+        self._rects.clear()
+
+    def pop(self, screen_rect: pygame.Rect) -> List[pygame.Rect]:
+        """Liefert die (zusammengefassten) schmutzigen Bereiche und setzt den Tracker zurück."""
+        if self._full:
+            rects = [pygame.Rect(screen_rect)]
+        else:
+            rects = merge_rects(r.clip(screen_rect) for r in self._rects)
+        self.clear()
+        return [r for r in rects if r.width and r.height]
+
+
+def merge_rects(rects) -> List[pygame.Rect]:
+    """Fasst überlappende Rechtecke zu ihrer Bounding-Box zusammen."""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        cur = pygame.Rect(rect)
+        changed = True
+        while changed:
+            changed = False
+            for other in merged:
+                if cur.colliderect(other):
+                    cur.union_ip(other)
+                    merged.remove(other)
+                    changed = True
+                    break
+        merged.append(cur)
+    return merged
+
+
+# Gemeinsamer Tracker für alle Widgets
+DIRTY = DirtyTracker()
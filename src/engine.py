@@ -0,0 +1,256 @@
+# engine.py
+from typing import List, Optional, Tuple
+
+from aufgabe import Aufgabe
+from dialog import Knoten
+from navigation import Navigator
+from person import Person
+from raum import Raum
+from setup import Setup
+from welt import Welt
+from zeitplan import Bewegung, Zeitplan
+
+
+class ActionResult:
+    """Ergebnis einer Spielaktion: Erfolg + Textzeilen, die das Frontend anzeigt."""
+    def __init__(self, ok: bool, messages: Optional[List[str]] = None, aufgabe: Optional[Aufgabe] = None,
+                 ausdruck: Optional[str] = None):
+        self.ok = ok
+        self.messages = messages if messages is not None else []
+        self.aufgabe = aufgabe
+        # Portrait-Ausdruck, den der Dialog vorgibt (None = Frontend entscheidet)
+        self.ausdruck = ausdruck
+
+    def __bool__(self):
+        return self.ok
+
+    def __repr__(self):
+        return f"ActionResult(ok={self.ok}, messages={self.messages!r})"
+
+
+class Engine:
+    """
+    Reine Spiellogik ohne pygame, print() oder input().
+    Terminal-Spiel (Spiel), Pygame-Frontend (GameApp) und der Simulations-Runner
+    rufen dieselben Aktionen auf und zeigen die zurückgegebenen Meldungen an.
+    """
+    def __init__(self, welt: Optional[Welt] = None, start: Optional[str] = None):
+        self.welt = welt if welt is not None else Setup().welt_laden()
+        self.personen = self.welt.personen
+        self.raeume = self.welt.raeume
+        # Schlüssel des aktuellen Raums (z. B. "flur")
+        self.raum_key: str = start or self.welt.start
+        self.aktueller_raum: Raum = self.raeume[self.raum_key]
+        # Kürzeste Wege für Auto-Reisen
+        self.navigation = Navigator(self.welt)
+        # Änderungsprotokoll für den Autosave (None = aus, siehe spielstand.Autosaver)
+        self.journal: Optional[List[tuple]] = None
+        self.welt.aufgaben.bei_aenderung(self._aufgabe_geaendert)
+        self.welt.bei_aenderung(self._kante_geaendert)
+        # Tagesablauf der NPCs; entsteht erst, wenn zum ersten Mal Zeit vergeht
+        self._zeitplan: Optional[Zeitplan] = None
+        # Person, mit der gerade gesprochen wird (zwischen talk() und answer()), und Stand im Dialoggraphen
+        self.active_person: Optional[Person] = None
+        self.dialog_knoten: Optional[Knoten] = None
+        # Zähler für Auswertungen
+        self.moves = 0
+        self.tasks_created = 0
+        self.tasks_done = 0
+
+    # ------------------------------------------------------------------ Aktionen
+
+    def move(self, neuer_raum: str) -> ActionResult:
+        """Wechselt den Raum, wenn eine Verbindung existiert (Name oder Schlüssel, O(1))."""
+        key = self.welt.raum_key(neuer_raum)
+        if key is None or not self.welt.ist_verbunden(self.raum_key, key):
+            return ActionResult(False, ["Du kannst nicht dorthin gehen."])
+        self.raum_key = key
+        self.aktueller_raum = self.raeume[key]
+        self.active_person = None
+        self.dialog_knoten = None
+        self.moves += 1
+        self._aufzeichnen("raum", key)
+        self._zaehler_aufzeichnen()
+        return ActionResult(True, [f"Du bist jetzt im {self.aktueller_raum.name}."])
+
+    def talk(self, person: Person) -> ActionResult:
+        """Gespräch beginnen (Startknoten des Dialogs der Person); die Antworten folgen mit answer()."""
+        if person not in self.aktueller_raum.personen:
+            return ActionResult(False, [f"{person.name} ist nicht hier."])
+        graph = self.welt.dialoge.graph(self.welt.dialog_datei(self.welt.person_key(person)))
+        self.active_person = person
+        return self._knoten_betreten(person, graph.start)
+
+    def answer(self, antwort: str) -> ActionResult:
+        """Antwort auf das laufende Gespräch; mögliche Antworten liefert antworten()."""
+        p = self.active_person
+        if p is None:
+            return ActionResult(False, ["Du sprichst gerade mit niemandem."])
+        ans = antwort.strip().lower()
+        ziel = self.dialog_knoten.weiter(ans, p)
+        if ziel is None:
+            # Keine passende Option und kein "sonst": Gespräch bleibt offen
+            return ActionResult(False, [f"{p.name}: \"Wie bitte?\""])
+        p.merke_antwort(ans)
+        self._aufzeichnen("antwort", self.welt.person_key(p), ans)
+        return self._knoten_betreten(p, ziel)
+
+    def antworten(self) -> List[Tuple[str, str]]:
+        """(Antwort, Beschriftung) der gerade möglichen Antworten; leer, wenn kein Gespräch läuft."""
+        if self.dialog_knoten is None:
+            return []
+        return self.dialog_knoten.antworten(self.active_person)
+
+    def _knoten_betreten(self, p: Person, knoten: Knoten) -> ActionResult:
+        """Text und Effekte eines Dialogknotens; ist danach keine Antwort möglich, endet das Gespräch."""
+        result = ActionResult(True, [f"{p.name}: \"{knoten.text}\""], ausdruck=knoten.ausdruck)
+        for art, wert in knoten.effekte:
+            if art == "aufgabe":
+                accepted = self.accept_task(p, None if wert is True else wert)
+                result.messages.extend(accepted.messages)
+                result.aufgabe = accepted.aufgabe or result.aufgabe
+            else:
+                p.relationship += wert
+                self._aufzeichnen("beziehung", self.welt.person_key(p), p.relationship)
+                result.messages.append(f"(Beziehung zu {p.name} {wert:+d} → {p.relationship})")
+        if not knoten.antworten(p):
+            self.active_person = None
+            self.dialog_knoten = None
+        else:
+            self.dialog_knoten = knoten
+        return result
+
+    def travel(self, ziel: str) -> ActionResult:
+        """Auto-Reise: läuft den kürzesten Weg zum Zielraum (Name oder Schlüssel) Raum für Raum ab."""
+        route = self.route_to(ziel)
+        if route is None:
+            return ActionResult(False, ["Dorthin führt kein Weg."])
+        result = ActionResult(True)
+        for key in route[1:]:
+            schritt = self.move(key)
+            result.messages.extend(schritt.messages)
+            if not schritt:
+                result.ok = False
+                break
+        return result
+
+    def travel_to_task(self, aufgabe_id: int) -> ActionResult:
+        aufgabe = self.welt.aufgaben.get(aufgabe_id)
+        if aufgabe is None:
+            return ActionResult(False, ["Ungültige Aufgaben-ID."])
+        return self.travel(aufgabe.raum)
+
+    def accept_task(self, person: Person, vorlage: Optional[dict] = None) -> ActionResult:
+        """Erzeugt die Aufgabe (Standard: die der Person aus der Weltdatei) und legt sie im passenden Raum ab."""
+        if vorlage is None:
+            vorlage = self.welt.aufgaben_vorlagen.get(person.name)
+        if vorlage is None:
+            return ActionResult(False, [f"{person.name} hat aktuell keine Aufgabe für dich."])
+        neue_aufgabe = self.welt.aufgaben.add(vorlage["name"], vorlage.get("beschreibung", ""),
+                                              vorlage["raum"], geber=person.name)
+        self.tasks_created += 1
+        self._zaehler_aufzeichnen()
+        return ActionResult(True, [f"{person.name} gibt dir die Aufgabe: [{neue_aufgabe.id}] {neue_aufgabe.name}"],
+                            aufgabe=neue_aufgabe)
+
+    def execute_task(self, aufgabe_id: int) -> ActionResult:
+        """Führt eine Aufgabe im aktuellen Raum aus und entfernt sie."""
+        aufgabe = self.welt.aufgaben.get(aufgabe_id)
+        if aufgabe is None or aufgabe.raum != self.raum_key:
+            return ActionResult(False, ["Ungültige Aufgaben-ID oder Aufgabe nicht in diesem Raum."])
+        self.welt.aufgaben.complete(aufgabe_id)
+        self.tasks_done += 1
+        self._zaehler_aufzeichnen()
+        return ActionResult(True, [f"Aufgabe '{aufgabe.name}' ausgeführt!"], aufgabe=aufgabe)
+
+    @property
+    def zeitplan(self) -> Zeitplan:
+        if self._zeitplan is None:
+            self._zeitplan = Zeitplan(self.welt, self.navigation)
+        return self._zeitplan
+
+    @property
+    def zeit(self) -> int:
+        """Spielzeit in Minuten seit Beginn."""
+        return self._zeitplan.zeit if self._zeitplan is not None else 0
+
+    def zeit_vergeht(self, minuten: int = 1) -> List[Bewegung]:
+        return self.zeit_bis(self.zeit + minuten)
+
+    def zeit_bis(self, zeit: int) -> List[Bewegung]:
+        """Welt bis zur Minute zeit weiterlaufen lassen; wer gerade im Gespräch ist, bleibt stehen."""
+        if zeit <= self.zeit:
+            return []
+        halten = self.welt.person_key(self.active_person) if self.active_person is not None else None
+        zeitplan = self.zeitplan
+        bewegungen = zeitplan.vorruecken(zeit, halten)
+        if self.journal is not None:
+            self._aufzeichnen("zeit", zeit)
+            for b in bewegungen:
+                npc = zeitplan.npcs[b.person]
+                self._aufzeichnen("npc", b.person, b.nach, npc.stop, npc.faellig)
+        return bewegungen
+
+    def bewegungen_hier(self, bewegungen: List[Bewegung]) -> List[str]:
+        """Meldungen für Personen, die den aktuellen Raum betreten oder verlassen haben."""
+        lines = []
+        for b in bewegungen:
+            if b.nach == self.raum_key:
+                lines.append(f"{self.personen[b.person].name} kommt herein.")
+            elif b.von == self.raum_key:
+                lines.append(f"{self.personen[b.person].name} geht Richtung {self.raeume[b.nach].name}.")
+        return lines
+
+    def aufgaben_hier(self) -> List[Aufgabe]:
+        """Offene Aufgaben im aktuellen Raum (aus dem Register-Index)."""
+        return self.welt.aufgaben.in_raum(self.raum_key)
+
+    # ------------------------------------------------------------------ Journal
+
+    def _aufzeichnen(self, *eintrag):
+        if self.journal is not None:
+            self.journal.append(eintrag)
+
+    def _zaehler_aufzeichnen(self):
+        self._aufzeichnen("zaehler", self.moves, self.tasks_created, self.tasks_done)
+
+    def _aufgabe_geaendert(self, aufgabe: Aufgabe, hinzugefuegt: bool):
+        if hinzugefuegt:
+            self._aufzeichnen("aufgabe+", aufgabe.id, aufgabe.name, aufgabe.beschreibung, aufgabe.raum, aufgabe.geber)
+        else:
+            self._aufzeichnen("aufgabe-", aufgabe.id)
+
+    def _kante_geaendert(self, von: str, nach: str, hinzugefuegt: bool):
+        self._aufzeichnen("kante+" if hinzugefuegt else "kante-", von, nach)
+
+    # ------------------------------------------------------------------ Abfragen
+
+    def route_to(self, ziel: str) -> Optional[List[str]]:
+        """Kürzester Weg (Raum-Schlüssel, inkl. aktuellem Raum) zum Ziel oder None."""
+        key = self.welt.raum_key(ziel)
+        if key is None:
+            return None
+        return self.navigation.route(self.raum_key, key)
+
+    def route_to_task(self, aufgabe_id: int) -> Optional[List[str]]:
+        return self.navigation.route_zur_aufgabe(self.raum_key, aufgabe_id)
+
+    def person_by_name(self, name: str) -> Optional[Person]:
+        """Person im aktuellen Raum anhand des Namens (Groß-/Kleinschreibung egal)."""
+        name = name.lower()
+        for person in self.aktueller_raum.personen:
+            if person.name.lower() == name:
+                return person
+        return None
+
+    def describe_room(self) -> List[str]:
+        """Beschreibung des aktuellen Raums als Textzeilen."""
+        raum = self.aktueller_raum
+        lines = [f"Du befindest dich im {raum.name}.", raum.beschreibung]
+        if raum.personen:
+            lines.append("Personen hier: " + ", ".join(f"{p.name} ({p.rolle})" for p in raum.personen))
+        if raum.verbindungen:
+            lines.append("Ausgänge: " + ", ".join(r.name for r in raum.verbindungen))
+        for aufgabe in self.aufgaben_hier():
+            lines.append(f"Aufgabe: {aufgabe}")
+        return lines
@@ -0,0 +1,112 @@
+# fonts.py
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+# Aufgelöste Schriftpfade überleben den Neustart (pygame.font.match_font scannt sonst jedes Mal das System)
+FONT_PATH_CACHE = os.path.join(os.path.dirname(__file__), "../.cache/font_paths.json")
+
+
+class FontRegistry:
+    """
+    Löst Systemschriften erst bei Bedarf auf und hält fertige Font-Objekte je
+    (Name, Größe). Der Pfad zu einem Schriftnamen wird in einer kleinen
+    JSON-Datei gespeichert; beim nächsten Start entfällt der System-Scan,
+    solange die Datei noch existiert. None bedeutet: pygame-Standardschrift.
+    """
+    def __init__(self, cache_file: Optional[str] = FONT_PATH_CACHE):
+        self.cache_file = cache_file
+        self._pfade: Optional[Dict[str, Optional[str]]] = None
+        self._fonts: Dict[Tuple[str, int], pygame.font.Font] = {}
+        # Steigt bei reset(); LazyFonts mit älterer Generation holen ihre Schrift neu
+        self.generation = 0
+        self.scans = 0
+
+    def get(self, name: str, size: int) -> pygame.font.Font:
+        font = self._fonts.get((name, size))
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(self.pfad(name), size)
+            self._fonts[(name, size)] = font
+        return font
+
+    def reset(self):
+        """
+        Font-Objekte verwerfen (nach pygame.quit() sind sie ungültig), Pfade
+        behalten. Danach baut jede LazyFont ihre Schrift beim nächsten Zugriff neu.
+        """
+        self._fonts.clear()
+        self.generation += 1
+
+    def pfad(self, name: str) -> Optional[str]:
+        pfade = self._geladene_pfade()
+        if name in pfade:
+            pfad = pfade[name]
+            if pfad is None or os.path.exists(pfad):
+                return pfad
+        # Unbekannt oder Datei verschwunden → einmal scannen und merken
+        self.scans += 1
+        pfad = pygame.font.match_font(name)
+        pfade[name] = pfad
+        self._speichern()
+        return pfad
+
+    def _geladene_pfade(self) -> Dict[str, Optional[str]]:
+        if self._pfade is None:
+            self._pfade = {}
+            if self.cache_file:
+                try:
+                    with open(self.cache_file, encoding="utf-8") as f:
+                        self._pfade = json.load(f)
+                except (OSError, ValueError):
+                    pass
+        return self._pfade
+
+    def _speichern(self):
+        if not self.cache_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp = self.cache_file + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._pfade, f, indent=1)
+            os.replace(tmp, self.cache_file)
+        except OSError:
+            # Schreibgeschütztes Verzeichnis (Kiosk): dann eben beim nächsten Start wieder scannen
+            pass
+
+
+FONTS = FontRegistry()
+
+
+class LazyFont:
+    """
+    Platzhalter für eine Schrift, der sich wie pygame.font.Font verhält.
+    Erst beim ersten Zugriff (render, size, ...) wird die Schrift aufgelöst,
+    so dass der Import des Moduls keinen Font-Scan auslöst.
+    """
+    # Nicht "size" nennen: Font.size(text) muss durchgereicht werden
+    __slots__ = ("_name", "_groesse", "_font", "_generation")
+
+    def __init__(self, name: str, groesse: int):
+        self._name = name
+        self._groesse = groesse
+        self._font: Optional[pygame.font.Font] = None
+        self._generation = -1
+
+    @property
+    def font(self) -> pygame.font.Font:
+        if self._font is None or self._generation != FONTS.generation:
+            self._font = FONTS.get(self._name, self._groesse)
+            self._generation = FONTS.generation
+        return self._font
+
+    def render(self, text, antialias, color, background=None) -> pygame.Surface:
+        return self.font.render(text, antialias, color, background)
+
+    def __getattr__(self, attr):
+        # size(), metrics(), get_height(), ... direkt an die echte Schrift
+        return getattr(self.font, attr)
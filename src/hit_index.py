@@ -0,0 +1,48 @@
+# hit_index.py
+from collections import defaultdict
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+import pygame
+
+T = TypeVar("T")
+
+
+class HitIndex(Generic[T]):
+    """
+    Gleichmäßiges Raster über die Rechtecke der Widgets (Attribut .rect).
+    Statt jedes Maus-Event an alle Buttons zu schicken, fragt GameApp hier
+    nach dem Widget unter dem Cursor – Kosten O(Widgets in einer Zelle).
+    Später eingefügte Widgets liegen "oben" (wie beim Zeichnen).
+    """
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[T]] = defaultdict(list)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def build(self, widgets: Iterable[T]):
+        """Index komplett neu aufbauen (nur bei Layout-Änderungen nötig)."""
+        self._cells.clear()
+        self._count = 0
+        for widget in widgets:
+            self.insert(widget)
+
+    def insert(self, widget: T):
+        rect: pygame.Rect = widget.rect
+        cs = self.cell_size
+        for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                self._cells[(cx, cy)].append(widget)
+        self._count += 1
+
+    def query(self, pos: Tuple[int, int]) -> Optional[T]:
+        """Oberstes Widget an pos oder None."""
+        cell = self._cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if not cell:
+            return None
+        for widget in reversed(cell):
+            if widget.rect.collidepoint(pos):
+                return widget
+        return None
@@ -0,0 +1,82 @@
+# kompakt.py
+from typing import Callable
+
+# Gemeinsamer Platzhalter für leere Listen in Modell-Objekten
+LEER = ()
+
+
+class LeereListe:
+    """
+    Kurzlebige Sicht auf ein noch leeres Listen-Attribut.
+    Verhält sich wie eine leere Liste; erst beim ersten append/extend/insert
+    wird im Besitzer-Objekt eine echte Liste (bzw. factory()) angelegt.
+    Bis dahin teilen sich alle Objekte das leere Tupel LEER. Wer die Sicht
+    danach weiter benutzt, arbeitet auf genau dieser Liste.
+    """
+    __slots__ = ("_owner", "_attr", "_factory")
+
+    def __init__(self, owner, attr: str, factory: Callable = list):
+        self._owner = owner
+        self._attr = attr
+        self._factory = factory
+
+    def _wert(self):
+        return getattr(self._owner, self._attr)
+
+    def _real(self):
+        value = self._wert()
+        if value is LEER:
+            value = self._factory()
+            setattr(self._owner, self._attr, value)
+        return value
+
+    def append(self, item):
+        self._real().append(item)
+
+    def extend(self, items):
+        items = list(items)
+        if items:
+            self._real().extend(items)
+
+    def insert(self, index, item):
+        self._real().insert(index, item)
+
+    def remove(self, item):
+        value = self._wert()
+        if value is LEER:
+            raise ValueError("list.remove(x): x not in list")
+        value.remove(item)
+
+    def __len__(self):
+        return len(self._wert())
+
+    def __bool__(self):
+        return len(self._wert()) > 0
+
+    def __iter__(self):
+        return iter(self._wert())
+
+    def __contains__(self, item):
+        return item in self._wert()
+
+    def __getitem__(self, index):
+        return self._wert()[index]
+
+    def __eq__(self, other):
+        value = self._wert()
+        if value is LEER:
+            try:
+                return len(other) == 0
+            except TypeError:
+                return NotImplemented
+        return value == other
+
+    def __repr__(self):
+        value = self._wert()
+        return "[]" if value is LEER else repr(value)
+
+
+def liste(owner, attr: str, factory: Callable = list):
+    """Getter-Helfer: echtes Listen-Attribut oder LeereListe, solange es noch LEER ist."""
+    value = getattr(owner, attr)
+    return LeereListe(owner, attr, factory) if value is LEER else value
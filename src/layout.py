@@ -0,0 +1,141 @@
+# layout.py
+"""
+Layout des Spielfensters: alle Bereiche (Raum, Portrait, Seitenleiste, Log)
+werden aus der Fenstergröße berechnet statt fest für 1280×720 eingetragen.
+Die Listen in der Seitenleiste sind virtualisiert (siehe ListenFenster und
+ScrollList in pygame_game.py); ihre Zeilen werden je Raumzustand einmal
+gebaut und im LayoutCache gehalten.
+"""
+from collections import OrderedDict
+from typing import Callable, Hashable, List, NamedTuple, Tuple
+
+import pygame
+
+from asset_bake import room_size_for
+
+# Eine Listenzeile: (Beschriftung, Wert, der beim Klick übergeben wird; None = nicht anklickbar)
+Zeile = Tuple[str, object]
+
+RAND = 20
+SEITENLEISTE_BREITE = 310
+# Höhenanteile der drei Panels rechts (bei 720 px Höhe genau 280/220/140)
+PANEL_ANTEILE = (280, 220, 140)
+LOG_HOEHE = 160
+# Größter Portrait-Rahmen und sein Abstand zur Oberkante des Raums; in kleinen Fenstern wird beides kleiner
+PORTRAIT_RAHMEN = (320, 420)
+PORTRAIT_OBEN = 120
+# Kleinste sinnvolle Fenstergröße (darunter überlappen sich die Bereiche)
+MIN_FENSTER = (960, 540)
+
+
+class FensterLayout(NamedTuple):
+    raum: pygame.Rect
+    portrait: pygame.Rect
+    personen: pygame.Rect
+    wechseln: pygame.Rect
+    aufgaben: pygame.Rect
+    log: pygame.Rect
+    # Oberkante der (untersten Reihe der) Dialog-Buttons
+    dialog_y: int
+
+
+def fenster_layout(size: Tuple[int, int]) -> FensterLayout:
+    """Alle Bereiche für ein Fenster der Größe size (bei 1280×720 wie bisher fest; nur das Portrait endet am Raum)."""
+    w, h = max(size[0], MIN_FENSTER[0]), max(size[1], MIN_FENSTER[1])
+    raum = pygame.Rect((RAND, RAND), room_size_for((w, h)))
+    # Portrait bleibt im Raum (ragt nicht in den Log), Seitenverhältnis wie PORTRAIT_RAHMEN
+    oben = min(PORTRAIT_OBEN, raum.height // 4)
+    hoehe = min(PORTRAIT_RAHMEN[1], raum.height - oben)
+    breite = PORTRAIT_RAHMEN[0] * hoehe // PORTRAIT_RAHMEN[1]
+    portrait = pygame.Rect(raum.right - breite, raum.y + oben, breite, hoehe)
+
+    x = w - SEITENLEISTE_BREITE - RAND
+    verfuegbar = h - 2 * RAND - RAND * (len(PANEL_ANTEILE) - 1)
+    summe = sum(PANEL_ANTEILE)
+    panels = []
+    y = RAND
+    for i, anteil in enumerate(PANEL_ANTEILE):
+        # Letztes Panel bekommt den Rundungsrest
+        hoehe = verfuegbar * anteil // summe if i < len(PANEL_ANTEILE) - 1 else h - RAND - y
+        panels.append(pygame.Rect(x, y, SEITENLEISTE_BREITE, hoehe))
+        y += hoehe + RAND
+
+    log = pygame.Rect(RAND, h - LOG_HOEHE - RAND, w - SEITENLEISTE_BREITE - 3 * RAND, LOG_HOEHE)
+    return FensterLayout(raum, portrait, panels[0], panels[1], panels[2], log, h - 220)
+
+
+class ListenFenster:
+    """
+    Geometrie einer virtualisierten Liste: Zeilen fester Höhe in einem
+    Bereich, von denen ab erste nur so viele sichtbar sind, wie hineinpassen.
+    Alles O(1) – die Länge der Liste spielt keine Rolle.
+    """
+    def __init__(self, bereich: pygame.Rect, zeilen_hoehe: int, abstand: int):
+        self.bereich = pygame.Rect(bereich)
+        self.zeilen_hoehe = zeilen_hoehe
+        self.abstand = abstand
+        self.erste = 0
+        self.anzahl = 0
+
+    @property
+    def raster(self) -> int:
+        return self.zeilen_hoehe + self.abstand
+
+    @property
+    def kapazitaet(self) -> int:
+        """So viele Zeilen passen vollständig in den Bereich."""
+        return max(0, (self.bereich.height + self.abstand) // self.raster)
+
+    @property
+    def max_erste(self) -> int:
+        return max(0, self.anzahl - self.kapazitaet)
+
+    def sichtbar(self) -> range:
+        return range(self.erste, min(self.anzahl, self.erste + self.kapazitaet))
+
+    def slot_rect(self, slot: int, breite: int) -> pygame.Rect:
+        """Rechteck des slot-ten sichtbaren Platzes (0 = oben)."""
+        return pygame.Rect(self.bereich.x, self.bereich.y + slot * self.raster, breite, self.zeilen_hoehe)
+
+    def scrollen(self, zeilen: int) -> bool:
+        """Positiv = nach unten (spätere Zeilen); True, wenn sich der Ausschnitt geändert hat."""
+        erste = min(max(self.erste + zeilen, 0), self.max_erste)
+        if erste == self.erste:
+            return False
+        self.erste = erste
+        return True
+
+    def setzen(self, anzahl: int, erste: int = 0):
+        self.anzahl = anzahl
+        self.erste = min(max(erste, 0), self.max_erste)
+
+
+class LayoutCache:
+    """
+    LRU-Cache für die Zeilen der Seitenleisten-Listen.
+    Schlüssel ist der Raumzustand (z. B. Welt, Raum, Änderungszähler); solange
+    er gleich bleibt, wird die Liste beim erneuten Betreten nicht neu gebaut.
+    """
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, List[Zeile]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable, build: Callable[[], List[Zeile]]) -> List[Zeile]:
+        zeilen = self._entries.get(key)
+        if zeilen is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return zeilen
+        self.misses += 1
+        zeilen = self._entries[key] = build()
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return zeilen
+
+    def clear(self):
+        self._entries.clear()
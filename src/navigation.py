@@ -0,0 +1,145 @@
+# navigation.py
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Tuple
+
+from welt import Welt
+
+# Kürzeste-Wege-Baum einer Quelle: Raum -> (Vorgänger, Distanz)
+Baum = Dict[str, Tuple[Optional[str], int]]
+
+
+class Navigator:
+    """
+    Kürzeste Wege über den Raumgraphen (Welt.adjazenz, ungewichtet → BFS).
+    Nachbarn werden in der Reihenfolge der Weltdatei besucht; bei mehreren
+    gleich kurzen Wegen gewinnt also immer derselbe (wichtig für Aufnahmen).
+
+    Kleine Karten (bis all_pairs_limit Räume) werden bei warm() komplett
+    vorberechnet (BFS von jedem Raum). Bei großen Karten wird pro Startraum
+    ein BFS-Baum gebaut und in einem LRU-Cache gehalten. Ein Weg wird dann
+    über die Vorgänger-Zeiger in O(Weglänge) zusammengesetzt.
+
+    Ändert sich eine Verbindung (Welt.verbinden/trennen), werden nur die
+    Bäume verworfen, die davon tatsächlich betroffen sind.
+    """
+    def __init__(self, welt: Welt, all_pairs_limit: int = 256, max_trees: int = 512):
+        self.welt = welt
+        self.all_pairs_limit = all_pairs_limit
+        self.max_trees = max_trees
+        self._trees: "OrderedDict[str, Baum]" = OrderedDict()
+        self.bfs_runs = 0
+        welt.bei_aenderung(self._kante_geaendert)
+
+    @property
+    def all_pairs(self) -> bool:
+        return len(self.welt.adjazenz) <= self.all_pairs_limit
+
+    def warm(self):
+        """Kleine Karten: alle Bäume vorberechnen (danach keine BFS mehr bei Anfragen)."""
+        if self.all_pairs:
+            for quelle in self.welt.adjazenz:
+                self._tree(quelle)
+
+    def route(self, von: str, nach: str) -> Optional[List[str]]:
+        """Raum-Schlüssel von → nach (inklusive beider Enden) oder None, wenn unerreichbar."""
+        if von == nach:
+            return [von]
+        tree = self._tree(von)
+        if nach not in tree:
+            return None
+        weg = []
+        node: Optional[str] = nach
+        while node is not None:
+            weg.append(node)
+            node = tree[node][0]
+        weg.reverse()
+        return weg
+
+    def route_suchen(self, von: str, nach: str) -> Optional[List[str]]:
+        """
+        Wie route(), aber ohne Baum-Cache: BFS ab von, die abbricht, sobald nach
+        erreicht ist. Für viele kurze Wege auf großen Karten (z. B. NPCs), bei
+        denen sich ein kompletter Baum je Startraum nicht lohnt.
+        """
+        if von == nach:
+            return [von]
+        if von in self._trees:
+            return self.route(von, nach)
+        adjazenz = self.welt.adjazenz
+        vorgaenger: Dict[str, Optional[str]] = {von: None}
+        queue = deque([von])
+        while queue:
+            node = queue.popleft()
+            for nachbar in adjazenz.get(node, ()):
+                if nachbar in vorgaenger:
+                    continue
+                vorgaenger[nachbar] = node
+                if nachbar == nach:
+                    weg = []
+                    knoten: Optional[str] = nach
+                    while knoten is not None:
+                        weg.append(knoten)
+                        knoten = vorgaenger[knoten]
+                    weg.reverse()
+                    return weg
+                queue.append(nachbar)
+        return None
+
+    def distanz(self, von: str, nach: str) -> Optional[int]:
+        entry = self._tree(von).get(nach)
+        return entry[1] if entry is not None else None
+
+    def route_zur_aufgabe(self, von: str, aufgabe_id: int) -> Optional[List[str]]:
+        aufgabe = self.welt.aufgaben.get(aufgabe_id)
+        if aufgabe is None:
+            return None
+        return self.route(von, aufgabe.raum)
+
+    def invalidate(self):
+        self._trees.clear()
+
+    # ------------------------------------------------------------------ intern
+
+    def _tree(self, quelle: str) -> Baum:
+        tree = self._trees.get(quelle)
+        if tree is not None:
+            self._trees.move_to_end(quelle)
+            return tree
+        tree = self._bfs(quelle)
+        self._trees[quelle] = tree
+        if not self.all_pairs and len(self._trees) > self.max_trees:
+            self._trees.popitem(last=False)
+        return tree
+
+    def _bfs(self, quelle: str) -> Baum:
+        self.bfs_runs += 1
+        adjazenz = self.welt.adjazenz
+        tree: Baum = {quelle: (None, 0)}
+        queue = deque([quelle])
+        while queue:
+            node = queue.popleft()
+            dist = tree[node][1] + 1
+            for nachbar in adjazenz.get(node, ()):
+                if nachbar not in tree:
+                    tree[nachbar] = (node, dist)
+                    queue.append(nachbar)
+        return tree
+
+    def _kante_geaendert(self, von: str, nach: str, hinzugefuegt: bool):
+        """Nur Bäume verwerfen, deren kürzeste Wege sich durch die Kante ändern können."""
+        betroffen = []
+        for quelle, tree in self._trees.items():
+            if hinzugefuegt:
+                # Neue Kante zählt nur, wenn von erreichbar ist und nach dadurch näher rückt – oder gleich
+                # nah: dann kann sie den Gleichstand anders auflösen als der gecachte Baum
+                start = tree.get(von)
+                ziel = tree.get(nach)
+                if start is not None and (ziel is None or start[1] + 1 <= ziel[1]):
+                    betroffen.append(quelle)
+            else:
+                # Entfernte Kante stört nur, wenn der Baum sie benutzt
+                ziel = tree.get(nach)
+                if ziel is not None and ziel[0] == von:
+                    betroffen.append(quelle)
+        for quelle in betroffen:
+            del self._trees[quelle]
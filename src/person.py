@@ -1,26 +1,34 @@
+import sys
+from collections import deque
+
+from kompakt import LEER, liste
+
+# So viele Antworten merkt sich eine Person höchstens (älteste fallen raus)
+DIALOG_HISTORY_MAX = 32
+
+
+def _neue_history():
+    return deque(maxlen=DIALOG_HISTORY_MAX)
+
+
 class Person:
+    __slots__ = ("name", "rolle", "beschreibung", "_dialog_history", "relationship", "rede_lust")
+
     def __init__(self, name, rolle, beschreibung, rede_lust=5):
-        self.name = name
-        self.rolle = rolle
+        self.name = sys.intern(name)
+        self.rolle = sys.intern(rolle)
         self.beschreibung = beschreibung
-        self.dialog_history = []
+        self._dialog_history = LEER
         self.relationship = 0  
         self.rede_lust = rede_lust  
 
-    def sprich(self):
-        print(f"\n{self.name} ({self.rolle}): {self.beschreibung}")
-        print(f"\n{self.name}: Hallo! Möchtest du etwas für mich erledigen?")
-        antwort = input("Deine Antwort (ja/nein/Smalltalk): ").strip().lower()
-        if antwort == "ja":
-            print(f"\n{self.name}: Super! Ich habe eine Aufgabe für dich.")
-            return "task"  
-        elif antwort == "smalltalk" and self.rede_lust > 3:
-            print(f"\n{self.name}: Oh, ich rede so gerne... Übrigens, wusstest du schon, dass ...")
-        elif antwort == "nein":
-            print(f"\n{self.name}: Schade, vielleicht später!")
-        else:
-            print(f"\n{self.name}: Okay.")
-        self.dialog_history.append(antwort)
+    @property
+    def dialog_history(self):
+        """Letzte DIALOG_HISTORY_MAX Antworten (interniert); wird erst beim ersten Eintrag angelegt."""
+        return liste(self, "_dialog_history", _neue_history)
+
+    def merke_antwort(self, antwort):
+        self.dialog_history.append(sys.intern(antwort))
 
     def beziehung_steigern(self, punkte=1):
         self.relationship += punkte
@@ -0,0 +1,164 @@
+# portrait_atlas.py
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from asset_bake import (BAKED, PORTRAIT_SIZE, BakedAssets, atlas_seiten, portrait_quellen,
+                        raw_laden, scale_to_fit)
+
+# Wird genommen, wenn eine Person den gewünschten Ausdruck nicht hat
+STANDARD_AUSDRUCK = "Neutral"
+
+
+def quelle_dekodieren(pfad: str, target_size: Tuple[int, int]) -> Optional[pygame.Surface]:
+    """Original-Portrait laden + skalieren (ohne convert)."""
+    try:
+        return scale_to_fit(pygame.image.load(pfad), target_size)
+    except (pygame.error, OSError):
+        return None
+
+
+class PortraitAtlas:
+    """
+    Alle Ausdrücke aller Personen auf wenigen großen Surfaces.
+    Nachschlagen per (Person, Ausdruck) liefert (Seite, Teil-Rect); ein
+    Ausdruckswechsel ist damit nur noch ein blit() ohne Datei-I/O.
+
+    Bevorzugt wird der gebackene Atlas (asset_bake.py), der beim ersten
+    Zugriff komplett geladen wird. Ohne Bake werden beim ersten Zugriff auf
+    eine Person alle ihre Ausdrücke dekodiert und auf eine eigene Seite gepackt.
+    """
+    def __init__(self, size: Tuple[int, int] = PORTRAIT_SIZE, baked: BakedAssets = BAKED,
+                 decode: Callable[[str, Tuple[int, int]], Optional[pygame.Surface]] = quelle_dekodieren):
+        self.size = tuple(size)
+        self.baked = baked
+        self.decode = decode
+        self._seiten: List[pygame.Surface] = []
+        # Ordner -> Ausdruck -> (Seite, Rect)
+        self._bilder: Dict[str, Dict[str, Tuple[int, pygame.Rect]]] = {}
+        self._aliase: Dict[str, str] = {}
+        self._quellen: Optional[Dict[str, Dict[str, str]]] = None
+        self._gebacken_geprueft = False
+        # (Person, Ausdruck, Höhe) -> verkleinertes Portrait für kleine Fenster
+        self._skaliert: Dict[Tuple[str, str, int], pygame.Surface] = {}
+        self.gepackt = 0
+
+    def __contains__(self, person: str):
+        self._gebacken_laden()
+        return self._ordner(person) in self._bilder
+
+    @property
+    def seiten(self) -> int:
+        return len(self._seiten)
+
+    def bytes(self) -> int:
+        return sum(s.get_pitch() * s.get_height() for s in self._seiten)
+
+    def ausdruecke(self, person: str) -> List[str]:
+        eintraege = self._eintraege(person)
+        return list(eintraege) if eintraege else []
+
+    def lookup(self, person: str, ausdruck: str = STANDARD_AUSDRUCK) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """(Atlas-Seite, Teil-Rect) für den Ausdruck; fehlt er, Neutral bzw. den ersten vorhandenen."""
+        eintraege = self._eintraege(person)
+        if not eintraege:
+            return None
+        eintrag = eintraege.get(ausdruck) or eintraege.get(STANDARD_AUSDRUCK) or next(iter(eintraege.values()))
+        seite, rect = eintrag
+        return self._seiten[seite], rect
+
+    def blit(self, target: pygame.Surface, person: str, ausdruck: str, center: Tuple[int, int],
+             hoehe: Optional[int] = None) -> Optional[pygame.Rect]:
+        """
+        Zeichnet das Portrait zentriert auf center; gibt das belegte Rect zurück.
+        Ist es höher als hoehe, wird es verkleinert (einmal je Höhe, danach aus dem Cache).
+        """
+        found = self.lookup(person, ausdruck)
+        if found is None:
+            return None
+        seite, rect = found
+        if hoehe is None or rect.height <= hoehe:
+            dest = rect.copy()
+            dest.center = center
+            target.blit(seite, dest, rect)
+            return dest
+        key = (person, ausdruck, hoehe)
+        bild = self._skaliert.get(key)
+        if bild is None:
+            if len(self._skaliert) >= 64:
+                self._skaliert.clear()
+            groesse = (max(1, rect.width * hoehe // rect.height), hoehe)
+            bild = self._skaliert[key] = pygame.transform.smoothscale(seite.subsurface(rect), groesse)
+        dest = bild.get_rect(center=center)
+        target.blit(bild, dest)
+        return dest
+
+    def laden(self):
+        """Gebackenen Atlas sofort laden (z. B. beim Start statt beim ersten Klick)."""
+        self._gebacken_laden()
+
+    def fehlende_quellen(self, person: str) -> Dict[str, str]:
+        """Ausdruck -> Originaldatei für eine noch nicht gepackte Person (zum Vorladen), sonst {}."""
+        if person in self:
+            return {}
+        return dict(self._quellen_fuer(person))
+
+    # ------------------------------------------------------------------ intern
+
+    def _ordner(self, person: str) -> str:
+        return self._aliase.get(person, person)
+
+    def _eintraege(self, person: str) -> Optional[Dict[str, Tuple[int, pygame.Rect]]]:
+        self._gebacken_laden()
+        ordner = self._ordner(person)
+        eintraege = self._bilder.get(ordner)
+        if eintraege is None:
+            eintraege = self._person_packen(person)
+        return eintraege
+
+    def _gebacken_laden(self):
+        if self._gebacken_geprueft:
+            return
+        self._gebacken_geprueft = True
+        atlas = self.baked.atlas(self.size)
+        if atlas is None:
+            return
+        seiten = [raw_laden(pfad) for pfad in atlas["seiten"]]
+        if any(s is None for s in seiten):
+            return
+        offset = len(self._seiten)
+        self._seiten.extend(s.convert_alpha() for s in seiten)
+        for ordner, ausdruecke in atlas["bilder"].items():
+            self._bilder[ordner] = {a: (offset + seite, pygame.Rect(x, y, w, h))
+                                    for a, (seite, x, y, w, h) in ausdruecke.items()}
+        self._aliase.update(self.baked.manifest["aliase"])
+
+    def _quellen_fuer(self, person: str) -> Dict[str, str]:
+        if self._quellen is None:
+            # Nur Verzeichnisse lesen, nichts dekodieren
+            self._quellen, aliase = portrait_quellen()
+            for alias, ordner in aliase.items():
+                self._aliase.setdefault(alias, ordner)
+        return self._quellen.get(self._ordner(person), {})
+
+    def _person_packen(self, person: str) -> Optional[Dict[str, Tuple[int, pygame.Rect]]]:
+        """Fallback ohne Bake: alle Ausdrücke einer Person dekodieren und auf eigene Seite(n) packen."""
+        quellen = self._quellen_fuer(person)
+        if not quellen:
+            return None
+        ordner = self._ordner(person)
+        bilder = {}
+        for ausdruck, pfad in quellen.items():
+            img = self.decode(pfad, self.size)
+            if img is not None:
+                bilder[ausdruck] = img
+        if not bilder:
+            self._quellen.pop(ordner)
+            return None
+        seiten, plaetze = atlas_seiten(bilder)
+        offset = len(self._seiten)
+        self._seiten.extend(s.convert_alpha() for s in seiten)
+        eintraege = {a: (offset + seite, pygame.Rect(x, y, w, h)) for a, (seite, x, y, w, h) in plaetze.items()}
+        self._bilder[ordner] = eintraege
+        self.gepackt += 1
+        return eintraege
@@ -0,0 +1,97 @@
+# prefetch.py
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, NamedTuple, Optional, Tuple
+
+import pygame
+
+from asset_cache import AssetCache, CacheKey
+
+
+class PrefetchJob(NamedTuple):
+    """
+    Ein Vorlade-Auftrag.
+    key:    Schlüssel im AssetCache, unter dem das Ergebnis landen soll
+    decode: läuft im Worker-Thread; lädt + skaliert, aber KONVERTIERT NICHT
+    mode:   "alpha" (convert_alpha) oder "opaque" (convert) – passiert im Haupt-Thread
+    """
+    key: CacheKey
+    decode: Callable[[], Optional[pygame.Surface]]
+    mode: str
+
+
+class AssetPrefetcher:
+    """
+    Lädt Assets im Hintergrund vor (Thread-Pool).
+    Dekodieren und Skalieren laufen in Worker-Threads, das abschließende
+    convert()/convert_alpha() braucht das Display und passiert deshalb in
+    pump(), das der Haupt-Thread einmal pro Frame aufruft.
+    """
+    def __init__(self, cache: AssetCache, max_workers: int = 2, max_in_flight: int = 4):
+        self.cache = cache
+        self.max_in_flight = max_in_flight
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self._pending: Deque[PrefetchJob] = deque()
+        # Future -> (Job, Generation); Generation wird bei cancel() erhöht
+        self._in_flight: Dict[Future, Tuple[PrefetchJob, int]] = {}
+        self._generation = 0
+        self.completed = 0
+        self.dropped = 0
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._pending or self._in_flight)
+
+    def schedule(self, jobs: Iterable[PrefetchJob]):
+        """Verwirft alle offenen Aufträge und plant die neuen ein (z. B. bei Raumwechsel)."""
+        self.cancel()
+        seen = set()
+        for job in jobs:
+            if job.key in seen or job.key in self.cache:
+                continue
+            seen.add(job.key)
+            self._pending.append(job)
+        self._fill()
+
+    def cancel(self):
+        """Bricht noch nicht gestartete Aufträge ab; laufende werden später verworfen."""
+        self._generation += 1
+        self._pending.clear()
+        for future in list(self._in_flight):
+            if future.cancel():
+                del self._in_flight[future]
+
+    def pump(self, max_convert: Optional[int] = 2) -> int:
+        """
+        Übernimmt fertige Ergebnisse in den Cache (nur aus dem Haupt-Thread aufrufen!).
+        max_convert begrenzt die Konvertierungen pro Aufruf, None = alle fertigen.
+        Gibt die Anzahl übernommener Surfaces zurück.
+        """
+        converted = 0
+        for future in [f for f in self._in_flight if f.done()]:
+            if max_convert is not None and converted >= max_convert:
+                break
+            job, generation = self._in_flight.pop(future)
+            try:
+                surf = future.result()
+            except Exception:
+                surf = None
+            if generation != self._generation or surf is None or job.key in self.cache:
+                self.dropped += 1
+                continue
+            surf = surf.convert_alpha() if job.mode == "alpha" else surf.convert()
+            self.cache.put(job.key, surf)
+            self.completed += 1
+            converted += 1
+        self._fill()
+        return converted
+
+    def shutdown(self):
+        self.cancel()
+        self._pool.shutdown(wait=False)
+
+    def _fill(self):
+        while self._pending and len(self._in_flight) < self.max_in_flight:
+            job = self._pending.popleft()
+            future = self._pool.submit(job.decode)
+            self._in_flight[future] = (job, self._generation)
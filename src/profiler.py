@@ -0,0 +1,189 @@
+# profiler.py
+"""
+Frame-Profiler: misst Abschnitte pro Frame (Events, Zeichnen je Ebene,
+Present, Asset-Ladevorgänge) und hält für jeden Abschnitt die Werte der
+letzten Frames, aus denen p50/p95/p99 berechnet werden.
+
+    with PROFILER.span("draw:log"):
+        self.log.draw(screen)
+
+Spans im Haupt-Thread werden pro Frame aufsummiert (begin_frame/end_frame);
+Spans aus Worker-Threads (z. B. Vorladen) und außerhalb eines Frames zählen
+als eigene Messung. Alle Spans landen zusätzlich im Trace, der sich als CSV
+oder Chrome-Trace-JSON (chrome://tracing, Perfetto) exportieren lässt.
+Trace und Messwerte sind durch ein Lock geschützt; Auswertung und Export
+arbeiten auf Kopien, die unter dem Lock gezogen werden.
+"""
+import csv
+import json
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+# Trace-Eintrag: (Name, Start in µs, Dauer in µs, Thread-ID, Frame-Nummer)
+TraceEvent = Tuple[str, float, float, int, int]
+
+FRAME = "frame"
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """p-Quantil (0..100) einer sortierten Liste, nächster Rang."""
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(p / 100 * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter())
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class FrameProfiler:
+    """
+    history:    wie viele Messungen je Abschnitt für die Quantile behalten werden
+    max_events: Größe des Trace-Puffers (älteste Einträge fallen heraus)
+    Solange enabled False ist, kosten span()-Aufrufe praktisch nichts.
+    """
+    def __init__(self, history: int = 600, max_events: int = 200_000, enabled: bool = False):
+        self.history = history
+        self.enabled = enabled
+        self._samples: Dict[str, Deque[float]] = {}
+        self._events: Deque[TraceEvent] = deque(maxlen=max_events)
+        # Schützt _samples und _events (Worker-Threads schreiben, der Haupt-Thread wertet aus)
+        self._lock = threading.Lock()
+        self._frame: Optional[Dict[str, float]] = None
+        self._frame_start = 0.0
+        self._main = threading.get_ident()
+        self._t0 = time.perf_counter()
+        self.frames = 0
+
+    # ------------------------------------------------------------------ messen
+
+    def span(self, name: str):
+        return _Span(self, name) if self.enabled else _NULL_SPAN
+
+    def record(self, name: str, start: float, end: float):
+        """Span von start bis end (perf_counter-Sekunden) eintragen."""
+        if not self.enabled:
+            return
+        dauer = end - start
+        tid = threading.get_ident()
+        with self._lock:
+            self._events.append((name, (start - self._t0) * 1e6, dauer * 1e6, tid, self.frames))
+            if tid == self._main and self._frame is not None:
+                # _frame gehört dem Haupt-Thread
+                self._frame[name] = self._frame.get(name, 0.0) + dauer
+            else:
+                self._sample(name, dauer)
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame = {}
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if self._frame is None:
+            return
+        self.record(FRAME, self._frame_start, time.perf_counter())
+        with self._lock:
+            for name, dauer in self._frame.items():
+                self._sample(name, dauer)
+        self._frame = None
+        self.frames += 1
+
+    def _sample(self, name: str, dauer: float):
+        # Nur unter self._lock aufrufen
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.history)
+        samples.append(dauer)
+
+    # ------------------------------------------------------------------ auswerten
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._events.clear()
+        self._frame = None
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._samples)
+
+    def _samples_kopie(self) -> List[Tuple[str, List[float]]]:
+        with self._lock:
+            return [(name, list(samples)) for name, samples in self._samples.items()]
+
+    def _events_kopie(self) -> List[TraceEvent]:
+        with self._lock:
+            return list(self._events)
+
+    def percentiles(self, name: str, ps=(50, 95, 99)) -> Tuple[float, ...]:
+        """Quantile in Millisekunden über die letzten history Messungen."""
+        with self._lock:
+            values = list(self._samples.get(name, ()))
+        values.sort()
+        return tuple(percentile(values, p) * 1000 for p in ps)
+
+    def summary(self) -> List[Tuple[str, int, float, float, float, float]]:
+        """(Name, Anzahl, p50, p95, p99, max) je Abschnitt in ms; frame zuerst, Rest nach p95 absteigend."""
+        rows = []
+        for name, values in self._samples_kopie():
+            values.sort()
+            rows.append((name, len(values), percentile(values, 50) * 1000, percentile(values, 95) * 1000,
+                         percentile(values, 99) * 1000, values[-1] * 1000))
+        rows.sort(key=lambda r: (r[0] != FRAME, -r[3]))
+        return rows
+
+    # ------------------------------------------------------------------ export
+
+    def export_csv(self, path: str):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "start_us", "dur_us", "thread", "frame"])
+            for name, ts, dur, tid, frame in self._events_kopie():
+                writer.writerow([name, f"{ts:.1f}", f"{dur:.1f}", tid, frame])
+
+    def export_chrome_trace(self, path: str):
+        """Chrome-Trace-Format (Complete Events "X"); öffnen mit chrome://tracing oder ui.perfetto.dev."""
+        events = [{"name": name, "ph": "X", "ts": round(ts, 1), "dur": round(dur, 1), "pid": 1, "tid": tid,
+                   "args": {"frame": frame}}
+                  for name, ts, dur, tid, frame in self._events_kopie()]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def export(self, path: str):
+        """Nach Endung: .csv → CSV, sonst Chrome-Trace-JSON."""
+        if path.lower().endswith(".csv"):
+            self.export_csv(path)
+        else:
+            self.export_chrome_trace(path)
+
+
+PROFILER = FrameProfiler()
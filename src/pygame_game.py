@@ -1,24 +1,40 @@
 # pygame_game.py
+# Startzeit-Messung zuerst, damit auch der Import von pygame & Co. mitzählt
+from startzeit import Startzeit
+STARTZEIT = Startzeit()
+
+import argparse
+import gc
 import os
 import pygame
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
-# Import Setup (nur Datenaufbau), plus eure Modelle
-from setup import Setup
+# Spiellogik (ohne pygame), plus eure Modelle
+from engine import ActionResult, Engine
+import spielstand
 from person import Person
-from aufgabe import Aufgabe
 from raum import Raum
+from asset_cache import ASSET_CACHE
+from prefetch import AssetPrefetcher, PrefetchJob
+from text_cache import render_text
+from dirty import DIRTY
+from hit_index import HitIndex
+from text_layout import ellipsize, wrap_text
+from layout import MIN_FENSTER, FensterLayout, LayoutCache, ListenFenster, Zeile, fenster_layout
+from portrait_atlas import PortraitAtlas
+from asset_bake import BAKED, PORTRAIT_SIZE, RAW_EXT, raw_laden, scale_to_fit
+from fonts import FONTS, LazyFont
+from profiler import PROFILER, FrameProfiler
+from aufnahme import Aufnahme
 
 ################################################################################
 # Einfache UI-Helper
 ################################################################################
 
-pygame.init()
-pygame.font.init()
-
-FONT = pygame.font.SysFont("arial", 20)
-FONT_SMALL = pygame.font.SysFont("arial", 16)
-FONT_BIG = pygame.font.SysFont("arial", 28)
+# Schriften werden erst beim ersten Gebrauch aufgelöst (siehe fonts.py), pygame erst in GameApp initialisiert
+FONT = LazyFont("arial", 20)
+FONT_SMALL = LazyFont("arial", 16)
+FONT_BIG = LazyFont("arial", 28)
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -27,6 +43,13 @@ LIGHT_GRAY = (200, 200, 200)
 DARK_BLUE = (25, 35, 60)
 ACCENT = (240, 240, 120)
 
+# Wie lange die Loop ohne Änderungen auf Events wartet (ms)
+IDLE_WAIT_MS = 500
+# ... solange noch Assets im Hintergrund vorgeladen werden
+IDLE_WAIT_PREFETCH_MS = 30
+# Echtzeit je Spielminute (Tagesablauf der NPCs, siehe zeitplan.py)
+MS_PRO_MINUTE = 1000
+
 class Button:
     def __init__(self, rect: pygame.Rect, text: str, callback, tooltip: Optional[str] = None):
         self.rect = rect
@@ -39,16 +62,17 @@ class Button:
         color = LIGHT_GRAY if self.hover else WHITE
         pygame.draw.rect(surface, color, self.rect, border_radius=8)
         pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=8)
-        text_surf = FONT.render(self.text, True, BLACK)
+        text_surf = render_text(FONT, self.text, BLACK)
         surface.blit(text_surf, text_surf.get_rect(center=self.rect.center))
 
-    def handle_event(self, event: pygame.event.Event):
-        if event.type == pygame.MOUSEMOTION:
-            self.hover = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.rect.collidepoint(event.pos):
-                if callable(self.callback):
-                    self.callback()
+    def set_hover(self, hover: bool):
+        if hover != self.hover:
+            self.hover = hover
+            DIRTY.mark(self.rect)
+
+    def click(self):
+        if callable(self.callback):
+            self.callback()
 
 class Panel:
     """Einfaches Rechteck-Panel mit Titel; verwendet für Seitenleisten/Log-Fenster."""
@@ -60,39 +84,253 @@ class Panel:
         pygame.draw.rect(surface, (235, 235, 240), self.rect, border_radius=12)
         pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=12)
         if self.title:
-            title_surf = FONT_BIG.render(self.title, True, BLACK)
+            title_surf = render_text(FONT_BIG, self.title, BLACK)
             surface.blit(title_surf, (self.rect.x + 12, self.rect.y + 8))
 
 class TextLog:
-    """Scrollbarer Text-Log für Dialoge/Status."""
-    def __init__(self, rect: pygame.Rect, max_lines: int = 10):
+    """
+    Scrollbarer Text-Log für Dialoge/Status.
+    Meldungen liegen in einem Ringpuffer fester Größe; add() hängt nur an (O(1)).
+    Nach Pixelbreite umgebrochen und gerendert wird erst beim Zeichnen, und nur
+    für Meldungen, die ins sichtbare Fenster kommen – gemerkt je (Text, Breite),
+    nach einem Resize wird also neu umgebrochen. scroll_offset zählt Bildschirmzeilen.
+    """
+    def __init__(self, rect: pygame.Rect, max_lines: int = 10, capacity: int = 500):
         self.rect = rect
-        self.lines: List[str] = []
         self.max_lines = max_lines
+        self.capacity = capacity
+        # Ringpuffer: Einträge [text, Breite, Zeilen, gerenderte Surfaces (None = noch nicht)]
+        self._ring: List[Optional[list]] = [None] * capacity
+        self._start = 0
+        self._count = 0
+        # 0 = ganz unten (neueste Zeilen), >0 = so viele Zeilen nach oben gescrollt
         self.scroll_offset = 0
+        self.line_height = FONT_SMALL.get_height() + 4
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def lines(self) -> List[str]:
+        """Alle gespeicherten Meldungen (ungebrochen), älteste zuerst."""
+        return [self._entry(i)[0] for i in range(self._count)]
 
     def add(self, line: str):
-        # Split lange Zeilen grob
-        max_chars = 80
-        while len(line) > max_chars:
-            self.lines.append(line[:max_chars])
-            line = line[max_chars:]
-        self.lines.append(line)
-        # Auf Max-Linien beschränken
-        if len(self.lines) > 500:
-            self.lines = self.lines[-500:]
+        idx = (self._start + self._count) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+        else:
+            # Puffer voll → älteste Meldung überschreiben
+            self._start = (self._start + 1) % self.capacity
+        entry = self._ring[idx] = [line, 0, (), None]
+        if self.scroll_offset:
+            # Beim Zurückscrollen bleibt der sichtbare Ausschnitt stehen
+            self.scroll(len(self._zeilen(entry)))
+        DIRTY.mark(self.rect)
+
+    def scroll(self, lines: int):
+        """Positiv = nach oben (ältere Zeilen), negativ = nach unten."""
+        offset = max(self.scroll_offset + lines, 0)
+        if offset:
+            # Nur so weit umbrechen, wie gescrollt wird; oben ist Schluss
+            offset = min(offset, max(0, len(self._von_unten(offset + self.max_lines)[0]) - self.max_lines))
+        if offset != self.scroll_offset:
+            self.scroll_offset = offset
+            DIRTY.mark(self.rect)
+
+    def _entry(self, i: int) -> list:
+        return self._ring[(self._start + i) % self.capacity]
+
+    def _zeilen(self, entry: list) -> Tuple[str, ...]:
+        breite = self.rect.width - 20
+        if entry[1] != breite:
+            entry[1] = breite
+            entry[2] = tuple(wrap_text(entry[0], FONT_SMALL, breite)) or ("",)
+            entry[3] = None
+        return entry[2]
+
+    def _von_unten(self, anzahl: int) -> Tuple[List[Tuple[list, int]], int]:
+        """
+        Bis zu anzahl Bildschirmzeilen (Eintrag, Zeilennummer), neueste zuerst,
+        und wie viele ältere Meldungen dafür nicht umgebrochen werden mussten.
+        """
+        zeilen: List[Tuple[list, int]] = []
+        i = self._count - 1
+        while i >= 0 and len(zeilen) < anzahl:
+            entry = self._entry(i)
+            for k in range(len(self._zeilen(entry)) - 1, -1, -1):
+                zeilen.append((entry, k))
+            i -= 1
+        return zeilen, i + 1
 
     def draw(self, surface: pygame.Surface):
         pygame.draw.rect(surface, WHITE, self.rect, border_radius=8)
         pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=8)
-        # Text einzeichnen
+        # Nur das sichtbare Fenster umbrechen und einzeichnen
+        zeilen, rest = self._von_unten(self.scroll_offset + self.max_lines)
+        # Breite kann sich seit dem letzten Scrollen geändert haben
+        self.scroll_offset = min(self.scroll_offset, max(0, len(zeilen) - self.max_lines))
+        sichtbar = zeilen[self.scroll_offset:self.scroll_offset + self.max_lines]
         x = self.rect.x + 10
         y = self.rect.y + 8
-        visible = self.lines[-self.max_lines:]
-        for line in visible:
-            ts = FONT_SMALL.render(line, True, BLACK)
-            surface.blit(ts, (x, y))
-            y += ts.get_height() + 4
+        for entry, k in reversed(sichtbar):
+            if entry[3] is None:
+                entry[3] = [None] * len(entry[2])
+            if entry[3][k] is None:
+                entry[3][k] = FONT_SMALL.render(entry[2][k], True, BLACK)
+            surface.blit(entry[3][k], (x, y))
+            y += self.line_height
+
+        # Scrollbalken, sobald es mehr Zeilen als Platz gibt; noch nicht umgebrochene
+        # ältere Meldungen zählen als je eine Zeile (genau, sobald sie einmal sichtbar waren)
+        gesamt = len(zeilen) + rest
+        if gesamt > self.max_lines:
+            track = pygame.Rect(self.rect.right - 8, self.rect.y + 8, 4, self.rect.height - 16)
+            bar_h = max(12, track.height * self.max_lines // gesamt)
+            bar_y = track.bottom - bar_h - (track.height - bar_h) * self.scroll_offset // max(1, gesamt - self.max_lines)
+            pygame.draw.rect(surface, LIGHT_GRAY, (track.x, bar_y, track.width, bar_h), border_radius=2)
+
+class ListButton(Button):
+    """Button aus dem Pool einer ScrollList; merkt sich nur, welche Zeile er gerade zeigt."""
+    def __init__(self, rect: pygame.Rect, owner: "ScrollList"):
+        super().__init__(rect, "", None)
+        self.owner = owner
+        self.zeile = 0
+
+    def click(self):
+        self.owner.auswaehlen(self.zeile)
+
+class ScrollList:
+    """
+    Virtualisierte Button-Liste in einem Panel (Personen, Ausgänge, Aufgaben).
+    Zeilen sind (Beschriftung, Wert); on_select(Wert) wird beim Klick aufgerufen.
+    Es gibt nur so viele Buttons, wie sichtbar in das Panel passen (Pool);
+    beim Scrollen und bei neuen Zeilen werden sie nur umbeschriftet. Zeichnen,
+    Hit-Test und Scrollen kosten damit O(sichtbare Zeilen), egal wie lang die Liste ist.
+    """
+    SCROLLBAR = 10
+
+    def __init__(self, rect: pygame.Rect, on_select, zeilen_hoehe: int = 40, abstand: int = 10):
+        self.fenster = ListenFenster(rect, zeilen_hoehe, abstand)
+        self.on_select = on_select
+        self.rows: List[Zeile] = []
+        self._pool: List[ListButton] = []
+        # Sichtbare Buttons (Anfang des Pools)
+        self.buttons: List[ListButton] = []
+        self.set_rect(rect)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Listenbereich inklusive Scrollbalken rechts daneben."""
+        b = self.fenster.bereich
+        return pygame.Rect(b.x, b.y, b.width + self.SCROLLBAR, b.height)
+
+    def set_rect(self, rect: pygame.Rect):
+        """Neue Größe (z. B. nach Fenster-Resize): Pool an die neue Kapazität anpassen."""
+        DIRTY.mark(self.rect)
+        self.fenster.bereich = pygame.Rect(rect)
+        self._pool = [ListButton(self.fenster.slot_rect(i, rect.width), self) for i in range(self.fenster.kapazitaet)]
+        self.fenster.setzen(len(self.rows), self.fenster.erste)
+        self._zuordnen()
+
+    def set_rows(self, rows: List[Zeile], keep_scroll: bool = False) -> bool:
+        """Neue Zeilen anzeigen; dieselbe (gecachte) Liste an derselben Stelle kostet nichts."""
+        erste = self.fenster.erste if keep_scroll else 0
+        if rows is self.rows and erste == self.fenster.erste:
+            return False
+        self.rows = rows
+        self.fenster.setzen(len(rows), erste)
+        self._zuordnen()
+        return True
+
+    def scroll(self, zeilen: int) -> bool:
+        """Positiv = nach unten; True, wenn sich die sichtbaren Zeilen geändert haben."""
+        if not self.fenster.scrollen(zeilen):
+            return False
+        self._zuordnen()
+        return True
+
+    def auswaehlen(self, zeile: int):
+        wert = self.rows[zeile][1]
+        if wert is not None:
+            self.on_select(wert)
+
+    def _zuordnen(self):
+        """Pool-Buttons auf die sichtbaren Zeilen verteilen."""
+        sichtbar = self.fenster.sichtbar()
+        self.buttons = self._pool[:len(sichtbar)]
+        breite = self.fenster.bereich.width - 16
+        for button, zeile in zip(self.buttons, sichtbar):
+            button.zeile = zeile
+            button.text = ellipsize(self.rows[zeile][0], FONT, breite)
+        DIRTY.mark(self.rect)
+
+    def draw(self, surface: pygame.Surface, area: Optional[pygame.Rect] = None):
+        for b in self.buttons:
+            if area is None or b.rect.colliderect(area):
+                b.draw(surface)
+        f = self.fenster
+        if f.anzahl > f.kapazitaet:
+            track = pygame.Rect(f.bereich.right + 4, f.bereich.y, 4, f.bereich.height)
+            bar_h = max(12, track.height * f.kapazitaet // f.anzahl)
+            bar_y = track.y + (track.height - bar_h) * f.erste // max(1, f.max_erste)
+            pygame.draw.rect(surface, GRAY, (track.x, bar_y, track.width, bar_h), border_radius=2)
+
+class ProfilerOverlay:
+    """
+    Halbtransparente Tabelle mit p50/p95/p99/max (ms) je Abschnitt (F3).
+    Der Text wird höchstens alle refresh_ms neu gerendert, damit das Overlay
+    selbst kaum Frame-Zeit kostet.
+    """
+    COLUMNS = ("p50", "p95", "p99", "max")
+
+    def __init__(self, pos: Tuple[int, int], profiler: FrameProfiler, refresh_ms: int = 500, max_rows: int = 16):
+        self.rect = pygame.Rect(pos, (0, 0))
+        self.profiler = profiler
+        self.refresh_ms = refresh_ms
+        self.max_rows = max_rows
+        self.visible = False
+        self._surface: Optional[pygame.Surface] = None
+        self._last = 0
+
+    def toggle(self):
+        self.visible = not self.visible
+        if self.visible:
+            self.profiler.enabled = True
+            self._surface = None
+        DIRTY.mark(self.rect)
+
+    def update(self):
+        """Einmal pro Frame: Tabelle bei Bedarf neu rendern und ihren Bereich als schmutzig markieren."""
+        if not self.visible:
+            return
+        now = pygame.time.get_ticks()
+        if self._surface is not None and now - self._last < self.refresh_ms:
+            return
+        self._last = now
+        rows = self.profiler.summary()[:self.max_rows]
+        line_h = FONT_SMALL.get_height() + 2
+        name_w, col_w = 190, 62
+        surf = pygame.Surface((name_w + col_w * len(self.COLUMNS) + 16, line_h * (len(rows) + 1) + 12), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 190))
+        cells = [("Abschnitt (ms)", *self.COLUMNS)]
+        cells += [(name, f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}", f"{mx:.2f}") for name, _, p50, p95, p99, mx in rows]
+        for i, row in enumerate(cells):
+            y = 6 + i * line_h
+            color = ACCENT if i == 0 else WHITE
+            # Zahlen werden jedes Mal anders → direkt rendern statt den Text-Cache zu füllen
+            surf.blit(FONT_SMALL.render(row[0], True, color), (8, y))
+            for j, cell in enumerate(row[1:]):
+                ts = FONT_SMALL.render(cell, True, color)
+                surf.blit(ts, (name_w + (j + 1) * col_w - ts.get_width(), y))
+        DIRTY.mark(self.rect)
+        self._surface = surf
+        self.rect = surf.get_rect(topleft=self.rect.topleft)
+        DIRTY.mark(self.rect)
+
+    def draw(self, surface: pygame.Surface):
+        if self.visible and self._surface is not None:
+            surface.blit(self._surface, self.rect)
 
 ################################################################################
 # Pygame-Frontend, das die bestehende Spiel-Logik nutzt
@@ -110,139 +348,279 @@ ASSETS_ROOTS = [
     os.path.join(os.path.dirname(__file__), "../assets"),
 ]
 
+# Aufgelöste Portrait-Pfade (Personenname -> Pfad oder None), damit nicht bei jedem Klick geprobt wird
+_PORTRAIT_PATHS: Dict[str, Optional[str]] = {}
+
+def find_person_portrait(person_name: str) -> Optional[str]:
+    """Sucht die Portrait-Datei einer Person und merkt sich das Ergebnis."""
+    if person_name in _PORTRAIT_PATHS:
+        return _PORTRAIT_PATHS[person_name]
+    folder_name = person_name
+    basefile = person_name[:1].lower() + person_name[1:] + "Neutral"
+
+    found = None
+    for root in ASSETS_ROOTS:
+        base_dir = os.path.join(root, "People", folder_name)
+        for ext in (".png", ".jpg", ".jpeg", ".webp"):
+            path = os.path.join(base_dir, basefile + ext)
+            if os.path.exists(path):
+                found = path
+                break
+        if found:
+            break
+    _PORTRAIT_PATHS[person_name] = found
+    return found
+
+def person_portrait_source(person_name: str, target_size: Tuple[int, int]) -> Optional[str]:
+    """Gebackene Rohdatei aus dem Manifest, sonst das Original-Portrait (oder None)."""
+    return BAKED.portrait(person_name, "Neutral", target_size) or find_person_portrait(person_name)
+
 def load_person_portrait(person_name: str, target_size: Tuple[int, int]) -> Optional[pygame.Surface]:
     """
     Erwartete Struktur (Case-sensitiv je nach OS):
         ../assets/People/<PersonenName>/<nameNeutral>.(png|jpg|jpeg|webp)
     Beispiel:
         ../assets/People/Kirsten/kirstenNeutral.png
+    Liegt eine gebackene Version vor (asset_bake.py), wird diese genommen.
+    Fertig skalierte Portraits landen im ASSET_CACHE.
     """
-    folder_name = person_name
-    basefile = person_name[:1].lower() + person_name[1:] + "Neutral"
+    path = person_portrait_source(person_name, target_size)
+    if path is None:
+        return None
 
-    candidates = []
-    for root in ASSETS_ROOTS:
-        base_dir = os.path.join(root, "People", folder_name)
-        for ext in (".png", ".jpg", ".jpeg", ".webp"):
-            candidates.append(os.path.join(base_dir, basefile + ext))
-
-    for path in candidates:
-        if os.path.exists(path):
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                img = scale_to_fit(img, target_size)
-                return img
-            except Exception:
-                continue
-    return None
-
-def scale_to_fit(surface: pygame.Surface, target: Tuple[int, int]) -> pygame.Surface:
-    tw, th = target
-    sw, sh = surface.get_width(), surface.get_height()
-    if sw == 0 or sh == 0:
-        return pygame.transform.smoothscale(surface, target)
-    scale = min(tw / sw, th / sh)
-    nw, nh = max(1, int(sw * scale)), max(1, int(sh * scale))
-    return pygame.transform.smoothscale(surface, (nw, nh))
+    def loader():
+        with PROFILER.span("asset:load_person_portrait"):
+            img = decode_person_portrait(path, target_size)
+            return img.convert_alpha() if img is not None else None
+
+    return ASSET_CACHE.get_or_load((path, tuple(target_size), "alpha"), loader)
+
+def decode_person_portrait(path: str, target_size: Tuple[int, int]) -> Optional[pygame.Surface]:
+    """Lädt + skaliert ein Portrait ohne convert() – darf auch im Worker-Thread laufen."""
+    with PROFILER.span("asset:decode_portrait"):
+        if path.endswith(RAW_EXT):
+            return raw_laden(path)
+        try:
+            return scale_to_fit(pygame.image.load(path), target_size)
+        except Exception:
+            return None
+
+def room_asset_name(raum: Raum) -> str:
+    """Logischer Bildname eines Raums: Kleinbuchstaben, Leerzeichen als _."""
+    return raum.name.lower().replace(' ', '_')
+
+def room_background_path(raum: Raum) -> str:
+    return os.path.join(ASSETS_DIR, room_asset_name(raum) + ".png")
+
+def room_background_source(raum: Raum, target_size: Tuple[int, int]) -> Optional[str]:
+    """Gebackene Rohdatei aus dem Manifest, sonst das Original-PNG (oder None)."""
+    baked = BAKED.raum(room_asset_name(raum), target_size)
+    if baked is not None:
+        return baked
+    path = room_background_path(raum)
+    return path if os.path.exists(path) else None
 
 def load_room_background(raum: Raum, target_size: Tuple[int, int]) -> pygame.Surface:
     """
-    Versucht, ein Hintergrundbild aus ../assets/Rooms/<raumname>.png zu laden.
+    Versucht, ein Hintergrundbild aus ../assets/Rooms/<raumname>.png zu laden
+    (bzw. die gebackene Version in der passenden Größe, siehe asset_bake.py).
     Fallback: einfärbte Fläche mit Raumtitel.
+    Ergebnis (auch der Fallback) wird im ASSET_CACHE abgelegt.
     """
-    filename = f"{raum.name.lower().replace(' ', '_')}.png"
-    path = os.path.join(ASSETS_DIR, filename)
-    surf = pygame.Surface(target_size)
-    if os.path.exists(path):
+    target_size = tuple(target_size)
+    path = room_background_source(raum, target_size)
+
+    def loader():
+        with PROFILER.span("asset:load_room_background"):
+            if path is not None:
+                img = decode_room_background(path, target_size)
+                if img is not None:
+                    return img.convert()
+            # Fallback: einfärben + Titel (wird ebenfalls gecacht, auch bei kaputter Datei)
+            surf = pygame.Surface(target_size)
+            surf.fill(DARK_BLUE)
+            title = FONT_BIG.render(raum.name, True, ACCENT)
+            surf.blit(title, title.get_rect(center=(target_size[0] // 2, 30)))
+            return surf
+
+    key = path if path is not None else "fallback:" + raum.name
+    return ASSET_CACHE.get_or_load((key, target_size, "opaque"), loader)
+
+def decode_room_background(path: str, target_size: Tuple[int, int]) -> Optional[pygame.Surface]:
+    """Lädt + skaliert einen Hintergrund ohne convert() – darf auch im Worker-Thread laufen."""
+    with PROFILER.span("asset:decode_room_background"):
+        if path.endswith(RAW_EXT):
+            return raw_laden(path)
         try:
-            img = pygame.image.load(path).convert()
-            img = pygame.transform.smoothscale(img, target_size)
-            return img
+            return pygame.transform.smoothscale(pygame.image.load(path), tuple(target_size))
         except Exception:
-            pass
-
-    # Fallback: einfärben + Titel
-    surf.fill(DARK_BLUE)
-    title = FONT_BIG.render(raum.name, True, ACCENT)
-    surf.blit(title, title.get_rect(center=(target_size[0] // 2, 30)))
-    return surf
-
-def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
-    words = text.split(" ")
-    lines = []
-    cur = ""
-    for w in words:
-        test = (cur + " " + w).strip()
-        if font.size(test)[0] <= max_width:
-            cur = test
-        else:
-            lines.append(cur)
-            cur = w
-    if cur:
-        lines.append(cur)
-    return lines
+            return None
+
+def portrait_stimmung(person: Person, antwort: Optional[str] = None) -> str:
+    """Ausdruck fürs Portrait: Reaktion auf die Antwort, sonst nach Beziehung."""
+    if antwort == "ja":
+        return "Happy"
+    if antwort == "nein":
+        return "Sad"
+    if antwort == "smalltalk":
+        return "Yappen" if person.rede_lust > 3 else "Neutral"
+    if person.relationship >= 4:
+        return "Happy"
+    if person.relationship < 0:
+        return "Angry"
+    return "Question"
+
+def prefetch_jobs_for_rooms(raeume: List[Raum], room_size: Tuple[int, int],
+                            atlas: Optional[PortraitAtlas] = None) -> List[PrefetchJob]:
+    """
+    Vorlade-Aufträge für die Hintergründe der Räume und die Portraits aller Personen darin.
+    Mit atlas: alle Ausdrücke der Personen, die dort noch fehlen (nur ohne gebackenen Atlas).
+    """
+    jobs = []
+    room_size = tuple(room_size)
+    for raum in raeume:
+        path = room_background_source(raum, room_size)
+        if path is not None:
+            jobs.append(PrefetchJob((path, room_size, "opaque"),
+                                    lambda p=path: decode_room_background(p, room_size), "opaque"))
+        for person in raum.personen:
+            if atlas is not None:
+                ppaths = list(atlas.fehlende_quellen(person.name).values())
+            else:
+                ppaths = [person_portrait_source(person.name, PORTRAIT_SIZE)]
+            for ppath in ppaths:
+                if ppath is not None:
+                    jobs.append(PrefetchJob((ppath, PORTRAIT_SIZE, "alpha"),
+                                            lambda p=ppath: decode_person_portrait(p, PORTRAIT_SIZE), "alpha"))
+    return jobs
+
+# Ziel für F4, wenn kein --profil angegeben ist (Chrome-Trace, öffnen mit chrome://tracing)
+DEFAULT_PROFIL_PFAD = "frame_trace.json"
+
+# Standard-Ordner für den Autosave (python pygame_game.py)
+SPIELSTAND_DIR = os.path.join(os.path.dirname(__file__), "../savegame")
 
 class GameApp:
-    def __init__(self, width=1280, height=720):
+    def __init__(self, width=1280, height=720, full_redraw: bool = False, spielstand_ordner: Optional[str] = None,
+                 profil_pfad: Optional[str] = None, aufnahme_pfad: Optional[str] = None):
         self.width = width
         self.height = height
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        # full_redraw=True: altes Verhalten (jeden Frame alles zeichnen + flip), sonst nur schmutzige Bereiche
+        self.full_redraw = full_redraw
+        # Nur die Subsysteme, die das Spiel braucht (kein Audio, kein Joystick)
+        pygame.display.init()
+        pygame.font.init()
+        self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
         pygame.display.set_caption("Team-Adventure (Pygame)")
+        STARTZEIT.abschnitt("init")
+        # Schriften jetzt auflösen – beim ersten Mal mit System-Scan, danach aus dem Pfad-Cache
+        for font in (FONT, FONT_SMALL, FONT_BIG):
+            font.font
+        STARTZEIT.abschnitt("fonts")
 
-        # Setup-Daten laden (Personen & Räume)
-        setup = Setup()
-        self.personen = setup.personen_erzeugen()
-        self.raeume = setup.raum_erzeugen(self.personen)
-        self.aktueller_raum: Raum = self.raeume["flur"]
+        # Spiellogik (Personen, Räume, Aufgaben) steckt in der Engine
+        if spielstand_ordner and spielstand.existiert(spielstand_ordner):
+            self.engine = spielstand.laden(spielstand_ordner)
+        else:
+            self.engine = Engine()
+        # Autosave im Hintergrund (nur mit spielstand_ordner)
+        self.autosaver = spielstand.Autosaver(self.engine, spielstand_ordner) if spielstand_ordner else None
+        # Kleine Karten: alle kürzesten Wege vorab berechnen
+        self.engine.navigation.warm()
+        STARTZEIT.abschnitt("welt")
 
-        # UI-Elemente (Panels)
-        self.panel_people = Panel(pygame.Rect(self.width - 330, 20, 310, 280), "Personen hier")
-        self.panel_nav = Panel(pygame.Rect(self.width - 330, 320, 310, 220), "Wechseln")
-        self.panel_tasks = Panel(pygame.Rect(self.width - 330, 560, 310, 140), "Aufgaben")
-        self.log = TextLog(pygame.Rect(20, self.height - 180, self.width - 370, 160), max_lines=8)
+        # UI-Elemente: alle Bereiche aus der Fenstergröße (layout.py)
+        self.layout: FensterLayout = fenster_layout((self.width, self.height))
+        self.panel_people = Panel(self.layout.personen, "Personen hier")
+        self.panel_nav = Panel(self.layout.wechseln, "Wechseln")
+        self.panel_tasks = Panel(self.layout.aufgaben, "Aufgaben")
+        self.log = TextLog(self.layout.log, max_lines=8)
 
-        # Buttons dynamisch je nach Raum
-        self.person_buttons: List[Button] = []
-        self.nav_buttons: List[Button] = []
-        self.task_buttons: List[Button] = []
+        # Virtualisierte Listen; ihre Zeilen werden je Raumzustand gecacht
+        self.people_list = ScrollList(self.list_area(self.panel_people), self.on_person_clicked)
+        self.nav_list = ScrollList(self.list_area(self.panel_nav), lambda ziel: self.on_change_room(ziel.name))
+        self.task_list = ScrollList(self.list_area(self.panel_tasks), self.on_task_selected, 36, 6)
+        self.layout_cache = LayoutCache()
+        # Raum, für den die Listen zuletzt gebaut wurden (Scrollposition bleibt nur im selben Raum)
+        self._ui_raum: Optional[str] = None
 
         # Action-Buttons (Dialogoptionen), eingeblendet wenn Person angeklickt
         self.dialog_buttons: List[Button] = []
         self.active_person: Optional[Person] = None
-        self.active_portrait: Optional[pygame.Surface] = None
+        # Angezeigtes Portrait: (Personenname, Ausdruck); die Bilder liegen im Atlas
+        self.portrait: Optional[Tuple[str, str]] = None
 
-        # Preload Hintergrund
-        self.room_bg = load_room_background(self.aktueller_raum, (self.width - 360, self.height - 200))
+        # Maus-Events gehen nur an den Button unter dem Cursor
+        self.hit_index: HitIndex[Button] = HitIndex()
+        self.hovered: Optional[Button] = None
 
-        self.rebuild_room_ui(full=True)
+        # Nachbarräume werden im Hintergrund vorgeladen
+        self.room_area = self.layout.raum
+        self.room_size = self.room_area.size
+        self.prefetcher = AssetPrefetcher(ASSET_CACHE)
+        # Alle Ausdrücke aller Personen; ohne Bake werden vorgeladene Einzelbilder aus dem Cache übernommen
+        self.portraits = PortraitAtlas(PORTRAIT_SIZE, decode=self.decode_portrait)
+
+        # Frame-Profiler: F3 blendet die Quantile ein, F4 schreibt den Trace nach profil_pfad
+        self.profil_pfad = profil_pfad
+        if profil_pfad:
+            PROFILER.enabled = True
+        self.profiler_overlay = ProfilerOverlay((30, 30), PROFILER)
+
+        # Frame-Zähler (für Aufnahmen) und optionale Aufnahme der Aktionen (siehe aufnahme.py)
+        self.frame = 0
+        self.aufnahme: Optional[Aufnahme] = None
+        if aufnahme_pfad:
+            mit_zustand = bool(spielstand_ordner and spielstand.existiert(spielstand_ordner))
+            self.aufnahme = Aufnahme(aufnahme_pfad, self.engine, mit_zustand=mit_zustand)
+
+        # Welt-Uhr: Spielminute beim Start (aus dem Spielstand) und Echtzeit-Bezugspunkt
+        self.uhr_start = (self.engine.zeit, pygame.time.get_ticks())
+
+        # Hintergrund und Atlas kommen erst nach dem ersten Frame (finish_startup)
+        self.room_bg: Optional[pygame.Surface] = None
+        self.rebuild_room_ui(full=True, assets=False)
         self.log.add("Willkommen zum Team-Adventure! (Pygame)")
         self.log.add(f"Du befindest dich im {self.aktueller_raum.name}.")
 
         self.clock = pygame.time.Clock()
         self.running = True
 
-    def rebuild_room_ui(self, full=False):
+    def engine_setzen(self, engine: Engine):
+        """
+        Andere Engine übernehmen (z. B. frische Welt je Wiedergabe-Runde): alles,
+        was an der alten hing – Listen-Cache, Gesprächszustand, Portrait, Uhr,
+        Autosave – wird neu aufgesetzt.
+        """
+        if self.autosaver is not None:
+            ordner = self.autosaver.ordner
+            self.autosaver.close()
+            # Der Spielstand beschreibt die alte Engine – neue Deltas gehören auf einen neuen Snapshot
+            self.autosaver = spielstand.Autosaver(engine, ordner, ersetzen=True)
+        self.engine = engine
+        engine.navigation.warm()
+        # Cache-Schlüssel enthalten die alte Welt; ohne clear() blieben sie (und die Welt) am Leben
+        self.layout_cache.clear()
+        self._ui_raum = None
+        self.portrait = None
+        self.hovered = None
+        self.uhr_start = (engine.zeit, pygame.time.get_ticks())
+        self.rebuild_room_ui(full=True)
+
+    def rebuild_room_ui(self, full=False, assets=True):
         """Erstellt die Buttons neu, basierend auf dem aktuellen Raumzustand."""
         if full:
-            self.room_bg = load_room_background(self.aktueller_raum, (self.width - 360, self.height - 200))
-
-        # Personen-Buttons
-        self.person_buttons.clear()
-        x = self.panel_people.rect.x + 15
-        y = self.panel_people.rect.y + 50
-        for p in self.aktueller_raum.personen:
-            rect = pygame.Rect(x, y, 280, 40)
-            self.person_buttons.append(Button(rect, f"{p.name} ({p.rolle})", lambda pers=p: self.on_person_clicked(pers)))
-            y += 50
-
-        # Navigations-Buttons (verbindungen)
-        self.nav_buttons.clear()
-        x = self.panel_nav.rect.x + 15
-        y = self.panel_nav.rect.y + 50
-        for vr in self.aktueller_raum.verbindungen:
-            rect = pygame.Rect(x, y, 280, 40)
-            self.nav_buttons.append(Button(rect, vr.name, lambda ziel=vr: self.on_change_room(ziel.name)))
-            y += 50
+            DIRTY.mark_all()
+
+        # Personen und Ausgänge: Zeilen aus dem Cache, Buttons aus dem Pool der Listen
+        engine = self.engine
+        raum = self.aktueller_raum
+        keep_scroll = engine.raum_key == self._ui_raum
+        self._ui_raum = engine.raum_key
+        self.build_people_buttons(keep_scroll)
+        self.nav_list.set_rows(self.layout_cache.get(
+            (engine.welt, engine.raum_key, "wechseln", engine.welt.kanten_version),
+            lambda: [(vr.name, vr) for vr in raum.verbindungen]), keep_scroll)
 
         # Aufgaben-Buttons (im Raum vorhandene Aufgaben ausführen)
         self.build_task_buttons()
@@ -250,185 +628,464 @@ class GameApp:
         # Dialog-Buttons leeren
         self.dialog_buttons.clear()
         self.active_person = None
+        self.rebuild_hit_index()
+
+        # Erst jetzt: das Vorladen richtet sich nach den sichtbaren Ausgängen
+        if full and assets:
+            self.load_room_assets()
+
+    def load_room_assets(self):
+        # Bereits fertig vorgeladene Assets übernehmen, bevor wir laden
+        self.prefetcher.pump(max_convert=None)
+        self.room_bg = load_room_background(self.aktueller_raum, self.room_size)
+        DIRTY.mark(self.room_area)
+        self.prefetch_neighbours()
+
+    def finish_startup(self):
+        """Nach dem ersten Frame: Raumhintergrund und Portrait-Atlas laden, Nachbarn vorladen."""
+        if self.room_bg is None:
+            self.room_bg = load_room_background(self.aktueller_raum, self.room_size)
+            DIRTY.mark(self.room_area)
+            STARTZEIT.abschnitt("erstes asset")
+        with PROFILER.span("asset:portrait_atlas"):
+            self.portraits.laden()
+        STARTZEIT.abschnitt("portraits")
+        # Welt, NPCs und Atlas leben bis zum Ende: aus dem GC nehmen, sonst scannt jede volle Sammlung sie erneut
+        gc.collect()
+        gc.freeze()
+        self.prefetch_neighbours()
+
+    def prefetch_neighbours(self):
+        """Hintergründe + Portraits des Raums und der gerade sichtbaren Ausgänge im Hintergrund vorladen."""
+        nav = self.nav_list
+        raeume = [self.aktueller_raum] + [nav.rows[i][1] for i in nav.fenster.sichtbar()]
+        self.prefetcher.schedule(prefetch_jobs_for_rooms(raeume, self.room_size, self.portraits))
+
+    @staticmethod
+    def decode_portrait(path: str, target_size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """Für den Atlas-Fallback: vorgeladenes Bild aus dem Cache nehmen (und dort freigeben), sonst dekodieren."""
+        img = ASSET_CACHE.get((path, tuple(target_size), "alpha"))
+        if img is not None:
+            ASSET_CACHE.invalidate(path)
+            return img
+        return decode_person_portrait(path, target_size)
+
+    def build_people_buttons(self, keep_scroll: bool = True):
+        """Personen hier; Cache-Schlüssel ist der Änderungszähler des Raums in der Belegung."""
+        welt, raum_key = self.engine.welt, self.engine.raum_key
+        raum = self.aktueller_raum
+        self.people_list.set_rows(self.layout_cache.get(
+            (welt, raum_key, "personen", welt.belegung.version(raum_key)),
+            lambda: [(f"{p.name} ({p.rolle})", p) for p in raum.personen]), keep_scroll)
 
     def build_task_buttons(self):
-        self.task_buttons.clear()
-        x = self.panel_tasks.rect.x + 15
-        y = self.panel_tasks.rect.y + 50
-        if not self.aktueller_raum.aufgaben:
-            rect = pygame.Rect(x, y, 280, 36)
-            self.task_buttons.append(Button(rect, "Keine Aufgaben hier", lambda: None))
+        register = self.engine.welt.aufgaben
+        key = (self.engine.welt, self.engine.raum_key, "aufgaben", register.version)
+        self.task_list.set_rows(self.layout_cache.get(key, self.task_rows), keep_scroll=True)
+        self.rebuild_hit_index()
+
+    def task_rows(self) -> List[Zeile]:
+        """Aufgaben hier (Klick → ausführen), danach offene Aufgaben anderswo (Klick → Auto-Reise)."""
+        rows: List[Zeile] = [(f"[{a.id}] {a.name}", ("execute", a.id)) for a in self.engine.aufgaben_hier()]
+        if not rows:
+            rows.append(("Keine Aufgaben hier", None))
+        rows += [(f"→ {self.raeume[a.raum].name}: {a.name}", ("travel", a.id))
+                 for a in self.engine.welt.aufgaben.offene() if a.raum != self.engine.raum_key]
+        return rows
+
+    def on_task_selected(self, wert: Tuple[str, int]):
+        aktion, aufgabe_id = wert
+        if aktion == "execute":
+            self.on_execute_task(aufgabe_id)
+        else:
+            self.on_travel_to_task(aufgabe_id)
+
+    @property
+    def person_buttons(self) -> List[Button]:
+        return self.people_list.buttons
+
+    @property
+    def nav_buttons(self) -> List[Button]:
+        return self.nav_list.buttons
+
+    @property
+    def task_buttons(self) -> List[Button]:
+        return self.task_list.buttons
+
+    @staticmethod
+    def list_area(panel: Panel) -> pygame.Rect:
+        """Platz für die Listenzeilen unter dem Panel-Titel."""
+        r = panel.rect
+        return pygame.Rect(r.x + 15, r.y + 50, r.width - 30, r.height - 60)
+
+    def resize(self, width: int, height: int):
+        """Neues Layout für eine andere Fenstergröße; der Raumhintergrund wird passend neu geladen."""
+        if width < MIN_FENSTER[0] or height < MIN_FENSTER[1]:
+            width, height = max(width, MIN_FENSTER[0]), max(height, MIN_FENSTER[1])
+            pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        # Bei RESIZABLE passt SDL die Display-Surface selbst an
+        self.screen = pygame.display.get_surface()
+        self.width, self.height = width, height
+        self.layout = fenster_layout((width, height))
+        self.panel_people.rect = self.layout.personen
+        self.panel_nav.rect = self.layout.wechseln
+        self.panel_tasks.rect = self.layout.aufgaben
+        self.log.rect = self.layout.log
+        for panel, lst in self.sidebar_lists():
+            lst.set_rect(self.list_area(panel))
+        if self.room_area.size != self.layout.raum.size:
+            self.room_area = self.layout.raum
+            self.room_size = self.room_area.size
+            if self.room_bg is not None:
+                self.load_room_assets()
+        if self.dialog_buttons:
+            self.build_dialog_buttons()
+        DIRTY.mark_all()
+        self.rebuild_hit_index()
+
+    def sidebar_lists(self) -> List[Tuple[Panel, ScrollList]]:
+        return [(self.panel_people, self.people_list), (self.panel_nav, self.nav_list),
+                (self.panel_tasks, self.task_list)]
+
+    def rebuild_hit_index(self):
+        """Hit-Test-Index neu aufbauen, nachdem sich Button-Listen geändert haben."""
+        self.hit_index.build(self.person_buttons + self.nav_buttons + self.task_buttons + self.dialog_buttons)
+        # Hover neu bestimmen: der alte Button kann verschwunden sein, unter dem Cursor ein neuer liegen
+        pos = pygame.mouse.get_pos() if pygame.mouse.get_focused() else None
+        self.update_hover(self.hit_index.query(pos) if pos else None)
+
+    def update_hover(self, button: Optional[Button]):
+        """Enter/Leave-Übergänge: nur alter und neuer Hover-Button werden angefasst."""
+        if button is self.hovered:
             return
-        for aufgabe in self.aktueller_raum.aufgaben:
-            # Jede Aufgabe per Klick ausführen
-            label = f"[{aufgabe.id}] {aufgabe.name}"
-            rect = pygame.Rect(x, y, 280, 36)
-            self.task_buttons.append(Button(rect, label, lambda a_id=aufgabe.id: self.on_execute_task(a_id)))
-            y += 42
+        if self.hovered is not None:
+            self.hovered.set_hover(False)
+        self.hovered = button
+        if button is not None:
+            button.set_hover(True)
+
+    def handle_mouse(self, event: pygame.event.Event):
+        if event.type == pygame.MOUSEMOTION:
+            self.update_hover(self.hit_index.query(event.pos))
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            button = self.hit_index.query(event.pos)
+            if button is not None:
+                button.click()
+
+    @property
+    def personen(self):
+        return self.engine.personen
+
+    @property
+    def raeume(self):
+        return self.engine.raeume
+
+    @property
+    def aktueller_raum(self) -> Raum:
+        return self.engine.aktueller_raum
+
+    def log_result(self, result: ActionResult) -> ActionResult:
+        for line in result.messages:
+            self.log.add(line)
+        return result
+
+    def aufzeichnen(self, aktion: str, arg):
+        if self.aufnahme is not None:
+            self.aufnahme.aufzeichnen(self.frame, aktion, arg, self.engine.zeit)
+
+    def welt_ticken(self):
+        """Pro Frame: Welt-Uhr aus der Echtzeit nachführen (eine Spielminute je MS_PRO_MINUTE)."""
+        minute, start_ms = self.uhr_start
+        self.zeit_anwenden(minute + (pygame.time.get_ticks() - start_ms) // MS_PRO_MINUTE)
+
+    def zeit_anwenden(self, zeit: int):
+        """Welt bis zur Minute zeit laufen lassen; nur Wechsel im aktuellen Raum berühren die UI."""
+        bewegungen = self.engine.zeit_bis(zeit)
+        meldungen = self.engine.bewegungen_hier(bewegungen)
+        if not meldungen:
+            return
+        for line in meldungen:
+            self.log.add(line)
+        self.build_people_buttons()
+        # Portrait einer Person, die gegangen ist, ausblenden
+        if self.portrait and self.engine.person_by_name(self.portrait[0]) is None:
+            self.portrait = None
+            DIRTY.mark(self.room_area)
+        self.rebuild_hit_index()
 
     def on_person_clicked(self, person: Person):
         """Person ausgewählt → Dialogoptionen zeigen (statt input())."""
-        self.active_person = person
-        # Portrait laden (z. B. ../assets/People/Kirsten/kirstenNeutral.png)
-        self.active_portrait = load_person_portrait(person.name, (420, 420))
-        if self.active_portrait:
-            self.log.add(f"[Portrait] {person.name} geladen.")
-        else:
+        self.aufzeichnen("talk", person.name)
+        result = self.engine.talk(person)
+        if not result:
+            self.log_result(result)
+            return
+        # None, wenn der Dialog schon mit dem ersten Satz endet
+        self.active_person = self.engine.active_person
+        # Portrait aus dem Atlas, Ausdruck aus dem Dialog oder je nach Beziehung
+        self.portrait = (person.name, result.ausdruck or portrait_stimmung(person))
+        if self.portraits.lookup(person.name) is None:
             self.log.add(f"[Portrait] Für {person.name} nicht gefunden.")
-        self.log.add(f"{person.name}: \"Hallo! Möchtest du etwas für mich erledigen?\"")
+        self.log_result(result)
         self.dialog_buttons.clear()
+        DIRTY.mark(self.room_area)
 
-        # Drei Optionen wie in eurer Terminal-Version
-        base_y = self.height - 220
-        options = [
-            ("Ja", lambda: self.choose_dialog("ja")),
-            ("Nein", lambda: self.choose_dialog("nein")),
-            ("Smalltalk", lambda: self.choose_dialog("smalltalk")),
-        ]
-        x = 30
-        for text, cb in options:
-            rect = pygame.Rect(x, base_y, 160, 38)
-            self.dialog_buttons.append(Button(rect, text, cb))
-            x += 180
+        self.build_dialog_buttons()
+
+    def build_dialog_buttons(self):
+        """Ein Button je Antwort, die der Dialog gerade anbietet; passen nicht alle in eine Reihe, weitere darüber."""
+        self.dialog_buttons.clear()
+        je_reihe = max(1, (self.layout.raum.right - 30) // 180)
+        for i, (antwort, label) in enumerate(self.engine.antworten()):
+            reihe, spalte = divmod(i, je_reihe)
+            rect = pygame.Rect(30 + spalte * 180, self.layout.dialog_y - reihe * 46, 160, 38)
+            self.dialog_buttons.append(Button(rect, label[:1].upper() + label[1:],
+                                              lambda antwort=antwort: self.choose_dialog(antwort)))
+        self.rebuild_hit_index()
 
     def choose_dialog(self, answer: str):
-        p = self.active_person
-        if p is None:
+        self.aufzeichnen("answer", answer)
+        if self.active_person is None:
             return
-        ans = answer.lower()
-        if ans == "ja":
-            self.log.add(f"Du: \"Ja.\"")
-            self.log.add(f"{p.name}: \"Super! Ich habe eine Aufgabe für dich.\"")
-            # Aufgabe erzeugen: aus alter Spiel-Logik übernommen
-            self.create_task_from_person(p)
-            p.relationship += 2
-            self.log.add(f"(Beziehung zu {p.name} +2 → {p.relationship})")
+        self.log.add(f"Du: \"{answer.capitalize()}.\"")
+        person = self.active_person
+        result = self.log_result(self.engine.answer(answer))
+        # Portrait bleibt stehen und zeigt die Reaktion (nur ein anderer Atlas-Ausschnitt)
+        self.portrait = (person.name, result.ausdruck or portrait_stimmung(person, answer))
+        if result.aufgabe is not None:
             # Aufgaben-Panel neu bauen
             self.build_task_buttons()
-        elif ans == "smalltalk":
-            self.log.add("Du: \"Smalltalk.\"")
-            if p.rede_lust > 3:
-                self.log.add(f"{p.name}: \"Oh, ich rede so gerne... Übrigens, wusstest du schon, dass ...\"")
-            else:
-                self.log.add(f"{p.name}: \"Hm, na gut.\"")
-            p.relationship += 1
-            self.log.add(f"(Beziehung zu {p.name} +1 → {p.relationship})")
-        elif ans == "nein":
-            self.log.add("Du: \"Nein.\"")
-            self.log.add(f"{p.name}: \"Schade, vielleicht später!\"")
-        else:
-            self.log.add(f"{p.name}: \"Okay.\"")
+        DIRTY.mark(self.room_area)
 
+        if self.engine.active_person is not None:
+            # Gespräch geht weiter: Buttons für den nächsten Knoten
+            self.build_dialog_buttons()
+            return
         # Dialog-Buttons schließen
         self.dialog_buttons.clear()
         self.active_person = None
-        self.active_portrait = None
+        self.rebuild_hit_index()
 
     def create_task_from_person(self, person: Person):
         """Erzeugt eine Aufgabe abhängig von der Person und legt sie im passenden Raum ab."""
-        if person.name == "Holger":
-            neue_aufgabe = Aufgabe(10, "Brief abgeben", "Gehe zur Post und gib den Brief ab.")
-            self.raeume["post"].aufgaben.append(neue_aufgabe)
-            self.log.add(f"{person.name} gibt dir die Aufgabe: [{neue_aufgabe.id}] {neue_aufgabe.name}")
-        elif person.name == "Flo":
-            neue_aufgabe = Aufgabe(11, "Dokument drucken", "Drucke ein Dokument im Druckerraum.")
-            self.raeume["druckerraum"].aufgaben.append(neue_aufgabe)
-            self.log.add(f"{person.name} gibt dir die Aufgabe: [{neue_aufgabe.id}] {neue_aufgabe.name}")
-        elif person.name == "Kirsten":
-            neue_aufgabe = Aufgabe(12, "Technik kontrollieren", "Überprüfe die Technik im Technikraum.")
-            self.raeume["technikraum"].aufgaben.append(neue_aufgabe)
-            self.log.add(f"{person.name} gibt dir die Aufgabe: [{neue_aufgabe.id}] {neue_aufgabe.name}")
-        else:
-            self.log.add(f"{person.name} hat aktuell keine Aufgabe für dich.")
+        return self.log_result(self.engine.accept_task(person))
 
     def raum_wechseln(self, neuer_raum: str):
         """Wechselt den Raum, wenn eine Verbindung existiert (neuer_raum: lowercase Name)."""
-        for raum in self.aktueller_raum.verbindungen:
-            if raum.name.lower() == neuer_raum:
-                self.aktueller_raum = raum
-                self.log.add(f"Du bist jetzt im {self.aktueller_raum.name}.")
-                return
-        self.log.add("Du kannst nicht dorthin gehen.")
+        return self.log_result(self.engine.move(neuer_raum))
 
     def aufgabe_ausfuehren(self, aufgabe_id: int):
         """Führt eine Aufgabe im aktuellen Raum aus und entfernt sie."""
-        for aufgabe in list(self.aktueller_raum.aufgaben):
-            if aufgabe.id == aufgabe_id:
-                self.log.add(f"Aufgabe '{aufgabe.name}' ausgeführt!")
-                self.aktueller_raum.aufgaben.remove(aufgabe)
-                return
-        self.log.add("Ungültige Aufgaben-ID.")
+        return self.log_result(self.engine.execute_task(aufgabe_id))
 
     def on_change_room(self, zielraum_name: str):
         """Raumwechsel via Button."""
+        self.aufzeichnen("move", zielraum_name.lower())
         self.raum_wechseln(zielraum_name.lower())
         self.rebuild_room_ui(full=True)
-        self.active_portrait = None
+        self.portrait = None
+
+    def on_travel_to_task(self, aufgabe_id: int):
+        """Auto-Reise über den kürzesten Weg in den Raum der Aufgabe."""
+        self.aufzeichnen("travel", aufgabe_id)
+        self.log_result(self.engine.travel_to_task(aufgabe_id))
+        self.rebuild_room_ui(full=True)
+        self.portrait = None
 
     def on_execute_task(self, aufgabe_id: int):
         """Aufgabe im aktuellen Raum ausführen (wie 'aufgabe_ausfuehren')."""
-        # Prüfen, ob Aufgabe existiert
-        found = False
-        for a in list(self.aktueller_raum.aufgaben):
-            if a.id == aufgabe_id:
-                found = True
-                self.log.add(f"Aufgabe '{a.name}' ausgeführt!")
-                self.aktueller_raum.aufgaben.remove(a)
-                break
-        if not found:
-            self.log.add("Ungültige Aufgaben-ID oder Aufgabe nicht in diesem Raum.")
+        self.aufzeichnen("execute", aufgabe_id)
+        self.aufgabe_ausfuehren(aufgabe_id)
         self.build_task_buttons()
 
     def draw(self):
+        if self.full_redraw:
+            DIRTY.clear()
+            self.draw_scene()
+            with PROFILER.span("present"):
+                pygame.display.flip()
+            return
+
+        # Nur geänderte Bereiche neu zeichnen
+        rects = DIRTY.pop(self.screen.get_rect())
+        if not rects:
+            return
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self.draw_scene(rect)
+        self.screen.set_clip(None)
+        with PROFILER.span("present"):
+            pygame.display.update(rects)
+
+    def draw_scene(self, area: Optional[pygame.Rect] = None):
+        """Zeichnet alle Ebenen. Mit area nur die Elemente, die diesen Bereich berühren."""
+        def visible(rect: pygame.Rect) -> bool:
+            return area is None or rect.colliderect(area)
+
         self.screen.fill((15, 15, 20))
 
         # Hintergrund / Raumfläche links
-        room_area = pygame.Rect(20, 20, self.width - 360, self.height - 200)
-        pygame.draw.rect(self.screen, BLACK, room_area, 2, border_radius=16)
-        self.screen.blit(self.room_bg, room_area)
+        room_area = self.room_area
+        if visible(room_area):
+            with PROFILER.span("draw:background"):
+                pygame.draw.rect(self.screen, BLACK, room_area, 2, border_radius=16)
+                if self.room_bg is not None:
+                    self.screen.blit(self.room_bg, room_area)
+                else:
+                    # Erster Frame: Hintergrund wird gleich danach geladen
+                    self.screen.fill(DARK_BLUE, room_area)
 
         # Portrait im Raum-Bereich anzeigen, falls vorhanden
-        if self.active_portrait:
-            portrait_frame = pygame.Rect(room_area.x + 600, room_area.y + 120, 320, 420)
-            img_rect = self.active_portrait.get_rect(center=portrait_frame.center)
-            prev_clip = self.screen.get_clip()
-            self.screen.set_clip(portrait_frame)
-            self.screen.blit(self.active_portrait, img_rect)
-            self.screen.set_clip(prev_clip)
-            if self.active_person:
-                name_ts = FONT_BIG.render(self.active_person.name, True, WHITE)
-                self.screen.blit(name_ts, (portrait_frame.x + 12, portrait_frame.y + 10))
+        if self.portrait:
+            portrait_frame = self.layout.portrait
+            if visible(portrait_frame):
+                with PROFILER.span("draw:portrait"):
+                    name, ausdruck = self.portrait
+                    prev_clip = self.screen.get_clip()
+                    self.screen.set_clip(portrait_frame.clip(prev_clip))
+                    shown = self.portraits.blit(self.screen, name, ausdruck, portrait_frame.center,
+                                                hoehe=portrait_frame.height)
+                    self.screen.set_clip(prev_clip)
+                    if shown:
+                        name_ts = render_text(FONT_BIG, name, WHITE)
+                        self.screen.blit(name_ts, (portrait_frame.x + 12, portrait_frame.y + 10))
 
         # Panels
-        self.panel_people.draw(self.screen)
-        self.panel_nav.draw(self.screen)
-        self.panel_tasks.draw(self.screen)
+        with PROFILER.span("draw:panels"):
+            for panel in (self.panel_people, self.panel_nav, self.panel_tasks):
+                if visible(panel.rect):
+                    panel.draw(self.screen)
 
-        # Buttons
-        for b in self.person_buttons: b.draw(self.screen)
-        for b in self.nav_buttons: b.draw(self.screen)
-        for b in self.task_buttons: b.draw(self.screen)
-        for b in self.dialog_buttons: b.draw(self.screen)
+        # Listen und Dialog-Buttons (je Gruppe ein eigener Abschnitt im Profiler)
+        for group, lst in (("draw:people", self.people_list), ("draw:nav", self.nav_list),
+                           ("draw:tasks", self.task_list)):
+            if visible(lst.rect):
+                with PROFILER.span(group):
+                    lst.draw(self.screen, area)
+        with PROFILER.span("draw:dialog"):
+            for b in self.dialog_buttons:
+                if visible(b.rect):
+                    b.draw(self.screen)
 
         # Log
-        self.log.draw(self.screen)
+        if visible(self.log.rect):
+            with PROFILER.span("draw:log"):
+                self.log.draw(self.screen)
+
+        # Profiler-Overlay ganz oben
+        if self.profiler_overlay.visible and visible(self.profiler_overlay.rect):
+            self.profiler_overlay.draw(self.screen)
+
+    def wait_events(self) -> List[pygame.event.Event]:
+        """
+        Holt die Events dieses Frames. Gibt es nichts neu zu zeichnen, blockiert
+        die Loop in pygame.event.wait, statt 60x pro Sekunde leer zu laufen.
+        """
+        if self.full_redraw or DIRTY:
+            return pygame.event.get()
+        timeout = IDLE_WAIT_PREFETCH_MS if self.prefetcher.busy else IDLE_WAIT_MS
+        first = pygame.event.wait(timeout)
+        events = [] if first.type == pygame.NOEVENT else [first]
+        return events + pygame.event.get()
 
-        pygame.display.flip()
+    def toggle_full_redraw(self):
+        self.full_redraw = not self.full_redraw
+        DIRTY.mark_all()
+        self.log.add(f"[Render] Vollbild-Neuzeichnen {'an' if self.full_redraw else 'aus'}.")
 
     def run(self):
+        # Erst ein sichtbarer Frame, dann die nicht-kritischen Assets
+        self.draw()
+        STARTZEIT.abschnitt("erster frame")
+        self.finish_startup()
+
         while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                # Button Events
-                for b in (self.person_buttons + self.nav_buttons + self.task_buttons + self.dialog_buttons):
-                    b.handle_event(event)
+            events = self.wait_events()
+            # Wartezeit zählt nicht zum Frame
+            PROFILER.begin_frame()
+            with PROFILER.span("events"):
+                self.handle_events(events)
 
+            with PROFILER.span("welt"):
+                self.welt_ticken()
+            with PROFILER.span("prefetch"):
+                self.prefetcher.pump()
+            if self.autosaver:
+                with PROFILER.span("autosave"):
+                    self.autosaver.tick()
+            self.profiler_overlay.update()
             self.draw()
+            PROFILER.end_frame()
+            self.frame += 1
             self.clock.tick(60)
 
+        self.prefetcher.shutdown()
+        if self.autosaver:
+            self.autosaver.close()
+        if self.profil_pfad:
+            PROFILER.export(self.profil_pfad)
+        if self.aufnahme is not None:
+            self.aufnahme.close(self.frame)
+        # Font-Objekte sterben mit pygame.quit(); eine weitere GameApp muss sie neu bauen
+        FONTS.reset()
         pygame.quit()
 
+    def handle_events(self, events: List[pygame.event.Event]):
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                DIRTY.mark_all()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                self.toggle_full_redraw()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler_overlay.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                self.export_profile()
+            elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+                # Button Events (nur an den Button unter dem Cursor)
+                self.handle_mouse(event)
+            elif event.type == pygame.WINDOWLEAVE:
+                self.update_hover(None)
+            elif event.type == pygame.MOUSEWHEEL:
+                self.handle_wheel(event.y, pygame.mouse.get_pos())
+            elif event.type == pygame.VIDEORESIZE:
+                self.resize(event.w, event.h)
+
+    def handle_wheel(self, y: int, pos: Tuple[int, int]):
+        """Mausrad über dem Log oder einer Liste scrollt diese (y > 0 = nach oben)."""
+        if self.log.rect.collidepoint(pos):
+            self.log.scroll(y)
+            return
+        for panel, lst in self.sidebar_lists():
+            if panel.rect.collidepoint(pos):
+                if lst.scroll(-y):
+                    self.rebuild_hit_index()
+                    if lst is self.nav_list:
+                        self.prefetch_neighbours()
+                return
+
+    def export_profile(self):
+        path = self.profil_pfad or DEFAULT_PROFIL_PFAD
+        PROFILER.export(path)
+        self.log.add(f"[Profiler] Trace gespeichert: {path}")
+
+STARTZEIT.abschnitt("import")
+
 if __name__ == "__main__":
-    app = GameApp()
+    parser = argparse.ArgumentParser(description="Team-Adventure (Pygame)")
+    parser.add_argument("--startzeit", action="store_true", help="Startzeit aufgeschlüsselt ausgeben")
+    parser.add_argument("--nur-start", action="store_true", help="nach dem Start sofort beenden (Kaltstart messen)")
+    parser.add_argument("--groesse", default="1280x720", metavar="BxH", help="Fenstergröße (lässt sich auch ziehen)")
+    parser.add_argument("--aufnahme", metavar="PFAD", help="Aktionen für die Wiedergabe aufzeichnen (aufnahme.py)")
+    parser.add_argument("--profil", metavar="PFAD",
+                        help="Frame-Profiler von Anfang an aktiv; Trace beim Beenden speichern (.csv oder Chrome-JSON)")
+    args = parser.parse_args()
+
+    breite, hoehe = (int(v) for v in args.groesse.lower().split("x"))
+    app = GameApp(breite, hoehe, spielstand_ordner=SPIELSTAND_DIR, profil_pfad=args.profil, aufnahme_pfad=args.aufnahme)
+    if args.nur_start:
+        app.running = False
     app.run()
+    if args.startzeit:
+        print("\n".join(STARTZEIT.bericht()))
@@ -1,8 +1,48 @@
+import sys
+
+from kompakt import LEER, liste
+
+
 class Raum:
+    # __slots__ statt __dict__; leere Listen teilen sich LEER bis zur ersten Änderung
+    __slots__ = ("name", "beschreibung", "_aufgaben", "_personen", "_gegenstaende", "_verbindungen")
+
     def __init__(self, name, beschreibung, aufgaben=None, personen=None, gegenstaende=None, verbindungen=None):
-        self.name = name
+        self.name = sys.intern(name)
         self.beschreibung = beschreibung
-        self.aufgaben = aufgaben if aufgaben is not None else []
-        self.personen = personen if personen is not None else []
-        self.gegenstaende = gegenstaende if gegenstaende is not None else []
-        self.verbindungen = verbindungen if verbindungen is not None else []
+        self.aufgaben = aufgaben
+        self.personen = personen
+        self.gegenstaende = gegenstaende
+        self.verbindungen = verbindungen
+
+    @property
+    def aufgaben(self):
+        return liste(self, "_aufgaben")
+
+    @aufgaben.setter
+    def aufgaben(self, value):
+        self._aufgaben = value if value is not None else LEER
+
+    @property
+    def personen(self):
+        return liste(self, "_personen")
+
+    @personen.setter
+    def personen(self, value):
+        self._personen = value if value is not None else LEER
+
+    @property
+    def gegenstaende(self):
+        return liste(self, "_gegenstaende")
+
+    @gegenstaende.setter
+    def gegenstaende(self, value):
+        self._gegenstaende = value if value is not None else LEER
+
+    @property
+    def verbindungen(self):
+        return liste(self, "_verbindungen")
+
+    @verbindungen.setter
+    def verbindungen(self, value):
+        self._verbindungen = value if value is not None else LEER
@@ -0,0 +1,210 @@
+# server.py
+"""
+Text-Server: spielt das Terminal-Adventure über TCP mit vielen Sitzungen
+gleichzeitig (asyncio, ein Prozess). Jede Zeile ist ein Befehl wie im
+Terminal-Spiel (gehe/rede/aufgabe/ende), Antworten kommen als Text zurück,
+abgeschlossen vom Prompt. Zeilenenden \\r\\n, UTF-8 – telnet/nc genügen:
+
+    python server.py --port 4000
+    telnet localhost 4000
+
+Die Welt wird einmal über Setup geladen und von allen Sitzungen geteilt;
+jede Verbindung bekommt per Welt.sitzung() nur ihre eigene Schicht
+(Position, Beziehungen, Aufgaben), die erst beim Ändern kopiert wird.
+
+Langsame Clients bremsen niemanden aus: Ausgaben gehen über writer.drain(),
+bleibt der Sendepuffer länger als --schreib-timeout über der Obergrenze,
+wird die Verbindung getrennt. Ebenso nach --leerlauf Sekunden ohne Eingabe.
+"""
+import argparse
+import asyncio
+import gc
+import sys
+import time
+from typing import Dict, Optional
+
+from engine import Engine
+from setup import Setup
+from spiel import TextSitzung
+from welt import DEFAULT_WELT, Welt
+
+ENCODING = "utf-8"
+# Sendepuffer je Verbindung, ab dem drain() wartet
+SCHREIBPUFFER = 64 * 1024
+# Längste erlaubte Eingabezeile
+MAX_ZEILE = 1024
+
+
+class ServerStatistik:
+    def __init__(self):
+        self.aktiv = 0
+        self.gesamt = 0
+        self.abgelehnt = 0
+        self.befehle = 0
+        self.getrennt_langsam = 0
+        self.getrennt_leerlauf = 0
+        self.start = time.perf_counter()
+
+    def zeile(self) -> str:
+        dauer = time.perf_counter() - self.start
+        return (f"{self.aktiv} aktiv, {self.gesamt} gesamt, {self.abgelehnt} abgelehnt, "
+                f"{self.befehle} Befehle ({self.befehle / dauer if dauer else 0:.0f}/s), "
+                f"getrennt: {self.getrennt_langsam} langsam, {self.getrennt_leerlauf} Leerlauf")
+
+
+class _Getrennt(Exception):
+    """Verbindung wird beendet (Client weg, zu langsam oder im Leerlauf)."""
+
+
+class TextServer:
+    """
+    vorlage:        gemeinsame Welt (wird selbst nie gespielt)
+    max_sitzungen:  weitere Verbindungen werden mit einer Meldung abgewiesen
+    schreib_timeout: so lange darf ein voller Sendepuffer höchstens hängen
+    leerlauf:       Sekunden ohne Eingabe bis zur Trennung (0 = nie)
+    """
+    def __init__(self, vorlage: Welt, max_sitzungen: int = 10_000, schreib_timeout: float = 10.0,
+                 leerlauf: float = 900.0):
+        self.vorlage = vorlage
+        self.max_sitzungen = max_sitzungen
+        self.schreib_timeout = schreib_timeout
+        self.leerlauf = leerlauf
+        self.statistik = ServerStatistik()
+        self._server: Optional[asyncio.AbstractServer] = None
+        # Verbindung -> Zeitpunkt der letzten Eingabe (loop.time()), für die Leerlauf-Prüfung
+        self._zuletzt: Dict[asyncio.StreamWriter, float] = {}
+        self._aufraeumen: Optional[asyncio.Task] = None
+
+    async def starten(self, host: str = "127.0.0.1", port: int = 4000) -> int:
+        """Lauscht auf host:port und gibt den tatsächlichen Port zurück (port=0 → frei gewählt)."""
+        self._server = await asyncio.start_server(self.verbindung, host, port, limit=MAX_ZEILE,
+                                                  backlog=1024)
+        if self.leerlauf:
+            self._aufraeumen = asyncio.get_running_loop().create_task(self._leerlauf_pruefen())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stoppen(self):
+        if self._aufraeumen is not None:
+            self._aufraeumen.cancel()
+            self._aufraeumen = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def verbindung(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writer.transport.set_write_buffer_limits(high=SCHREIBPUFFER)
+        stat = self.statistik
+        if stat.aktiv >= self.max_sitzungen:
+            stat.abgelehnt += 1
+            writer.write("Der Server ist voll, bitte später noch einmal versuchen.\r\n".encode(ENCODING))
+            await self._schliessen(writer)
+            return
+        stat.aktiv += 1
+        stat.gesamt += 1
+        loop = asyncio.get_running_loop()
+        self._zuletzt[writer] = loop.time()
+        try:
+            sitzung = TextSitzung(Engine(self.vorlage.sitzung()))
+            await self._senden(writer, sitzung.start(), sitzung.prompt)
+            while not sitzung.beendet:
+                zeile = await self._lesen(reader)
+                if zeile is None:
+                    break
+                self._zuletzt[writer] = loop.time()
+                stat.befehle += 1
+                zeilen = sitzung.eingabe(zeile)
+                await self._senden(writer, zeilen, "" if sitzung.beendet else sitzung.prompt)
+        except _Getrennt:
+            pass
+        finally:
+            stat.aktiv -= 1
+            self._zuletzt.pop(writer, None)
+            await self._schliessen(writer)
+
+    async def _lesen(self, reader: asyncio.StreamReader) -> Optional[str]:
+        """Nächste Zeile ohne Zeilenende; None bei Verbindungsende."""
+        try:
+            daten = await reader.readline()
+        except (ValueError, ConnectionError):
+            # ValueError: Zeile länger als MAX_ZEILE
+            raise _Getrennt()
+        if not daten:
+            return None
+        return daten.decode(ENCODING, "replace").rstrip("\r\n")
+
+    async def _senden(self, writer: asyncio.StreamWriter, zeilen, prompt: str):
+        text = "\n".join(zeilen) + "\n" + prompt
+        writer.write(text.replace("\n", "\r\n").encode(ENCODING))
+        try:
+            if writer.transport.get_write_buffer_size() <= SCHREIBPUFFER:
+                # Puffer unter der Grenze: drain() kehrt sofort zurück, kein Timeout nötig
+                await writer.drain()
+            else:
+                await asyncio.wait_for(writer.drain(), self.schreib_timeout)
+        except asyncio.TimeoutError:
+            self.statistik.getrennt_langsam += 1
+            # close() würde auf das Leeren des Puffers warten, den der Client nicht abholt
+            writer.transport.abort()
+            raise _Getrennt()
+        except ConnectionError:
+            raise _Getrennt()
+
+    async def _leerlauf_pruefen(self):
+        """Trennt regelmäßig Verbindungen ohne Eingabe seit leerlauf Sekunden (ein Timer statt einem je Zeile)."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(min(self.leerlauf / 4, 30.0))
+            grenze = loop.time() - self.leerlauf
+            for writer in [w for w, t in self._zuletzt.items() if t < grenze]:
+                self.statistik.getrennt_leerlauf += 1
+                self._zuletzt.pop(writer)
+                writer.transport.abort()
+
+    async def _schliessen(self, writer: asyncio.StreamWriter):
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+async def _statistik_ausgeben(server: TextServer, intervall: float):
+    while True:
+        await asyncio.sleep(intervall)
+        print(server.statistik.zeile(), flush=True)
+
+
+async def _main(args) -> int:
+    server = TextServer(Setup(args.welt).welt_laden(), max_sitzungen=args.max_sitzungen,
+                        schreib_timeout=args.schreib_timeout, leerlauf=args.leerlauf)
+    # Die geteilte Welt lebt so lange wie der Server: volle GC-Läufe sollen sie nicht jedes Mal durchsuchen
+    gc.collect()
+    gc.freeze()
+    port = await server.starten(args.host, args.port)
+    print(f"Team-Adventure läuft auf {args.host}:{port} (max. {args.max_sitzungen} Sitzungen)", flush=True)
+    if args.statistik:
+        asyncio.get_running_loop().create_task(_statistik_ausgeben(server, args.statistik))
+    await asyncio.Event().wait()
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Team-Adventure als Text-Server für viele Spieler")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--welt", default=DEFAULT_WELT, help="Weltdatei")
+    parser.add_argument("--max-sitzungen", type=int, default=10_000)
+    parser.add_argument("--schreib-timeout", type=float, default=10.0,
+                        help="Sekunden, die ein Client mit vollem Sendepuffer hängen darf")
+    parser.add_argument("--leerlauf", type=float, default=900.0, help="Sekunden ohne Eingabe bis zur Trennung (0 = nie)")
+    parser.add_argument("--statistik", type=float, default=0.0, help="alle N Sekunden Statistik ausgeben")
+    args = parser.parse_args(argv)
+    try:
+        return asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,46 +1,26 @@
-from person import Person
-from raum import Raum
+from welt import DEFAULT_WELT, Welt
 
 class Setup:
     """
     Verantwortlich für das reine Anlegen von Personen und Räumen.
     Keine Game-Loop- oder IO-Methoden.
+    Die Daten kommen aus einer Weltdatei (Standard: ../data/welt.json).
     """
 
-    def personen_erzeugen(self):
-        holger = Person("Holger", "Teamleiter", "Sehr nett und immer hilfsbereit.", rede_lust=4)
-        flo = Person("Flo", "Stellvertretender Teamleiter", "Gesprächsfreudig – kann nicht aufhören zu reden!", rede_lust=7)
-        kirsten = Person("Kirsten", "Projektmanager", "Nervig und anstrengend.", rede_lust=3)
-        return {
-            "holger": holger,
-            "flo": flo,
-            "kirsten": kirsten
-        }
-
-    def raum_erzeugen(self, personen):
-        flur = Raum("Flur", "Du siehst einen langen Gang mit ganz vielen Räumen.")
-        buero1 = Raum("Büro 1", "Ein schickes Büro mit PC und Kaffee.", personen=[personen["holger"]])
-        grossraumbuero = Raum("Großraumbüro", "Viele Tische und Arbeitsplätze.", personen=[personen["flo"], personen["kirsten"]])
-        post = Raum("Post", "Du siehst einen kleinen Raum mit einem Tisch und einem Stuhl.")
-        technikraum = Raum("Technik", "Du siehst einen Raum voller Computer und Technik.")
-        druckerraum = Raum("Drucker", "Du siehst einen Raum mit einem Drucker.")
+    def __init__(self, pfad: str = DEFAULT_WELT):
+        self.pfad = pfad
+        self._welt = None
 
-        flur.verbindungen = [buero1, grossraumbuero, post, technikraum, druckerraum]
-        buero1.verbindungen = [flur]
-        grossraumbuero.verbindungen = [flur]
-        post.verbindungen = [flur]
-        technikraum.verbindungen = [flur]
-        druckerraum.verbindungen = [flur]
+    def welt_laden(self) -> Welt:
+        """Lädt die Weltdatei einmal; Räume und Personen werden erst bei Zugriff gebaut."""
+        if self._welt is None:
+            self._welt = Welt.laden(self.pfad)
+        return self._welt
 
-        post.aufgaben = []
-        technikraum.aufgaben = []
-        druckerraum.aufgaben = []
+    def personen_erzeugen(self):
+        return dict(self.welt_laden().personen)
 
-        return {
-            "flur": flur,
-            "büro": buero1,
-            "großraumbüro": grossraumbuero,
-            "post": post,
-            "technikraum": technikraum,
-            "druckerraum": druckerraum
-        }
\ No newline at end of file
+    def raum_erzeugen(self, personen=None):
+        # personen wird nicht mehr gebraucht: die Räume verweisen auf dieselben
+        # Person-Objekte wie personen_erzeugen() (gleiche Welt)
+        return dict(self.welt_laden().raeume)
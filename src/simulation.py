@@ -0,0 +1,161 @@
+# simulation.py
+"""
+Headless-Runner: spielt viele Sitzungen ohne Display über die Engine durch.
+
+    python simulation.py --sessions 10000 --steps 40 --workers 4
+    python simulation.py --script mein_ablauf.txt --sessions 1000
+
+Ein Skript enthält eine Aktion pro Zeile:
+    move <raum> | talk <person> | answer <antwort> | execute <id> | travel <aufgaben-id> | wait [minuten]
+Ohne Skript wählt jede Sitzung zufällig aus den gerade möglichen Aktionen;
+ist gerade nichts möglich (Sackgasse ohne Personen und Aufgaben), wartet sie.
+"""
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from engine import ActionResult, Engine
+from welt import DEFAULT_WELT, Welt
+
+Action = Tuple[str, str]
+# Nichts zu tun: eine Minute vergehen lassen (vielleicht kommt jemand vorbei)
+WAIT: Action = ("wait", "")
+
+
+@lru_cache(maxsize=None)
+def welt_daten(pfad: str = DEFAULT_WELT) -> dict:
+    """Weltdatei einmal pro Prozess parsen; Welt() verändert die Rohdaten nicht."""
+    with open(pfad, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_script(text: str) -> List[Action]:
+    actions = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        name, _, arg = line.partition(" ")
+        actions.append((name.lower(), arg.strip()))
+    return actions
+
+
+def apply_action(engine: Engine, action: Action) -> ActionResult:
+    name, arg = action
+    if name == "move":
+        return engine.move(arg)
+    if name == "talk":
+        person = engine.person_by_name(arg)
+        if person is None:
+            return ActionResult(False, [f"{arg} ist nicht hier."])
+        return engine.talk(person)
+    if name == "answer":
+        return engine.answer(arg)
+    if name == "execute":
+        return engine.execute_task(int(arg))
+    if name == "travel":
+        return engine.travel_to_task(int(arg))
+    if name == "wait":
+        return ActionResult(True, engine.bewegungen_hier(engine.zeit_vergeht(int(arg or 1))))
+    raise ValueError(f"Unbekannte Aktion: {name}")
+
+
+def random_action(engine: Engine, rng: random.Random) -> Action:
+    """Zufällige, im aktuellen Zustand sinnvolle Aktion; ("wait", "") wenn gerade nichts möglich ist."""
+    if engine.active_person is not None:
+        choices: List[Action] = [("answer", antwort) for antwort, _ in engine.antworten()]
+    else:
+        raum = engine.aktueller_raum
+        choices = [("move", r.name) for r in raum.verbindungen]
+        choices += [("talk", p.name) for p in raum.personen]
+        choices += [("execute", str(a.id)) for a in engine.aufgaben_hier()]
+    return rng.choice(choices) if choices else WAIT
+
+
+def run_session(seed: int, steps: int, script: Optional[Sequence[Action]] = None,
+                daten: Optional[dict] = None) -> Dict[str, int]:
+    """Eine Sitzung spielen (in der Welt daten, Standard: Weltdatei) und ihre Kennzahlen zurückgeben."""
+    engine = Engine(Welt(daten if daten is not None else welt_daten()))
+    rng = random.Random(seed)
+    failed = 0
+    waits = 0
+    actions = script if script is not None else (random_action(engine, rng) for _ in range(steps))
+    for action in actions:
+        if action[0] == "wait":
+            waits += 1
+        if not apply_action(engine, action):
+            failed += 1
+    return {
+        "moves": engine.moves,
+        "tasks_created": engine.tasks_created,
+        "tasks_done": engine.tasks_done,
+        "failed_actions": failed,
+        "waits": waits,
+        "relationship": sum(p.relationship for p in engine.personen.values()),
+    }
+
+
+def _run_chunk(args) -> Dict[str, int]:
+    first_seed, count, steps, script = args
+    totals: Dict[str, int] = {"sessions": 0}
+    for seed in range(first_seed, first_seed + count):
+        for key, value in run_session(seed, steps, script).items():
+            totals[key] = totals.get(key, 0) + value
+        totals["sessions"] += 1
+    return totals
+
+
+def run_batch(sessions: int, steps: int, workers: int = 0, script: Optional[Sequence[Action]] = None,
+              seed: int = 0, chunk_size: int = 500) -> Dict[str, float]:
+    """
+    Spielt sessions Sitzungen auf einem Prozess-Pool (workers=0 → alle Kerne,
+    workers=1 → im eigenen Prozess) und liefert aggregierte Statistiken.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = [(seed + start, min(chunk_size, sessions - start), steps, script)
+              for start in range(0, sessions, chunk_size)]
+    t0 = time.perf_counter()
+    if workers == 1:
+        results = [_run_chunk(c) for c in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_chunk, chunks))
+    elapsed = time.perf_counter() - t0
+
+    totals: Dict[str, int] = {}
+    for chunk in results:
+        for key, value in chunk.items():
+            totals[key] = totals.get(key, 0) + value
+    n = max(1, totals.get("sessions", 0))
+    stats: Dict[str, float] = {"sessions": totals.get("sessions", 0), "seconds": elapsed,
+                               "sessions_per_second": totals.get("sessions", 0) / elapsed if elapsed else 0.0}
+    for key in ("moves", "tasks_created", "tasks_done", "failed_actions", "waits", "relationship"):
+        stats[f"avg_{key}"] = totals.get(key, 0) / n
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless-Simulation des Team-Adventures")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--steps", type=int, default=40, help="Aktionen pro Zufalls-Sitzung")
+    parser.add_argument("--workers", type=int, default=0, help="Prozesse (0 = alle Kerne)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--script", help="Datei mit einer Aktion pro Zeile")
+    args = parser.parse_args(argv)
+
+    script = None
+    if args.script:
+        with open(args.script, encoding="utf-8") as f:
+            script = parse_script(f.read())
+    stats = run_batch(args.sessions, args.steps, args.workers, script, args.seed)
+    for key, value in stats.items():
+        print(f"{key:>22}: {value:.2f}" if isinstance(value, float) else f"{key:>22}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,72 +1,138 @@
-from raum import Raum
-from aufgabe import Aufgabe
-from person import Person
+from typing import List, Optional, Sequence
+
+from engine import ActionResult, Engine
+
+BEFEHL_PROMPT = "\nWas tust du? (gehe <raum> / rede <person> / aufgabe <id> / ende): "
+ANTWORT_PROMPT = "Deine Antwort (ja/nein/Smalltalk): "
+
+
+def antwort_prompt(labels: Sequence[str]) -> str:
+    """Prompt mit den Antworten, die der Dialog gerade anbietet (Standard: ANTWORT_PROMPT)."""
+    return f"Deine Antwort ({'/'.join(labels)}): " if labels else ANTWORT_PROMPT
+
+
+# Spielzeit je Befehl (Tagesablauf der NPCs, siehe zeitplan.py)
+MINUTEN_JE_BEFEHL = 1
+
+
+class TextSitzung:
+    """
+    Befehle des Terminal-Spiels ohne print() und input(): eine Eingabezeile rein,
+    Textzeilen raus. Wird vom Terminal-Spiel (Spiel) und vom Server (server.py)
+    benutzt; nach "rede <person>" sind die nächsten Eingaben Antworten, bis
+    das Gespräch zu Ende ist.
+    Jeder abgeschlossene Befehl lässt MINUTEN_JE_BEFEHL Spielminuten vergehen.
+    """
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.wartet_auf_antwort = False
+        self.beendet = False
+
+    @property
+    def prompt(self) -> str:
+        if self.wartet_auf_antwort:
+            return antwort_prompt([label for _, label in self.engine.antworten()])
+        return BEFEHL_PROMPT
+
+    def start(self) -> List[str]:
+        return ["\nWillkommen zum Team-Adventure!"] + self.raum()
+
+    def raum(self) -> List[str]:
+        return [""] + self.engine.describe_room()
+
+    def zeit(self) -> List[str]:
+        """Welt eine Runde weiterlaufen lassen; Meldungen, wer kommt und geht."""
+        return self.engine.bewegungen_hier(self.engine.zeit_vergeht(MINUTEN_JE_BEFEHL))
+
+    def eingabe(self, zeile: str) -> List[str]:
+        """Eine Eingabe verarbeiten; danach folgt (außer bei "ende") wieder die Raumbeschreibung."""
+        if self.wartet_auf_antwort:
+            zeilen = self.engine.answer(zeile).messages
+            self.wartet_auf_antwort = self.engine.active_person is not None
+            if self.wartet_auf_antwort:
+                return zeilen
+            return zeilen + self.zeit() + self.raum()
+        zeilen = self.befehl(zeile)
+        if self.beendet or self.wartet_auf_antwort:
+            return zeilen
+        return zeilen + self.zeit() + self.raum()
+
+    def befehl(self, zeile: str) -> List[str]:
+        aktion, _, argument = zeile.strip().partition(" ")
+        aktion = aktion.lower()
+        if aktion == "gehe":
+            return self.engine.move(argument).messages
+        if aktion == "rede":
+            return self.sprechen(argument)
+        if aktion == "aufgabe":
+            if argument.isdigit():
+                return self.engine.execute_task(int(argument)).messages
+            return ["Ungültige Aufgaben-ID."]
+        if aktion == "ende":
+            self.beendet = True
+            return []
+        return ["Unbekannter Befehl."]
+
+    def sprechen(self, name: str) -> List[str]:
+        person = self.engine.person_by_name(name)
+        if person is None:
+            return [f"{name} ist nicht hier."]
+        result = self.engine.talk(person)
+        self.wartet_auf_antwort = self.engine.active_person is not None
+        return [f"\n{person.name} ({person.rolle}): {person.beschreibung}"] + result.messages
+
 
 class Spiel:
-    def __init__(self):
-        self.personen = self.personen_erzeugen()
-        self.raeume = self.raum_erzeugen()
-        self.aktueller_raum = self.raeume["flur"]
-
-    def personen_erzeugen(self):
-        holger = Person("Holger", "Teamleiter", "Sehr nett und immer hilfsbereit.", rede_lust=4)
-        flo = Person("Flo", "Stellvertretender Teamleiter", "Gesprächsfreudig – kann nicht aufhören zu reden!", rede_lust=7)
-        kirsten = Person("Kirsten", "Projektmanager", "Nervig und anstrengend.", rede_lust=3)
-        return {
-            "holger": holger,
-            "flo": flo,
-            "kirsten": kirsten
-        }
-
-    def raum_erzeugen(self):
-        flur = Raum("Flur", "Du siehst einen langen Gang mit ganz vielen Räumen.")
-        buero1 = Raum("Büro 1", "Ein schickes Büro mit PC und Kaffee.", personen=[self.personen["holger"]])
-        grossraumbuero = Raum("Großraumbüro", "Viele Tische und Arbeitsplätze.", personen=[self.personen["flo"], self.personen["kirsten"]])
-        post = Raum("Post", "Du siehst einen kleinen Raum mit einem Tisch und einem Stuhl.")
-        technikraum = Raum("Technik", "Du siehst einen Raum voller Computer und Technik.")
-        druckerraum = Raum("Drucker", "Du siehst einen Raum mit einem Drucker.")
-
-        flur.verbindungen = [buero1, grossraumbuero, post, technikraum, druckerraum]
-        buero1.verbindungen = [flur]
-        grossraumbuero.verbindungen = [flur]
-        post.verbindungen = [flur]
-        technikraum.verbindungen = [flur]
-        druckerraum.verbindungen = [flur]
-
-        post.aufgaben = []
-        technikraum.aufgaben = []
-        druckerraum.aufgaben = []
-
-        return {
-            "flur": flur,
-            "büro": buero1,
-            "großraumbüro": grossraumbuero,
-            "post": post,
-            "technikraum": technikraum,
-            "druckerraum": druckerraum
-        }
+    """Terminal-Frontend: liest Befehle per input() und gibt die Meldungen der Engine aus."""
+    def __init__(self, engine: Optional[Engine] = None):
+        self.engine = engine if engine is not None else Engine()
+        self.sitzung = TextSitzung(self.engine)
+
+    @property
+    def personen(self):
+        return self.engine.personen
+
+    @property
+    def raeume(self):
+        return self.engine.raeume
+
+    @property
+    def aktueller_raum(self):
+        return self.engine.aktueller_raum
+
+    def ausgeben(self, result: ActionResult) -> ActionResult:
+        self.zeilen(result.messages)
+        return result
+
+    def zeilen(self, lines: List[str]):
+        for line in lines:
+            print(line)
 
     def raum_wechseln(self, neuer_raum):
-        for raum in self.aktueller_raum.verbindungen:
-            if raum.name.lower() == neuer_raum:
-                self.aktueller_raum = raum
-                self.raum_betreten()
-                return
-        print("Du kannst nicht dorthin gehen.")
+        return self.ausgeben(self.engine.move(neuer_raum))
 
     def aufgabe_ausfuehren(self, aufgabe_id):
-        for aufgabe in self.aktueller_raum.aufgaben:
-            if aufgabe.id == aufgabe_id:
-                print(f"Aufgabe '{aufgabe.name}' ausgeführt!")
-                self.aktueller_raum.aufgaben.remove(aufgabe)
-                return
-        print("Ungültige Aufgaben-ID.")
+        return self.ausgeben(self.engine.execute_task(aufgabe_id))
 
-    
+    def sprechen(self, name):
+        self.zeilen(self.sitzung.sprechen(name))
+        self.antwort_lesen()
 
+    def antwort_lesen(self):
+        while self.sitzung.wartet_auf_antwort:
+            self.ausgeben(self.engine.answer(input(self.sitzung.prompt)))
+            self.sitzung.wartet_auf_antwort = self.engine.active_person is not None
 
+    def raum_betreten(self):
+        self.zeilen(self.sitzung.raum())
+        self.zeilen(self.sitzung.befehl(input(BEFEHL_PROMPT)))
+        self.antwort_lesen()
+        if self.sitzung.beendet:
+            return False
+        self.zeilen(self.sitzung.zeit())
+        return True
 
     def spiel_starten(self):
         print("\nWillkommen zum Team-Adventure!")
-        while True:
-            self.raum_betreten()
+        while self.raum_betreten():
+            pass
@@ -0,0 +1,303 @@
+# spielstand.py
+"""
+Spielstände: kompletter Snapshot + angehängte Delta-Einträge.
+
+Ein Spielstand ist ein Ordner mit zwei Dateien:
+    snapshot.bin  – der Zustand zum Zeitpunkt der letzten Kompaktierung
+    deltas.bin    – seitdem angefallene Änderungen, nur angehängt
+
+Beide Dateien beginnen mit MAGIC und enthalten längen-präfixte Einträge
+(4 Byte Länge + marshal-Daten). Räume und Personen werden über ihre
+Schlüssel aus der Weltdatei referenziert, Aufgaben über ihre ID.
+
+Jeder angehängte Stapel Deltas beginnt mit (GENERATION, n), n steigt von
+Stapel zu Stapel. Der Snapshot trägt hinter dem Zustand die Generation des
+letzten Stapels, den er enthält; beim Laden werden Stapel bis dahin
+übersprungen. Stirbt das Programm nach dem Ersetzen des Snapshots, aber vor
+dem Leeren der Deltas, wird so nichts doppelt angewendet (z. B. Antworten).
+
+Delta-Einträge (Tupel) – dieselben, die Engine.journal sammelt:
+    ("raum", raum_key)
+    ("beziehung", person_key, wert)
+    ("antwort", person_key, antwort)
+    ("aufgabe+", id, name, beschreibung, raum_key, geber)
+    ("aufgabe-", id)
+    ("kante+", von, nach) / ("kante-", von, nach)
+    ("zaehler", moves, tasks_created, tasks_done)
+    ("zeit", minute)
+    ("npc", person_key, raum_key, station, faellig)
+"""
+import marshal
+import os
+import queue
+import struct
+import threading
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from aufgabe import Aufgabe
+from engine import Engine
+from person import DIALOG_HISTORY_MAX
+from welt import Welt
+
+MAGIC = b"TTXS\x01"
+SNAPSHOT = "snapshot.bin"
+DELTAS = "deltas.bin"
+# Kopf eines Delta-Stapels: (GENERATION, n)
+GENERATION = "generation"
+_LEN = struct.Struct("<I")
+
+
+# ---------------------------------------------------------------------- Zustand
+
+def snapshot_erstellen(engine: Engine) -> dict:
+    """Kompletten Zustand der Engine als einfache Datenstruktur abgreifen."""
+    welt = engine.welt
+    personen = {}
+    for key, person in welt.personen.materialisiert().items():
+        if person.relationship or person.dialog_history:
+            personen[key] = [person.relationship, list(person.dialog_history)]
+    plus, minus = welt.kanten_aenderungen()
+    return {
+        "raum": engine.raum_key,
+        "zaehler": (engine.moves, engine.tasks_created, engine.tasks_done),
+        # person_key -> [beziehung, [antworten]]; nur Personen mit verändertem Zustand
+        "personen": personen,
+        # id -> (name, beschreibung, raum_key, geber)
+        "aufgaben": {a.id: (a.name, a.beschreibung, a.raum, a.geber) for a in welt.aufgaben.offene()},
+        "naechste_id": welt.aufgaben.naechste_id,
+        # Verbindungen, die gegenüber der Weltdatei hinzugekommen bzw. weggefallen sind
+        "kanten_plus": plus,
+        "kanten_minus": minus,
+        # Spielzeit und Tagesablauf der NPCs: person_key -> [raum_key, station, fällig]
+        "zeit": engine.zeit,
+        "npcs": engine.zeitplan.zustand() if engine.zeit else {},
+    }
+
+
+def anwenden(zustand: dict, eintrag: tuple):
+    """Einen Delta-Eintrag in einen (Snapshot-)Zustand einfalten."""
+    art = eintrag[0]
+    if art == "raum":
+        zustand["raum"] = eintrag[1]
+    elif art == "zaehler":
+        zustand["zaehler"] = tuple(eintrag[1:])
+    elif art == "beziehung":
+        zustand["personen"].setdefault(eintrag[1], [0, []])[0] = eintrag[2]
+    elif art == "antwort":
+        history = zustand["personen"].setdefault(eintrag[1], [0, []])[1]
+        history.append(eintrag[2])
+        del history[:-DIALOG_HISTORY_MAX]
+    elif art == "aufgabe+":
+        aufgabe_id = eintrag[1]
+        zustand["aufgaben"][aufgabe_id] = tuple(eintrag[2:])
+        zustand["naechste_id"] = max(zustand["naechste_id"], aufgabe_id + 1)
+    elif art == "aufgabe-":
+        zustand["aufgaben"].pop(eintrag[1], None)
+    elif art == "zeit":
+        zustand["zeit"] = eintrag[1]
+    elif art == "npc":
+        zustand.setdefault("npcs", {})[eintrag[1]] = list(eintrag[2:])
+    elif art in ("kante+", "kante-"):
+        kante = (eintrag[1], eintrag[2])
+        plus, minus = zustand["kanten_plus"], zustand["kanten_minus"]
+        if art == "kante+":
+            plus, minus = minus, plus
+        # Hebt eine frühere Gegenänderung auf oder wird selbst vermerkt
+        if kante in plus:
+            plus.discard(kante)
+        else:
+            minus.add(kante)
+    else:
+        raise ValueError(f"Unbekannter Delta-Eintrag: {art!r}")
+
+
+def zustand_laden(engine: Engine, zustand: dict):
+    """Zustand auf eine frisch erzeugte Engine (gleiche Weltdatei) übertragen."""
+    welt = engine.welt
+    journal, engine.journal = engine.journal, None
+    for von, nach in zustand["kanten_plus"]:
+        welt.verbinden(von, nach)
+    for von, nach in zustand["kanten_minus"]:
+        welt.trennen(von, nach)
+    welt.aufgaben.leeren(zustand["naechste_id"])
+    for aufgabe_id, (name, beschreibung, raum, geber) in zustand["aufgaben"].items():
+        welt.aufgaben.eintragen(Aufgabe(aufgabe_id, name, beschreibung, raum=raum, geber=geber))
+    for key, (beziehung, antworten) in zustand["personen"].items():
+        person = welt.personen[key]
+        person.relationship = beziehung
+        for antwort in antworten:
+            person.merke_antwort(antwort)
+    engine.raum_key = zustand["raum"]
+    engine.aktueller_raum = engine.raeume[engine.raum_key]
+    engine.moves, engine.tasks_created, engine.tasks_done = zustand["zaehler"]
+    # Ältere Spielstände kennen noch keine Spielzeit
+    if zustand.get("zeit"):
+        engine.zeitplan.laden(zustand["zeit"], zustand.get("npcs", {}))
+    engine.journal = journal
+
+
+# ---------------------------------------------------------------------- Dateien
+
+def _kodieren(zustand: dict) -> dict:
+    # Sets als sortierte Listen ablegen, damit gleiche Zustände gleiche Dateien ergeben
+    return dict(zustand, kanten_plus=sorted(zustand["kanten_plus"]), kanten_minus=sorted(zustand["kanten_minus"]))
+
+
+def _dekodieren(daten: dict) -> dict:
+    return dict(daten, kanten_plus=set(map(tuple, daten["kanten_plus"])),
+                kanten_minus=set(map(tuple, daten["kanten_minus"])))
+
+
+def _eintrag_schreiben(f: BinaryIO, obj):
+    data = marshal.dumps(obj, 4)
+    f.write(_LEN.pack(len(data)))
+    f.write(data)
+
+
+def _eintraege_lesen(pfad: str) -> Iterator:
+    if not os.path.exists(pfad):
+        return
+    with open(pfad, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{pfad} ist kein Spielstand.")
+        while True:
+            kopf = f.read(_LEN.size)
+            if len(kopf) < _LEN.size:
+                return
+            (laenge,) = _LEN.unpack(kopf)
+            data = f.read(laenge)
+            if len(data) < laenge:
+                # Abgebrochener letzter Eintrag (z. B. Absturz beim Schreiben) → ignorieren
+                return
+            yield marshal.loads(data)
+
+
+def snapshot_schreiben(ordner: str, zustand: dict, generation: int = 0):
+    """Snapshot (enthält alle Delta-Stapel bis generation) atomar ersetzen und die Deltas leeren."""
+    os.makedirs(ordner, exist_ok=True)
+    tmp = os.path.join(ordner, SNAPSHOT + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        _eintrag_schreiben(f, _kodieren(zustand))
+        _eintrag_schreiben(f, generation)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, os.path.join(ordner, SNAPSHOT))
+    _deltas_leeren(ordner)
+
+
+def _deltas_leeren(ordner: str):
+    with open(os.path.join(ordner, DELTAS), "wb") as f:
+        f.write(MAGIC)
+
+
+def deltas_anhaengen(ordner: str, eintraege: List[tuple], generation: int):
+    """Einträge als einen Stapel mit der Generation generation anhängen."""
+    pfad = os.path.join(ordner, DELTAS)
+    neu = not os.path.exists(pfad)
+    with open(pfad, "ab") as f:
+        if neu:
+            f.write(MAGIC)
+        _eintrag_schreiben(f, (GENERATION, generation))
+        for eintrag in eintraege:
+            _eintrag_schreiben(f, eintrag)
+
+
+def _lesen(ordner: str) -> Tuple[dict, int]:
+    """Zustand aus Snapshot und neueren Delta-Stapeln sowie die höchste vorkommende Generation."""
+    snap = list(_eintraege_lesen(os.path.join(ordner, SNAPSHOT)))
+    if not snap:
+        raise FileNotFoundError(f"Kein Spielstand in {ordner}.")
+    zustand = _dekodieren(snap[0])
+    # Ältere Spielstände haben weder Generationen noch Stapel-Köpfe: dann gilt jeder Eintrag
+    snap_generation = snap[1] if len(snap) > 1 else 0
+    generation, stapel = snap_generation, None
+    for eintrag in _eintraege_lesen(os.path.join(ordner, DELTAS)):
+        if eintrag[0] == GENERATION:
+            stapel = eintrag[1]
+            generation = max(generation, stapel)
+        elif stapel is None or stapel > snap_generation:
+            anwenden(zustand, eintrag)
+    return zustand, generation
+
+
+def zustand_lesen(ordner: str) -> dict:
+    """Snapshot lesen und alle Deltas einfalten, die er noch nicht enthält."""
+    return _lesen(ordner)[0]
+
+
+def kompaktieren(ordner: str):
+    """Deltas in einen neuen Snapshot falten (arbeitet nur auf den Dateien)."""
+    snapshot_schreiben(ordner, *_lesen(ordner))
+
+
+def existiert(ordner: str) -> bool:
+    return os.path.exists(os.path.join(ordner, SNAPSHOT))
+
+
+def laden(ordner: str, welt: Optional[Welt] = None) -> Engine:
+    """Neue Engine mit dem gespeicherten Zustand."""
+    engine = Engine(welt)
+    zustand_laden(engine, zustand_lesen(ordner))
+    return engine
+
+
+# ---------------------------------------------------------------------- Autosave
+
+class Autosaver:
+    """
+    Speichert Änderungen der Engine im Hintergrund.
+    tick() läuft im Haupt-Thread und tauscht nur das Journal gegen eine leere
+    Liste aus; Schreiben und Kompaktieren erledigt ein Worker-Thread.
+    ersetzen=True: ein vorhandener Spielstand in ordner gehört zu einer anderen
+    Engine und wird durch deren aktuellen Zustand ersetzt.
+    """
+    def __init__(self, engine: Engine, ordner: str, kompaktieren_ab: int = 5000, ersetzen: bool = False):
+        self.engine = engine
+        self.ordner = ordner
+        self.kompaktieren_ab = kompaktieren_ab
+        self._queue: "queue.Queue[Optional[List[tuple]]]" = queue.Queue()
+        self._deltas = 0
+        self.geschrieben = 0
+        self.kompaktierungen = 0
+
+        if existiert(ordner):
+            # Neue Stapel müssen über allem liegen, was schon in den Dateien steht
+            self._generation = _lesen(ordner)[1]
+        else:
+            self._generation = 0
+        if ersetzen or not existiert(ordner):
+            # Erster Start (oder neue Engine): einmal den vollen Zustand sichern, Deltas leeren
+            snapshot_schreiben(ordner, snapshot_erstellen(engine), self._generation)
+        engine.journal = []
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def tick(self):
+        """Pro Frame aufrufen: übergibt angefallene Änderungen an den Worker (O(1))."""
+        journal = self.engine.journal
+        if journal:
+            self.engine.journal = []
+            self._queue.put(journal)
+
+    def close(self):
+        """Restliche Änderungen schreiben, kompaktieren und den Worker beenden."""
+        self.tick()
+        self._queue.put(None)
+        self._thread.join()
+        kompaktieren(self.ordner)
+        self.engine.journal = None
+
+    def _run(self):
+        while True:
+            eintraege = self._queue.get()
+            if eintraege is None:
+                return
+            self._generation += 1
+            deltas_anhaengen(self.ordner, eintraege, self._generation)
+            self.geschrieben += len(eintraege)
+            self._deltas += len(eintraege)
+            if self._deltas >= self.kompaktieren_ab:
+                kompaktieren(self.ordner)
+                self._deltas = 0
+                self.kompaktierungen += 1
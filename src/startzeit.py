@@ -0,0 +1,27 @@
+# startzeit.py
+import time
+from typing import List, Tuple
+
+
+class Startzeit:
+    """
+    Einfache Aufschlüsselung der Startzeit in Abschnitte.
+    abschnitt(name) schließt den laufenden Abschnitt ab und startet den nächsten.
+    """
+    def __init__(self):
+        self.beginn = time.perf_counter()
+        self._letzte = self.beginn
+        self.abschnitte: List[Tuple[str, float]] = []
+
+    def abschnitt(self, name: str):
+        jetzt = time.perf_counter()
+        self.abschnitte.append((name, jetzt - self._letzte))
+        self._letzte = jetzt
+
+    def gesamt(self) -> float:
+        return self._letzte - self.beginn
+
+    def bericht(self) -> List[str]:
+        zeilen = [f"{name:<14} {dauer * 1000:8.1f} ms" for name, dauer in self.abschnitte]
+        zeilen.append(f"{'gesamt':<14} {self.gesamt() * 1000:8.1f} ms")
+        return zeilen
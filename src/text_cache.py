@@ -0,0 +1,66 @@
+# text_cache.py
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import pygame
+
+# Schlüssel: (Font, Text, Farbe, Antialiasing)
+TextKey = Tuple[pygame.font.Font, str, Tuple[int, ...], bool]
+
+
+class TextCache:
+    """
+    LRU-Cache für gerenderte Text-Surfaces.
+    Buttons, Panels und der Log rendern jeden Frame denselben Text – statt
+    jedes Mal font.render() aufzurufen, holen sie die fertige Surface hier ab.
+    """
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[TextKey, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._entries[key] = surf
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+# Gemeinsamer Cache für alle Widgets
+TEXT_CACHE = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+    """Wie font.render(text, antialias, color), aber über den gemeinsamen TEXT_CACHE."""
+    return TEXT_CACHE.render(font, text, color, antialias)
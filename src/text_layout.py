@@ -0,0 +1,108 @@
+# text_layout.py
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Tuple
+
+import pygame
+
+# Pro Font: Zeichen -> Vorschub in Pixeln
+_ADVANCES: Dict[pygame.font.Font, Dict[str, int]] = {}
+
+
+def glyph_advances(font: pygame.font.Font, text: str) -> List[int]:
+    """Vorschub je Zeichen; jedes Zeichen wird pro Font nur einmal vermessen."""
+    table = _ADVANCES.setdefault(font, {})
+    missing = [ch for ch in set(text) if ch not in table]
+    if missing:
+        for ch, metric in zip(missing, font.metrics("".join(missing))):
+            # metrics() liefert None für Zeichen, die der Font nicht kennt
+            table[ch] = metric[4] if metric else font.size(ch)[0]
+    return [table[ch] for ch in text]
+
+
+def _next_line(text: str, prefix: List[int], start: int, budget: int, hyphen_width: int) -> Tuple[str, int]:
+    """Eine Zeile ab start bestimmen; gibt (Zeile, Start der nächsten Zeile) zurück."""
+    n = len(text)
+    limit = prefix[start] + budget
+    # Größtes end mit Breite(text[start:end]) <= budget
+    end = bisect_right(prefix, limit, start) - 1
+    if end >= n:
+        return text[start:].rstrip(), n
+    # Am letzten Leerzeichen umbrechen, das noch in die Zeile passt
+    cut = end if text[end] == " " else text.rfind(" ", start, end)
+    if cut > start:
+        return text[start:cut].rstrip(), cut + 1
+    # Wort ist länger als die Zeile → hart trennen, wenn möglich mit Bindestrich
+    hyph_end = bisect_right(prefix, limit - hyphen_width, start) - 1
+    if hyph_end - start >= 2:
+        return text[start:hyph_end] + "-", hyph_end
+    end = max(end, start + 1)
+    return text[start:end], end
+
+
+def _wrap_paragraph(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+    # prefix[i] = Breite von text[:i]; Breite von text[a:b] = prefix[b] - prefix[a]
+    prefix = [0]
+    prefix.extend(accumulate(glyph_advances(font, text)))
+    hyphen_width = glyph_advances(font, "-")[0]
+    n = len(text)
+    lines = []
+    start = 0
+    while start < n:
+        # Leerzeichen am Zeilenanfang überspringen
+        while start < n and text[start] == " ":
+            start += 1
+        if start >= n:
+            break
+        # Die Glyph-Breiten sind gerundet (und ohne Kerning) → jede Zeile einmal
+        # mit font.size() nachmessen und bei Überlauf das Budget verkleinern
+        budget = max_width
+        while True:
+            line, next_start = _next_line(text, prefix, start, budget, hyphen_width)
+            overflow = font.size(line)[0] - max_width
+            if overflow <= 0 or len(line) <= 1:
+                break
+            budget -= overflow
+        lines.append(line)
+        start = next_start
+    return lines
+
+
+@lru_cache(maxsize=4096)
+def _wrap_cached(font: pygame.font.Font, text: str, max_width: int) -> Tuple[str, ...]:
+    lines: List[str] = []
+    for paragraph in text.split("\n"):
+        lines.extend(_wrap_paragraph(paragraph, font, max_width))
+    return tuple(lines)
+
+
+def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+    """
+    Bricht text so um, dass jede Zeile höchstens max_width Pixel breit ist.
+    Umbruch an Leerzeichen, "\\n" erzwingt eine neue Zeile; zu lange Wörter
+    werden mit Bindestrich getrennt. Ergebnisse werden pro (Font, Text, Breite) gemerkt.
+    """
+    return list(_wrap_cached(font, text, max_width))
+
+
+@lru_cache(maxsize=4096)
+def ellipsize(text: str, font: pygame.font.Font, max_width: int) -> str:
+    """Kürzt text auf eine Zeile von höchstens max_width Pixeln, abgeschnitten mit "…"."""
+    if font.size(text)[0] <= max_width:
+        return text
+    prefix = [0]
+    prefix.extend(accumulate(glyph_advances(font, text)))
+    budget = max_width - glyph_advances(font, "…")[0]
+    end = max(0, bisect_right(prefix, budget) - 1)
+    # Gerundete Glyph-Breiten → wie beim Umbruch nachmessen
+    while end > 0 and font.size(text[:end].rstrip() + "…")[0] > max_width:
+        end -= 1
+    return text[:end].rstrip() + "…"
+
+
+def clear_layout_cache():
+    """Gemerkte Umbrüche und Glyph-Breiten verwerfen (z. B. nach Font-Wechsel)."""
+    _wrap_cached.cache_clear()
+    ellipsize.cache_clear()
+    _ADVANCES.clear()
@@ -0,0 +1,309 @@
+# welt.py
+"""
+Datengetriebene Spielwelt.
+
+Eine Weltdatei (JSON) beschreibt Personen, Räume, Verbindungen und Aufgaben:
+
+    {
+      "start": "flur",
+      "personen": {
+        "holger": {"name": "Holger", "rolle": "...", "beschreibung": "...", "rede_lust": 4,
+                   "aufgabe": {"name": "...", "beschreibung": "...", "raum": "post"},
+                   "plan": [{"raum": "büro", "dauer": 45}, {"raum": "post", "dauer": 10}]}
+      },
+      "raeume": {
+        "flur": {"name": "Flur", "beschreibung": "...", "personen": [],
+                 "aufgaben": [{"id": 1, "name": "...", "beschreibung": "..."}],
+                 "verbindungen": ["büro", "post"]}
+      }
+    }
+
+"plan" ist optional: Stationen, die die Person reihum ansteuert, jeweils mit
+Aufenthaltsdauer in Spielminuten (siehe zeitplan.py). "dialog" ist ebenfalls
+optional: Name der Dialogdatei im Ordner dialoge/ (Standard: der
+Personen-Schlüssel, siehe dialog.py).
+
+Beim Laden werden nur der Namensindex, die Nachbarschafts-Sets, die
+Belegung (wer ist wo) und das Aufgaben-Register aufgebaut. Raum- und Person-Objekte entstehen erst beim
+ersten Zugriff.
+"""
+import json
+import os
+from collections.abc import Mapping, MutableSequence
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from aufgabe import Aufgabe
+from aufgaben_register import AufgabenRegister
+from belegung import Belegung
+from dialog import DEFAULT_DIALOGE, DialogBibliothek
+from person import Person
+from raum import Raum
+
+DEFAULT_WELT = os.path.join(os.path.dirname(__file__), "../data/welt.json")
+
+
+def normalize(name: str) -> str:
+    """Schreibweise für Namensvergleiche (Groß-/Kleinschreibung und Ränder egal)."""
+    return name.strip().lower()
+
+
+class LazyMapping(Mapping):
+    """Dict-artige Sicht, die ihre Werte erst beim ersten Zugriff per factory(key) baut."""
+    def __init__(self, keys: Iterable[str], factory: Callable[[str], object]):
+        self._keys = list(keys)
+        self._known = set(self._keys)
+        self._factory = factory
+        self._built: Dict[str, object] = {}
+
+    def __getitem__(self, key):
+        obj = self._built.get(key)
+        if obj is None:
+            if key not in self._known:
+                raise KeyError(key)
+            obj = self._built[key] = self._factory(key)
+        return obj
+
+    def __contains__(self, key):
+        return key in self._known
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def ableiten(self, factory: Callable[[str], object]) -> "LazyMapping":
+        """Neue Sicht auf dieselben Schlüssel (geteilt, nicht kopiert) mit eigener factory."""
+        neu = LazyMapping.__new__(LazyMapping)
+        neu._keys, neu._known, neu._factory, neu._built = self._keys, self._known, factory, {}
+        return neu
+
+    def ist_gebaut(self, key) -> bool:
+        return key in self._built
+
+    def materialisiert(self) -> Dict[str, object]:
+        """Nur die bereits gebauten Objekte."""
+        return dict(self._built)
+
+
+class LazyRaumListe(MutableSequence):
+    """
+    Verbindungsliste eines Raums, die erst beim ersten Zugriff die Nachbar-Räume
+    aus der Welt holt. So zieht das Bauen eines Raums nicht die ganze Karte nach.
+    """
+    def __init__(self, keys: Iterable[str], resolve: Callable[[str], Raum]):
+        self._keys: Optional[List[str]] = list(keys)
+        self._resolve = resolve
+        self._items: List[Raum] = []
+
+    def _list(self) -> List[Raum]:
+        if self._keys is not None:
+            self._items = [self._resolve(k) for k in self._keys]
+            self._keys = None
+        return self._items
+
+    def __getitem__(self, i):
+        return self._list()[i]
+
+    def __setitem__(self, i, value):
+        self._list()[i] = value
+
+    def __delitem__(self, i):
+        del self._list()[i]
+
+    def __len__(self):
+        return len(self._keys) if self._keys is not None else len(self._items)
+
+    def __iter__(self):
+        return iter(self._list())
+
+    def __contains__(self, value):
+        return value in self._list()
+
+    def insert(self, i, value):
+        self._list().insert(i, value)
+
+    def __repr__(self):
+        return f"LazyRaumListe({self._keys if self._keys is not None else self._items!r})"
+
+
+class Welt:
+    """Spielwelt aus einer Weltdatei: Namensindex, Nachbarschaft, träge gebaute Räume/Personen."""
+    def __init__(self, daten: dict, dialog_ordner: str = DEFAULT_DIALOGE):
+        self._raum_daten: Dict[str, dict] = daten["raeume"]
+        self._person_daten: Dict[str, dict] = daten.get("personen", {})
+        self.start: str = daten.get("start") or next(iter(self._raum_daten))
+
+        self.raeume = LazyMapping(self._raum_daten, self._raum_bauen)
+        self.personen = LazyMapping(self._person_daten, self._person_bauen)
+
+        # Alle offenen Aufgaben der Sitzung (Raum.aufgaben ist eine Sicht darauf)
+        self.aufgaben = AufgabenRegister()
+        # Aufenthaltsorte aller Personen (Raum.personen ist eine Sicht darauf)
+        self.belegung = Belegung()
+
+        # Normalisierter Name bzw. Schlüssel -> Raum-Schlüssel
+        self._index: Dict[str, str] = {}
+        for key, d in self._raum_daten.items():
+            self._index[normalize(key)] = key
+            self._index.setdefault(normalize(d.get("name", key)), key)
+            for a in d.get("aufgaben", ()):
+                self.aufgaben.eintragen(Aufgabe(a["id"], a["name"], a.get("beschreibung", ""), raum=key))
+            for p in d.get("personen", ()):
+                self.belegung.setzen(p, key)
+        # Raum-Schlüssel -> Schlüssel der direkt erreichbaren Räume. Dicts statt Sets: „in“ bleibt O(1),
+        # die Reihenfolge ist die der Weltdatei (neue Verbindungen hinten) – Wege hängen nicht vom Hash-Seed ab
+        self.adjazenz: Dict[str, Dict[str, None]] = {
+            key: dict.fromkeys(d.get("verbindungen", ())) for key, d in self._raum_daten.items()
+        }
+        # True, solange adjazenz mit einer anderen Sitzung geteilt wird (siehe sitzung())
+        self._adjazenz_geteilt = False
+        # Zählt Verbindungsänderungen mit (Cache-Schlüssel für die Navigationsliste)
+        self.kanten_version = 0
+        # Personenname -> Aufgabe, die diese Person vergibt
+        self.aufgaben_vorlagen: Dict[str, dict] = {
+            d.get("name", key): d["aufgabe"] for key, d in self._person_daten.items() if "aufgabe" in d
+        }
+        # Person-Schlüssel -> Tagesablauf ((Raum-Schlüssel, Dauer in Minuten), ...)
+        self.plaene: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+        for key, d in self._person_daten.items():
+            if d.get("plan"):
+                self.plaene[key] = tuple((s["raum"], max(1, int(s.get("dauer", 1)))) for s in d["plan"])
+                # Ohne Startraum beginnt die Person an ihrer ersten Station
+                if self.belegung.ort(key) is None:
+                    self.belegung.setzen(key, self.plaene[key][0][0])
+        # Dialoggraphen, erst beim ersten Gespräch geladen
+        self.dialoge = DialogBibliothek(dialog_ordner, raeume=self._raum_daten)
+        # Raum-/Person-Objekt -> Schlüssel (für bereits gebaute Objekte)
+        self._keys_by_id: Dict[int, str] = {}
+        self._person_keys_by_id: Dict[int, str] = {}
+        # Callbacks (von, nach, hinzugefuegt) bei Verbindungsänderungen, z. B. für die Navigation
+        self._beobachter: List[Callable[[str, str, bool], None]] = []
+
+    @classmethod
+    def laden(cls, pfad: str = DEFAULT_WELT) -> "Welt":
+        with open(pfad, encoding="utf-8") as f:
+            return cls(json.load(f), os.path.join(os.path.dirname(pfad), "dialoge"))
+
+    def sitzung(self) -> "Welt":
+        """
+        Weitere Welt auf denselben Daten, z. B. je Verbindung im Server.
+        Rohdaten, Namensindex und Aufgaben-Vorlagen werden geteilt, die
+        Nachbarschaft bis zur ersten Verbindungsänderung, die offenen
+        Aufgaben und die Belegung bis zur ersten Änderung (Copy-on-Write), die
+        Dialoggraphen ganz (sie sind unveränderlich). Räume und Personen
+        (und damit Beziehungswerte) baut jede Sitzung erst, wenn sie sie braucht.
+        """
+        neu = Welt.__new__(Welt)
+        neu._raum_daten = self._raum_daten
+        neu._person_daten = self._person_daten
+        neu.start = self.start
+        neu.raeume = self.raeume.ableiten(neu._raum_bauen)
+        neu.personen = self.personen.ableiten(neu._person_bauen)
+        neu.aufgaben = self.aufgaben.kopie()
+        neu.belegung = self.belegung.kopie()
+        neu.plaene = self.plaene
+        neu._index = self._index
+        neu.adjazenz = self.adjazenz
+        neu._adjazenz_geteilt = self._adjazenz_geteilt = True
+        neu.kanten_version = self.kanten_version
+        neu.aufgaben_vorlagen = self.aufgaben_vorlagen
+        neu.dialoge = self.dialoge
+        neu._keys_by_id = {}
+        neu._person_keys_by_id = {}
+        neu._beobachter = []
+        return neu
+
+    # ------------------------------------------------------------------ Lookup
+
+    def raum_key(self, name: str) -> Optional[str]:
+        """Schlüssel zu einem Raumnamen oder -schlüssel in O(1), sonst None."""
+        return self._index.get(normalize(name))
+
+    def key_von(self, raum: Raum) -> Optional[str]:
+        return self._keys_by_id.get(id(raum))
+
+    def person_key(self, person: Person) -> Optional[str]:
+        return self._person_keys_by_id.get(id(person))
+
+    def dialog_datei(self, key: str) -> str:
+        """Name der Dialogdatei (ohne .json) für die Person key."""
+        return self._person_daten[key].get("dialog", key)
+
+    def ist_verbunden(self, von: str, nach: str) -> bool:
+        return nach in self.adjazenz.get(von, ())
+
+    # ------------------------------------------------------------------ Änderungen
+
+    def kanten_aenderungen(self):
+        """(hinzugekommene, weggefallene) Verbindungen gegenüber der Weltdatei als Sets von (von, nach)."""
+        plus, minus = set(), set()
+        for key, d in self._raum_daten.items():
+            original = set(d.get("verbindungen", ()))
+            aktuell = set(self.adjazenz[key])
+            if aktuell != original:
+                plus.update((key, n) for n in aktuell - original)
+                minus.update((key, n) for n in original - aktuell)
+        return plus, minus
+
+    def bei_aenderung(self, callback: Callable[[str, str, bool], None]):
+        """callback(von, nach, hinzugefuegt) wird nach jeder Verbindungsänderung aufgerufen."""
+        self._beobachter.append(callback)
+
+    def verbinden(self, von: str, nach: str):
+        """Einseitige Verbindung von → nach anlegen (Index und gebaute Räume bleiben synchron)."""
+        if nach in self.adjazenz[von]:
+            return
+        self._eigene_adjazenz()
+        self.kanten_version += 1
+        self.adjazenz[von][nach] = None
+        if self.raeume.ist_gebaut(von):
+            self.raeume[von].verbindungen.append(self.raeume[nach])
+        for callback in self._beobachter:
+            callback(von, nach, True)
+
+    def trennen(self, von: str, nach: str):
+        """Einseitige Verbindung von → nach entfernen."""
+        if nach not in self.adjazenz[von]:
+            return
+        self._eigene_adjazenz()
+        self.kanten_version += 1
+        del self.adjazenz[von][nach]
+        if self.raeume.ist_gebaut(von):
+            ziel = self.raeume[nach]
+            verbindungen = self.raeume[von].verbindungen
+            for i, raum in enumerate(verbindungen):
+                if raum is ziel:
+                    del verbindungen[i]
+                    break
+        for callback in self._beobachter:
+            callback(von, nach, False)
+
+    def _eigene_adjazenz(self):
+        if self._adjazenz_geteilt:
+            self.adjazenz = {key: dict(nachbarn) for key, nachbarn in self.adjazenz.items()}
+            self._adjazenz_geteilt = False
+
+    # ------------------------------------------------------------------ Bauen
+
+    def _raum_bauen(self, key: str) -> Raum:
+        d = self._raum_daten[key]
+        raum = Raum(
+            d.get("name", key),
+            d.get("beschreibung", ""),
+            aufgaben=self.aufgaben.ansicht(key),
+            personen=self.belegung.ansicht(key, self.personen, self.person_key),
+            gegenstaende=list(d.get("gegenstaende", ())) or None,
+        )
+        # Aus der aktuellen Nachbarschaft, nicht aus der Datei: Änderungen vor dem ersten Bau zählen mit
+        if self.adjazenz[key]:
+            raum.verbindungen = LazyRaumListe(self.adjazenz[key], self.raeume.__getitem__)
+        self._keys_by_id[id(raum)] = key
+        return raum
+
+    def _person_bauen(self, key: str) -> Person:
+        d = self._person_daten[key]
+        person = Person(d.get("name", key), d.get("rolle", ""), d.get("beschreibung", ""),
+                        rede_lust=d.get("rede_lust", 5))
+        self._person_keys_by_id[id(person)] = key
+        return person
@@ -0,0 +1,164 @@
+# zeitplan.py
+"""
+Tagesablauf der NPCs: Personen mit "plan" in der Weltdatei laufen ihre
+Stationen reihum ab, Raum für Raum entlang der Verbindungen (ein Raum je
+SCHRITT Minuten), und bleiben an jeder Station "dauer" Minuten.
+
+Jede Person hat genau einen Termin im Zeitrad (nächster Schritt bzw. Ende
+des Aufenthalts). Ein Tick fasst nur die Personen an, deren Termin fällig
+ist – egal, wie viele insgesamt unterwegs sind. Wer wo ist, steht in der
+Belegung der Welt (Raum.personen ist eine Sicht darauf).
+"""
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from navigation import Navigator
+from welt import Welt
+from zeitrad import Zeitrad
+
+# Minuten je Raumwechsel unterwegs
+SCHRITT = 1
+
+
+class Bewegung(NamedTuple):
+    person: str
+    von: str
+    nach: str
+
+
+class Npc:
+    """Laufzeit-Zustand einer Person mit Plan."""
+    __slots__ = ("key", "plan", "stop", "weg", "schritt", "faellig")
+
+    def __init__(self, key: str, plan: Tuple[Tuple[str, int], ...]):
+        self.key = key
+        self.plan = plan
+        # Index der Station, die gerade angesteuert bzw. besucht wird
+        self.stop = 0
+        # Weg zur Station (ohne Startraum, geteilt über den Wege-Cache) und Index des nächsten Raums
+        self.weg: Tuple[str, ...] = ()
+        self.schritt = 0
+        self.faellig = 0
+
+    @property
+    def unterwegs(self) -> bool:
+        return self.schritt < len(self.weg)
+
+
+class Zeitplan:
+    """
+    Welt-Uhr in Spielminuten. vorruecken(bis) lässt die Zeit bis zur Minute
+    bis laufen und gibt alle Raumwechsel zurück. halten = Schlüssel einer
+    Person, die gerade nicht weggehen darf (z. B. mitten im Gespräch).
+    """
+    def __init__(self, welt: Welt, navigation: Optional[Navigator] = None, max_wege: int = 65536):
+        self.welt = welt
+        self.navigation = navigation if navigation is not None else Navigator(welt)
+        self.max_wege = max_wege
+        # (von, nach) -> Weg ohne Startraum; viele Personen gehen dieselben Strecken
+        self._wege: "OrderedDict[Tuple[str, str], Tuple[str, ...]]" = OrderedDict()
+        welt.bei_aenderung(lambda von, nach, hinzugefuegt: self._wege.clear())
+        self.rad: Zeitrad[Npc] = Zeitrad()
+        self.npcs: Dict[str, Npc] = {}
+        # Statistik: bisher bearbeitete Termine
+        self.ereignisse = 0
+        for key, plan in welt.plaene.items():
+            self._starten(Npc(key, plan))
+
+    @property
+    def zeit(self) -> int:
+        return self.rad.jetzt
+
+    def _starten(self, npc: Npc):
+        """Steht die Person an einer ihrer Stationen, bleibt sie dort; sonst geht sie zur ersten."""
+        self.npcs[npc.key] = npc
+        ort = self.welt.belegung.ort(npc.key)
+        for i, (raum, dauer) in enumerate(npc.plan):
+            if raum == ort:
+                npc.stop = i
+                npc.faellig = self.zeit + dauer
+                break
+        else:
+            npc.stop = 0
+            self._losgehen(npc, ort)
+            npc.faellig = self.zeit + SCHRITT
+        self.rad.planen(npc.faellig, npc)
+
+    def vorruecken(self, bis: int, halten: Optional[str] = None) -> List[Bewegung]:
+        bewegungen: List[Bewegung] = []
+        rad = self.rad
+        while rad.jetzt < bis:
+            for npc in rad.tick():
+                self._ereignis(npc, halten, bewegungen)
+        return bewegungen
+
+    def tick(self, halten: Optional[str] = None) -> List[Bewegung]:
+        return self.vorruecken(self.zeit + 1, halten)
+
+    def _ereignis(self, npc: Npc, halten: Optional[str], bewegungen: List[Bewegung]):
+        self.termin_bearbeiten(npc, self.rad.jetzt, halten, bewegungen)
+        self.rad.planen(npc.faellig, npc)
+
+    def termin_bearbeiten(self, npc: Npc, jetzt: int, halten: Optional[str], bewegungen: List[Bewegung]):
+        """Fälligen Termin von npc bearbeiten und npc.faellig neu setzen (ohne ihn einzuplanen)."""
+        self.ereignisse += 1
+        if npc.key == halten:
+            npc.faellig = jetzt + SCHRITT
+            return
+        belegung = self.welt.belegung
+        von = belegung.ort(npc.key)
+        if npc.schritt >= len(npc.weg):
+            # Angekommen und Aufenthalt vorbei: nächste Station
+            npc.stop = (npc.stop + 1) % len(npc.plan)
+            self._losgehen(npc, von)
+        elif npc.weg[npc.schritt] not in self.welt.adjazenz.get(von, ()):
+            # Verbindung inzwischen getrennt: neuen Weg suchen
+            self._losgehen(npc, von)
+        weg, i = npc.weg, npc.schritt
+        if i < len(weg):
+            nach = weg[i]
+            npc.schritt = i = i + 1
+            belegung.setzen(npc.key, nach)
+            bewegungen.append(Bewegung(npc.key, von, nach))
+        # Unterwegs: nächster Schritt; angekommen (oder Ziel unerreichbar): Aufenthalt
+        npc.faellig = jetzt + (SCHRITT if i < len(weg) else npc.plan[npc.stop][1])
+
+    def _losgehen(self, npc: Npc, von: Optional[str]):
+        npc.weg = self._weg(von, npc.plan[npc.stop][0])
+        npc.schritt = 0
+
+    def _weg(self, von: Optional[str], nach: str) -> Tuple[str, ...]:
+        if von is None or von == nach:
+            return ()
+        weg = self._wege.get((von, nach))
+        if weg is not None:
+            self._wege.move_to_end((von, nach))
+            return weg
+        if nach in self.welt.adjazenz.get(von, ()):
+            weg = (nach,)
+        else:
+            navigation = self.navigation
+            # Kleine Karten: vorberechnete Bäume; große: Suche bis zum Ziel statt ganzem Baum
+            route = navigation.route(von, nach) if navigation.all_pairs else navigation.route_suchen(von, nach)
+            weg = tuple(route[1:]) if route else ()
+        self._wege[(von, nach)] = weg
+        if len(self._wege) > self.max_wege:
+            self._wege.popitem(last=False)
+        return weg
+
+    # ------------------------------------------------------------------ Spielstand
+
+    def zustand(self) -> Dict[str, list]:
+        """Person-Schlüssel -> [Raum, Station, fällig] (für spielstand.py)."""
+        ort = self.welt.belegung.ort
+        return {key: [ort(key), npc.stop, npc.faellig] for key, npc in self.npcs.items()}
+
+    def laden(self, zeit: int, npcs: Dict[str, list]):
+        """Gespeicherten Stand übernehmen; Wege werden neu berechnet, Termine neu eingeplant."""
+        self.rad = Zeitrad(zeit)
+        for key, npc in self.npcs.items():
+            if key in npcs:
+                raum, npc.stop, npc.faellig = npcs[key]
+                self.welt.belegung.setzen(key, raum)
+                self._losgehen(npc, raum)
+            self.rad.planen(npc.faellig, npc)
@@ -0,0 +1,140 @@
+# zeitrad.py
+"""
+Hierarchisches Zeitrad (timer wheel) für die Welt-Simulation.
+
+Ebene 0 hat 256 Fächer zu je einer Minute, jede weitere Ebene 64 Fächer, die
+jeweils ein ganzes Rad der Ebene darunter abdecken (256 min, 16384 min, ...).
+Ein Termin landet in der niedrigsten Ebene, deren Spanne reicht. Läuft die
+Ebene darunter einmal herum, wird das nächste Fach der höheren Ebene nach
+unten verteilt („Kaskade“). Einplanen und Fälligwerden kosten O(1); ein Tick
+fasst nur die Einträge an, die genau jetzt fällig sind.
+
+Die Kaskade läuft ein Fenster (256 min) voraus: an jeder Fenstergrenze wird
+das Fach für das übernächste Fenster geholt und über die folgenden 256 Ticks
+in Portionen einsortiert. So kostet kein einzelner Tick das Umverteilen eines
+ganzen Fachs. Ebene 0 ist dafür nach absoluter Minute geschlüsselt und hält
+bis zu zwei Fenster.
+
+Termine jenseits der obersten Ebene (über 30 Jahre Spielzeit) liegen in einem
+Heap und werden bei Bedarf nachgeschoben.
+"""
+import heapq
+from itertools import count
+from typing import Dict, Generic, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Bits je Ebene: 256 Fächer unten, darüber je 64
+EBENEN_BITS = (8, 6, 6, 6)
+_SHIFTS = tuple(sum(EBENEN_BITS[:i]) for i in range(len(EBENEN_BITS)))
+_MASKEN = tuple((1 << b) - 1 for b in EBENEN_BITS)
+# Spanne (in Minuten), die Ebene i ab "jetzt" abdeckt
+_SPANNEN = tuple(1 << (s + b) for s, b in zip(_SHIFTS, EBENEN_BITS))
+
+
+class Zeitrad(Generic[T]):
+    """
+    Termine (zeit, obj) mit ganzzahliger Zeit. tick() rückt um eine Minute vor
+    und gibt die dann fälligen Objekte zurück (in Einplan-Reihenfolge je Fach).
+    """
+    def __init__(self, jetzt: int = 0):
+        self.jetzt = jetzt
+        # Je Ebene nur die belegten Fächer (Fachnummer -> Termine); ein leeres Rad kostet fast nichts.
+        # In Ebene 0 (Minute -> Objekte) ist alles in einem Fach zur selben Minute fällig: dort liegen
+        # nur die Objekte. Darüber je Fach zwei parallele Listen (Zeiten, Objekte) statt eines
+        # (zeit, obj)-Tupels je Termin – sonst müsste der GC zehntausende junge Tupel durchsuchen.
+        self._unten: Dict[int, List[T]] = {}
+        self._faecher: List[Dict[int, Tuple[List[int], List[T]]]] = [{} for _ in _MASKEN]  # [0] bleibt leer
+        self._spaeter: List[Tuple[int, int, T]] = []
+        self._nummer = count()
+        self._anzahl = 0
+        # Termine vor _grenze gehören nach Ebene 0; die höheren Ebenen rechnen ab _basis (ein Fenster davor)
+        self._basis = ((jetzt >> _SHIFTS[1]) + 1) << _SHIFTS[1]
+        self._grenze = self._basis + _SPANNEN[0]
+        # Bei der letzten Fenstergrenze geholte Termine, ab _rest_pos noch nicht einsortiert
+        self._rest_zeiten: List[int] = []
+        self._rest_objekte: List[T] = []
+        self._rest_pos = 0
+        self._portion = 0
+        # Statistik: wie viele Einträge bisher eine Ebene tiefer verteilt wurden
+        self.kaskadiert = 0
+
+    def __len__(self):
+        return self._anzahl
+
+    def planen(self, zeit: int, obj: T):
+        """obj zur Minute zeit fällig machen (frühestens in der nächsten Minute)."""
+        if zeit <= self.jetzt:
+            zeit = self.jetzt + 1
+        self._anzahl += 1
+        self._einsortieren(zeit, obj)
+
+    def _einsortieren(self, zeit: int, obj: T):
+        if zeit < self._grenze:
+            termine = self._unten.get(zeit)
+            if termine is None:
+                self._unten[zeit] = [obj]
+            else:
+                termine.append(obj)
+            return
+        abstand = zeit - self._basis
+        for ebene in range(1, len(_SPANNEN)):
+            if abstand < _SPANNEN[ebene]:
+                fach = (zeit >> _SHIFTS[ebene]) & _MASKEN[ebene]
+                termine = self._faecher[ebene].get(fach)
+                if termine is None:
+                    self._faecher[ebene][fach] = ([zeit], [obj])
+                else:
+                    termine[0].append(zeit)
+                    termine[1].append(obj)
+                return
+        heapq.heappush(self._spaeter, (zeit, next(self._nummer), obj))
+
+    def tick(self) -> List[T]:
+        """Eine Minute weiter; die jetzt fälligen Objekte."""
+        jetzt = self.jetzt = self.jetzt + 1
+        if not jetzt & _MASKEN[0]:
+            self._kaskade()
+        if self._rest_pos < len(self._rest_zeiten):
+            self._rest_einsortieren(self._rest_pos + self._portion)
+        fach = self._unten.pop(jetzt, None)
+        if fach is None:
+            return []
+        self._anzahl -= len(fach)
+        return fach
+
+    def _rest_einsortieren(self, bis: int):
+        zeiten, objekte = self._rest_zeiten, self._rest_objekte
+        bis = min(bis, len(zeiten))
+        for i in range(self._rest_pos, bis):
+            self._einsortieren(zeiten[i], objekte[i])
+        self._rest_pos = bis
+        if bis == len(zeiten):
+            zeiten.clear()
+            objekte.clear()
+            self._rest_pos = 0
+
+    def _kaskade(self):
+        """Fenstergrenze: Rest des laufenden Fensters einsortieren, Fächer fürs übernächste holen."""
+        self._rest_einsortieren(len(self._rest_zeiten))
+        zeiten, objekte = self._rest_zeiten, self._rest_objekte
+        basis = self._basis = self._basis + _SPANNEN[0]
+        self._grenze = basis + _SPANNEN[0]
+        for ebene in range(1, len(_SHIFTS)):
+            index = (basis >> _SHIFTS[ebene]) & _MASKEN[ebene]
+            fach = self._faecher[ebene].pop(index, None)
+            if fach is not None:
+                self.kaskadiert += len(fach[0])
+                zeiten.extend(fach[0])
+                objekte.extend(fach[1])
+            if index:
+                break
+        else:
+            # Oberste Ebene ist einmal herum: was jetzt in Reichweite ist, aus dem Heap holen
+            spaeter = self._spaeter
+            while spaeter and spaeter[0][0] - basis < _SPANNEN[-1]:
+                zeit, _, obj = heapq.heappop(spaeter)
+                zeiten.append(zeit)
+                objekte.append(obj)
+        # Bis zur nächsten Grenze (eingeschlossen dieser Tick) ist alles einsortiert
+        self._portion = -(-len(zeiten) // _SPANNEN[0])
@@ -0,0 +1,6 @@
+# conftest.py
+# Die Module liegen flach in src/ und importieren sich gegenseitig ohne Paket-Präfix
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -0,0 +1,35 @@
+# test_kompakt.py
+from collections import deque
+
+from kompakt import LEER
+from person import DIALOG_HISTORY_MAX, Person
+from raum import Raum
+
+
+def test_gehaltene_sicht_behaelt_eintraege():
+    raum = Raum("Flur", ".")
+    g = raum.gegenstaende
+    g.append("x")
+    g.append("y")
+    assert raum.gegenstaende == ["x", "y"]
+    assert list(g) == ["x", "y"] and len(g) == 2 and "x" in g
+
+
+def test_gehaltene_sicht_auf_deque():
+    person = Person("Anna", "NPC", ".")
+    h = person.dialog_history
+    h.append("ja")
+    h.append("nein")
+    history = person.dialog_history
+    assert isinstance(history, deque) and history.maxlen == DIALOG_HISTORY_MAX
+    assert list(history) == ["ja", "nein"]
+    for i in range(DIALOG_HISTORY_MAX + 5):
+        h.append(str(i))
+    assert person.dialog_history is history and len(history) == DIALOG_HISTORY_MAX
+
+
+def test_leer_bleibt_geteilt_bis_zur_ersten_aenderung():
+    raum = Raum("Flur", ".")
+    assert raum._verbindungen is LEER and raum.verbindungen == [] and not raum.verbindungen
+    raum.verbindungen.extend([])
+    assert raum._verbindungen is LEER
@@ -0,0 +1,37 @@
+# test_navigation.py
+import random
+
+from navigation import Navigator
+from welt import Welt
+
+
+def zufalls_welt(raeume: int, rng: random.Random) -> dict:
+    keys = [f"r{i}" for i in range(raeume)]
+    verbindungen = {k: set() for k in keys}
+    for _ in range(raeume * 2):
+        a, b = rng.sample(keys, 2)
+        verbindungen[a].add(b)
+        verbindungen[b].add(a)
+    return {"start": keys[0], "personen": {},
+            "raeume": {k: {"name": k, "beschreibung": ".", "verbindungen": sorted(v)}
+                       for k, v in verbindungen.items()}}
+
+
+def test_gecachte_wege_gleichen_frisch_berechneten():
+    rng = random.Random(3)
+    for _ in range(20):
+        daten = zufalls_welt(12, rng)
+        welt = Welt(daten)
+        navigation = Navigator(welt)
+        navigation.warm()
+        keys = list(welt.adjazenz)
+        for _ in range(15):
+            von, nach = rng.sample(keys, 2)
+            if nach in welt.adjazenz[von]:
+                welt.trennen(von, nach)
+            else:
+                welt.verbinden(von, nach)
+            frisch = Navigator(welt)
+            for a in keys:
+                for b in keys:
+                    assert navigation.route(a, b) == frisch.route(a, b)
@@ -0,0 +1,18 @@
+# test_simulation.py
+import random
+
+from engine import Engine
+from simulation import WAIT, random_action, run_session
+from welt import Welt
+
+SACKGASSE = {
+    "start": "abstellraum",
+    "personen": {},
+    "raeume": {"abstellraum": {"name": "Abstellraum", "beschreibung": "Kein Ausgang, niemand da."}},
+}
+
+
+def test_sackgasse_wartet_statt_abzustuerzen():
+    assert random_action(Engine(Welt(SACKGASSE)), random.Random(0)) == WAIT
+    stats = run_session(0, 20, daten=SACKGASSE)
+    assert stats["waits"] == 20 and stats["failed_actions"] == 0 and stats["moves"] == 0
@@ -0,0 +1,54 @@
+# test_spielstand.py
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import spielstand
+from engine import Engine
+from simulation import welt_daten
+from welt import Welt
+
+
+def test_engine_tausch_ersetzt_spielstand(tmp_path):
+    import pygame_game
+
+    ordner = str(tmp_path / "spielstand")
+    app = pygame_game.GameApp(spielstand_ordner=ordner)
+    try:
+        # Alte Engine: Zustand, der nach dem Tausch nicht mehr gelten darf
+        app.engine.move("büro")
+        app.engine.talk(app.engine.aktueller_raum.personen[0])
+        app.engine.answer("ja")
+        app.autosaver.tick()
+
+        neu = Engine(Welt(welt_daten()))
+        app.engine_setzen(neu)
+        neu.move("post")
+        neu.move("flur")
+    finally:
+        app.autosaver.close()
+    assert spielstand.snapshot_erstellen(spielstand.laden(ordner)) == spielstand.snapshot_erstellen(neu)
+
+
+def test_absturz_vor_dem_leeren_der_deltas_wendet_nichts_doppelt_an(tmp_path, monkeypatch):
+    ordner = str(tmp_path / "spielstand")
+    engine = Engine(Welt(welt_daten()))
+    saver = spielstand.Autosaver(engine, ordner)
+    engine.move("büro")
+    engine.talk(engine.aktueller_raum.personen[0])
+    engine.answer("ja")
+    saver.tick()
+    saver._queue.put(None)
+    saver._thread.join()
+    erwartet = spielstand.snapshot_erstellen(engine)
+
+    def absturz(_ordner):
+        raise OSError("Absturz")
+
+    # Snapshot ist schon ersetzt, die Deltas liegen noch daneben
+    monkeypatch.setattr(spielstand, "_deltas_leeren", absturz)
+    try:
+        spielstand.kompaktieren(ordner)
+    except OSError:
+        pass
+    assert spielstand.snapshot_erstellen(spielstand.laden(ordner)) == erwartet
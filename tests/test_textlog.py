@@ -0,0 +1,32 @@
+# test_textlog.py
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import pygame_game as pg
+
+
+def test_umbruch_erst_beim_zeichnen_und_nur_sichtbar():
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((640, 480))
+    log = pg.TextLog(pygame.Rect(0, 0, 300, 200), max_lines=4)
+    for i in range(100):
+        log.add(f"Meldung {i}: " + "sehr lange Zeile " * 5)
+    assert all(log._entry(i)[1] == 0 for i in range(len(log)))
+    log.draw(screen)
+    umgebrochen = [i for i in range(len(log)) if log._entry(i)[1]]
+    assert umgebrochen and len(umgebrochen) <= 4 and umgebrochen[-1] == len(log) - 1
+
+    # Scrollen zählt Bildschirmzeilen und hört bei der ältesten Meldung auf
+    log.scroll(10_000)
+    log.draw(screen)
+    alle = sum(len(log._zeilen(log._entry(i))) for i in range(len(log)))
+    assert log.scroll_offset == alle - 4
+
+    # Neue Breite: neu umbrechen statt alte Zeilen weiterzuverwenden
+    schmal = len(log._zeilen(log._entry(99)))
+    log.rect = pygame.Rect(0, 0, 600, 200)
+    assert len(log._zeilen(log._entry(99))) < schmal
@@ -0,0 +1,34 @@
+# test_zeitrad.py
+import random
+from collections import defaultdict
+
+from zeitrad import Zeitrad
+
+
+def test_termine_werden_genau_zur_faelligen_minute_geliefert():
+    rng = random.Random(1)
+    for start in (0, 255, 256, 16_380, (1 << 20) - 7):
+        rad: Zeitrad[int] = Zeitrad(start)
+        erwartet = defaultdict(list)
+        nummer = 0
+        for minute in range(start + 1, start + 4000):
+            for _ in range(rng.randint(0, 4)):
+                zeit = minute + rng.choice((0, 1, 30, 255, 256, 257, 600, 20_000))
+                rad.planen(zeit, nummer)
+                erwartet[zeit].append(nummer)
+                nummer += 1
+            assert sorted(rad.tick()) == sorted(erwartet.pop(minute, []))
+
+
+def test_kaskade_verteilt_sich_ueber_die_ticks():
+    rad: Zeitrad[int] = Zeitrad()
+    for i in range(256 * 100):
+        rad.planen(512 + i % 256, i)
+    for _ in range(255):
+        rad.tick()
+    # Ab der Fenstergrenze (Minute 256) wird das Fach in Portionen zu 100 einsortiert, nicht auf einmal
+    for _ in range(255):
+        rad.tick()
+        assert rad._rest_pos == 100 * (rad.jetzt - 255)
+    rad.tick()
+    assert not rad._rest_zeiten and rad.kaskadiert == 256 * 100